@@ -299,6 +299,29 @@ class FinanceJsonCodecTest {
         assertTrue(store.document.value.transactions.any { it.exportId == "desktop-change" })
     }
 
+    @Test
+    fun parsingCompactDesktopOutputMatchesIndentedFile() {
+        // The desktop app saves compact JSON by default; only whitespace differs from pretty files
+        val compact = Json.parseToJsonElement(budgetSettingsJson).toString()
+        assertFalse(compact.contains("\n"))
+
+        val fromCompact = FinanceJsonCodec.parse(compact)
+        val fromIndented = FinanceJsonCodec.parse(budgetSettingsJson)
+
+        assertEquals(fromIndented.budgetSettings, fromCompact.budgetSettings)
+        assertEquals(FinanceJsonCodec.encode(fromIndented), FinanceJsonCodec.encode(fromCompact))
+    }
+
+    @Test
+    fun parsingCompactDesktopOutputReadsUnescapedUnicode() {
+        val document = FinanceJsonCodec.parse(
+            """{"expenses":[{"id":"01JXQ4Z8KX3M7V2B9Q6T1C5D8E","date":"2026-06-10","amount":3.5,"category":"Food","description":"Café crème"}],"incomes":[]}""",
+        )
+
+        assertEquals("Café crème", document.transactions.single().description)
+        assertEquals("01JXQ4Z8KX3M7V2B9Q6T1C5D8E", document.transactions.single().exportId)
+    }
+
     private val sampleJson = """
         {
           "expenses": [
@@ -0,0 +1,225 @@
+"""
+benchmarks/generate_data.py
+
+Synthetic finance_data.json generator for the benchmark suite. Produces files
+with the same schema AppState.save() writes (see shared/finance_data_schema.md):
+expenses and incomes spread over a number of years, dated income sources and
+fixed costs, monthly asset snapshots and savings goals. Output is deterministic
+for a given seed and end date.
+
+    python -m benchmarks.generate_data --rows 100000 -o /tmp/finance_data.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from finance_tracker.ids import ulid_at
+from finance_tracker.json_codec import write_json_file
+
+PAYEES = [
+    "REWE", "EDEKA", "Lidl", "ALDI", "dm Drogerie", "Rossmann", "Amazon", "PayPal", "Deutsche Bahn",
+    "BVG", "Uber", "Spotify", "Netflix", "Vodafone", "Telekom", "Apotheke", "Restaurant Roma",
+    "Cafe Central", "Kino", "Zalando", "IKEA", "MediaMarkt", "Shell", "Aral", "Pizza Express",
+]
+INCOME_PAYEES = ["Employer GmbH", "Freelance Client", "Tax Refund", "Dividends", "Friends", "eBay Sale"]
+EXTRA_EXPENSE_CATEGORIES = [
+    "Groceries", "Rent", "Insurance", "Education", "Travel", "Gifts", "Pets", "Sports",
+    "Subscriptions", "Household", "Clothing", "Electronics", "Beauty", "Charity", "Fees", "Kids",
+]
+
+
+@dataclass
+class DatasetSpec:
+    """Shape of a synthetic dataset; rows (when set) overrides transactions_per_day."""
+    years: float = 3.0
+    transactions_per_day: float = 5.0
+    rows: int | None = None
+    expense_categories: int = 10
+    income_share: float = 0.05        # fraction of rows that are incomes
+    fixed_costs: int = 8
+    income_sources: int = 2
+    snapshots_per_month: int = 1
+    goals: int = 5
+    bnpl_share: float = 0.02          # fraction of expenses with a behavior_date
+    end_date: date | None = None
+    seed: int = 0
+
+    def total_rows(self) -> int:
+        if self.rows is not None:
+            return self.rows
+        return int(round(self.years * 365.25 * self.transactions_per_day))
+
+
+def _expense_categories(count: int) -> list[str]:
+    defaults = ["Food", "Transportation", "Entertainment", "Utilities", "Shopping", "Healthcare",
+                "Money Lent", "Other"]
+    names = defaults + EXTRA_EXPENSE_CATEGORIES
+    return names[:max(count, 1)] if count <= len(names) else names + [f"Category {i}" for i in range(len(names), count)]
+
+
+def _month_starts(start: date, end: date) -> list[date]:
+    months = []
+    current = start.replace(day=1)
+    while current <= end:
+        months.append(current)
+        current = (current + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def _transactions(rng: np.random.Generator, count: int, start: date, days: int, categories: list[str],
+                  payees: list[str], amount_scale: float, bnpl_share: float) -> list[dict]:
+    if count <= 0:
+        return []
+    offsets = np.sort(rng.integers(0, days, size=count))
+    day_strings = (np.datetime64(start, "D") + offsets).astype(str).tolist()
+    # Log-normal amounts: many small purchases, a few large ones
+    amounts = np.round(rng.lognormal(np.log(amount_scale), 0.9, size=count), 2).tolist()
+    # Skewed category popularity, like real spending
+    weights = 1.0 / np.arange(1, len(categories) + 1)
+    category_index = rng.choice(len(categories), size=count, p=weights / weights.sum()).tolist()
+    payee_index = rng.integers(0, len(payees), size=count).tolist()
+    base_ms = int(np.datetime64(start, "ms").astype(np.int64)) + 12 * 3_600_000
+    ids = [ulid_at(base_ms + int(offset) * 86_400_000) for offset in offsets.tolist()]
+    bnpl = (rng.random(count) < bnpl_share).tolist()
+
+    rows = []
+    for i in range(count):
+        row = {
+            "id": ids[i],
+            "date": day_strings[i],
+            "amount": amounts[i],
+            "category": categories[category_index[i]],
+            "description": f"{payees[payee_index[i]]} #{i % 997}",
+        }
+        if bnpl[i]:
+            spent = date.fromisoformat(day_strings[i])
+            row["behavior_date"] = row["date"]
+            row["date"] = (spent.replace(day=1) + timedelta(days=32)).replace(day=1).isoformat()
+        rows.append(row)
+    return rows
+
+
+def generate_dataset(spec: DatasetSpec) -> dict:
+    """Build the finance_data.json object described by spec."""
+    rng = np.random.default_rng(spec.seed)
+    end = spec.end_date or date.today()
+    days = max(int(round(spec.years * 365.25)), 1)
+    start = end - timedelta(days=days - 1)
+    months = _month_starts(start, end)
+
+    total = spec.total_rows()
+    income_count = int(round(total * spec.income_share))
+    expense_categories = _expense_categories(spec.expense_categories)
+    income_categories = ["Salary", "Side Gig", "Bonus", "Gift", "Investment", "Other"]
+
+    expenses = _transactions(rng, total - income_count, start, days, expense_categories, PAYEES,
+                             18.0, spec.bnpl_share)
+    incomes = _transactions(rng, income_count, start, days, income_categories, INCOME_PAYEES, 120.0, 0.0)
+
+    income_sources = [{
+        "amount": float(round(rng.uniform(1500, 3500), 2)),
+        "description": "Salary" if i == 0 else f"Income source {i + 1}",
+        "start_date": start.replace(day=1).isoformat(),
+        "end_date": None,
+    } for i in range(spec.income_sources)]
+    fixed_costs = []
+    for i in range(spec.fixed_costs):
+        begin = months[int(rng.integers(0, max(len(months) // 2, 1)))]
+        ended = rng.random() < 0.25
+        fixed_costs.append({
+            "desc": f"Fixed cost {i + 1}" if i else "Rent",
+            "amount": float(round(rng.uniform(600, 1100) if i == 0 else rng.uniform(5, 120), 2)),
+            "start_date": begin.isoformat(),
+            "end_date": (begin + timedelta(days=365)).isoformat() if ended else None,
+        })
+
+    snapshots = []
+    balance = {"bank_balance": 2000.0, "wallet_balance": 100.0, "savings_balance": 5000.0,
+               "investment_balance": 3000.0, "money_lent_balance": 0.0}
+    for month in months:
+        for k in range(spec.snapshots_per_month):
+            day = min(month + timedelta(days=int(28 * (k + 1) / spec.snapshots_per_month) - 1), end)
+            for key in ("bank_balance", "savings_balance", "investment_balance"):
+                balance[key] = round(balance[key] * (1 + rng.normal(0.005, 0.02)) + rng.normal(50, 100), 2)
+            snapshots.append({"date": day.isoformat(), **balance, "note": "",
+                              "net_worth": round(sum(balance.values()), 2)})
+
+    goals = []
+    for i in range(spec.goals):
+        created = months[int(rng.integers(0, len(months)))]
+        target = float(round(rng.uniform(500, 20000), -1))
+        goals.append({
+            "id": f"goal-{i + 1}",
+            "name": f"Goal {i + 1}",
+            "description": "",
+            "target_amount": target,
+            "allocated_amount": float(round(target * rng.uniform(0, 0.8), 2)),
+            "priority": ("High", "Medium", "Low")[i % 3],
+            "target_date": (end + timedelta(days=int(rng.integers(60, 1500)))).isoformat() if i % 4 else None,
+            "created_date": created.isoformat(),
+            "completion_date": None,
+        })
+
+    latest = snapshots[-1] if snapshots else balance
+    budgets = {name: round(100 / len(expense_categories), 2) for name in expense_categories}
+    return {
+        "expenses": expenses,
+        "incomes": incomes,
+        "budget_settings": {
+            "fixed_costs": fixed_costs,
+            "monthly_income": income_sources,
+            "bank_account_balance": latest["bank_balance"],
+            "wallet_balance": latest["wallet_balance"],
+            "savings_balance": latest["savings_balance"],
+            "investment_balance": latest["investment_balance"],
+            "money_lent_balance": 0,
+            "daily_savings_goal": 10,
+            "category_budgets": {"Expense": budgets, "Income": {}},
+            "loans": [],
+            "ai_settings": {"api_key": ""},
+            "asset_snapshots": snapshots,
+            "savings_goals": goals,
+        },
+        "categories": {"Expense": expense_categories, "Income": income_categories},
+    }
+
+
+def write_dataset(spec: DatasetSpec, path: str | Path, pretty: bool = False) -> Path:
+    """Write the dataset compact, as AppState.save does by default (pretty: indented)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_file(path, generate_dataset(spec), pretty=pretty)
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic finance_data.json file.")
+    parser.add_argument("-o", "--output", default="finance_data.json")
+    parser.add_argument("--rows", type=int, help="total transactions (overrides --per-day)")
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument("--per-day", type=float, default=5.0, help="transactions per day")
+    parser.add_argument("--categories", type=int, default=10, help="number of expense categories")
+    parser.add_argument("--fixed-costs", type=int, default=8)
+    parser.add_argument("--snapshots-per-month", type=int, default=1)
+    parser.add_argument("--goals", type=int, default=5)
+    parser.add_argument("--end-date", type=date.fromisoformat, help="last day of data (default: today)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pretty", action="store_true", help="indent the output (default: compact)")
+    args = parser.parse_args(argv)
+
+    spec = DatasetSpec(years=args.years, transactions_per_day=args.per_day, rows=args.rows,
+                       expense_categories=args.categories, fixed_costs=args.fixed_costs,
+                       snapshots_per_month=args.snapshots_per_month, goals=args.goals,
+                       end_date=args.end_date, seed=args.seed)
+    path = write_dataset(spec, args.output, args.pretty)
+    print(f"Wrote {spec.total_rows():,} transactions to {path}")
+
+
+if __name__ == "__main__":
+    main()
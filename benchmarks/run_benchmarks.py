@@ -0,0 +1,416 @@
+"""
+benchmarks/run_benchmarks.py
+
+Times the data layer, report services, reconciliation, the transaction search
+index and chart builders on synthetic datasets of increasing size and writes the
+results as JSON, so a run can be compared against an earlier one:
+
+    python -m benchmarks.run_benchmarks                      # 1k, 10k, 100k, 1M rows
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 --filter report
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/baseline.json
+
+Each benchmark is repeated until it has run for --min-time seconds (at least
+three runs, at most --max-runs) and reports the minimum and median. Once a
+benchmark takes longer than --budget seconds per run it is skipped at the larger
+sizes, so the O(n * m) reconciliation benchmarks do not dominate a full run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.generate_data import PAYEES, DatasetSpec, write_dataset
+from finance_tracker.json_codec import available_codecs, get_codec
+from finance_tracker.state import AppState
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR / "data"
+RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# Fixed end date so cached datasets and results stay comparable between runs
+DATASET_END = date(2026, 6, 30)
+DATASET_YEARS = 5.0
+BANK_ROWS = 50
+REGRESSION_THRESHOLD = 1.25
+LATEST_MONTH = DATASET_END.strftime("%Y-%m")
+
+
+class Benchmark:
+    """
+    A named callable; setup(state, workdir) returns the zero-argument function to
+    time, or (function, bytes processed per call) to also report throughput.
+    """
+
+    def __init__(self, name: str, setup: Callable[[AppState, Path], Callable[[], object]]):
+        self.name = name
+        self.setup = setup
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+def _bench_load(state, workdir):
+    return (lambda: AppState(state.data_file)), state.data_file.stat().st_size
+
+
+def _bench_save(state, workdir):
+    copy = AppState.__new__(AppState)
+    copy.__dict__.update(state.__dict__)
+    copy.data_file = workdir / "save_target.json"
+    copy.save()
+    return copy.save, copy.data_file.stat().st_size
+
+
+def _document(state) -> dict:
+    return {"expenses": state.expenses, "incomes": state.incomes,
+            "budget_settings": state.budget_settings, "categories": state.categories}
+
+
+def _codec_loads(name):
+    def setup(state, workdir):
+        codec = get_codec(name)
+        data = state.data_file.read_bytes()
+        return (lambda: codec.loads(data)), len(data)
+    return setup
+
+
+def _codec_dumps(name, pretty=False):
+    def setup(state, workdir):
+        codec = get_codec(name)
+        document = _document(state)
+        return (lambda: codec.dumps(document, pretty)), len(codec.dumps(document, pretty))
+    return setup
+
+
+def _report(name, call):
+    def setup(state, workdir):
+        from finance_tracker.services import report_builder
+        function = getattr(report_builder, name)
+        return lambda: call(function, state)
+    return setup
+
+
+def _bench_daily_budget(state, workdir):
+    from finance_tracker.services.budget_calculator import generate_daily_budget_report
+    return lambda: generate_daily_budget_report(state, LATEST_MONTH, True)
+
+
+def _bank_csv(state, workdir) -> Path:
+    """A Sparkasse-style export: half copies of recorded expenses, half unknown payments."""
+    rng = np.random.default_rng(1)
+    recent = [t for t in state.expenses[-BANK_ROWS * 4:]]
+    picks = rng.choice(len(recent), size=min(BANK_ROWS // 2, len(recent)), replace=False)
+    lines = ["Buchungstag;Buchungstext;Verwendungszweck;Beguenstigter/Zahlungspflichtiger;Betrag;Waehrung"]
+    for i in picks.tolist():
+        t = recent[i]
+        day = datetime.strptime(t["date"], "%Y-%m-%d").strftime("%d.%m.%y")
+        amount = f"-{t['amount']:.2f}".replace(".", ",")
+        lines.append(f"{day};KARTENZAHLUNG;{t['description']};{t['description'].split(' #')[0]};{amount};EUR")
+    for i in range(BANK_ROWS - len(picks)):
+        amount = f"-{rng.uniform(1, 300):.2f}".replace(".", ",")
+        lines.append(f"{DATASET_END.strftime('%d.%m.%y')};LASTSCHRIFT;Invoice {i};{PAYEES[i % len(PAYEES)]};"
+                     f"{amount};EUR")
+    path = workdir / "bank_export.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _bench_match(state, workdir):
+    from finance_tracker.services.reconciliation_service import match_transactions, parse_bank_csv
+    txns, _meta = parse_bank_csv(str(_bank_csv(state, workdir)))
+    return lambda: match_transactions(txns, state)
+
+
+def _bench_suggest(state, workdir):
+    from finance_tracker.services.reconciliation_service import suggest_category
+    return lambda: [suggest_category(payee, "", "Expense", state) for payee in PAYEES]
+
+
+def _search_index(state):
+    from finance_tracker.services.search_index import TransactionSearchIndex
+    return TransactionSearchIndex(lambda: state.expenses + state.incomes)
+
+
+def _bench_search_build(state, workdir):
+    index = _search_index(state)
+
+    def build():
+        index.invalidate()
+        return index.search("description", PAYEES[0])
+    return build
+
+
+def _bench_search_query(state, workdir):
+    index = _search_index(state)
+    queries = [payee[1:5].lower() for payee in PAYEES] + ["a", "ma"]
+    return lambda: ([index.search("description", q) for q in queries],
+                    [index.search_prefix("description", q) for q in queries])
+
+
+def _bench_search_update(state, workdir):
+    """Re-index the most recent 100 records after an edit, as the transaction view does."""
+    index = _search_index(state)
+    index.search("description", "")
+    recent = state.expenses[-100:]
+
+    def update():
+        for record in recent:
+            index.remove(record)
+            index.add(record)
+    return update
+
+
+def _bench_search_suggest(state, workdir):
+    index = _search_index(state)
+    return lambda: [index.suggest("description", payee[:3]) for payee in PAYEES]
+
+
+def _render(figure) -> None:
+    if figure is not None:
+        figure.savefig(io.BytesIO(), format="png", dpi=80)
+        figure.clear()
+
+
+def _chart(build):
+    def setup(state, workdir):
+        from finance_tracker.ui import charts
+        return lambda: _render(build(charts, state))
+    return setup
+
+
+def _snapshot_chart(charts, state, kind):
+    from finance_tracker.services.asset_tracking_service import get_asset_snapshots
+    snapshots = get_asset_snapshots(state)
+    if kind == "breakdown":
+        return charts.create_breakdown_figure(snapshots)
+    from finance_tracker.services.net_worth_history import reconstruct_net_worth
+    return charts.create_net_worth_figure(snapshots, reconstruct_net_worth(state, DATASET_END))
+
+
+def _history_bar(charts, state):
+    from finance_tracker.services.report_builder import history_data
+    title, labels, values = history_data(state, 12, "Expense", True, True)
+    return charts.create_bar_figure(labels, values, title)
+
+
+def _category_pie(charts, state):
+    from finance_tracker.services.report_builder import pie_data_range
+    title, totals = pie_data_range(state, "2025-07", "2026-06", "Expense", True, True)
+    return charts.create_pie_figure(list(totals), list(totals.values()), title)
+
+
+def _category_line(charts, state):
+    from finance_tracker.services.report_builder import line_expense_category_range
+    title, months, series = line_expense_category_range(state, "2025-07", "2026-06",
+                                                        state.categories["Expense"])
+    return charts.create_line_figure(months, series, title)
+
+
+def _cash_flow(charts, state):
+    from finance_tracker.services.cash_flow_service import project_cash_flow
+    return charts.create_cash_flow_figure(project_cash_flow(state, 6))
+
+
+def _allocation(charts, state):
+    bs = state.budget_settings
+    positive = {name: bs.get(key, 0) for name, key in (("Bank Account", "bank_account_balance"),
+                                                       ("Savings", "savings_balance"),
+                                                       ("Investments", "investment_balance"))}
+    return charts.create_allocation_figure(positive, {}, sum(positive.values()))
+
+
+BENCHMARKS = [
+    Benchmark("state.load", _bench_load),
+    Benchmark("state.save", _bench_save),
+    *[Benchmark(f"codec.loads[{name}]", _codec_loads(name)) for name in available_codecs()],
+    *[Benchmark(f"codec.dumps[{name}]", _codec_dumps(name)) for name in available_codecs()],
+    Benchmark("codec.dumps_pretty[json]", _codec_dumps("json", pretty=True)),
+    Benchmark("report.pie_data", _report("pie_data", lambda f, s: f(s, LATEST_MONTH, "Expense", True, True))),
+    Benchmark("report.pie_data_range",
+              _report("pie_data_range", lambda f, s: f(s, "2024-07", "2026-06", "Expense", True, True))),
+    Benchmark("report.history_data", _report("history_data", lambda f, s: f(s, 24, "Expense", True, True))),
+    Benchmark("report.line_expense_category_range",
+              _report("line_expense_category_range",
+                      lambda f, s: f(s, "2024-07", "2026-06", s.categories["Expense"]))),
+    Benchmark("budget.daily_report", _bench_daily_budget),
+    Benchmark("reconcile.match_transactions", _bench_match),
+    Benchmark("reconcile.suggest_category", _bench_suggest),
+    Benchmark("search.build", _bench_search_build),
+    Benchmark("search.query", _bench_search_query),
+    Benchmark("search.update", _bench_search_update),
+    Benchmark("search.suggest", _bench_search_suggest),
+    Benchmark("chart.budget_depletion",
+              _chart(lambda c, s: c.create_budget_depletion_figure(s, LATEST_MONTH, True))),
+    Benchmark("chart.spending_pace", _chart(lambda c, s: c.create_spending_pace_figure(s, LATEST_MONTH))),
+    Benchmark("chart.dow_heatmap", _chart(lambda c, s: c.create_dow_heatmap_figure(s, 3))),
+    Benchmark("chart.history_bar", _chart(_history_bar)),
+    Benchmark("chart.category_pie", _chart(_category_pie)),
+    Benchmark("chart.category_line", _chart(_category_line)),
+    Benchmark("chart.net_worth", _chart(lambda c, s: _snapshot_chart(c, s, "net_worth"))),
+    Benchmark("chart.breakdown", _chart(lambda c, s: _snapshot_chart(c, s, "breakdown"))),
+    Benchmark("chart.allocation", _chart(_allocation)),
+    Benchmark("chart.cash_flow", _chart(_cash_flow)),
+]
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+def dataset_path(rows: int, seed: int = 0) -> Path:
+    """Generate (once) and return the cached dataset with the given number of rows."""
+    path = DATA_DIR / f"finance_data_{rows}_s{seed}.json"
+    if not path.exists():
+        spec = DatasetSpec(rows=rows, years=DATASET_YEARS, expense_categories=12,
+                           end_date=DATASET_END, seed=seed)
+        write_dataset(spec, path)
+    return path
+
+
+def measure(function: Callable[[], object], min_time: float, max_runs: int) -> list[float]:
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_runs:
+        t0 = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - t0)
+        if len(timings) >= 3 and time.perf_counter() - started >= min_time:
+            break
+    return timings
+
+
+def run(sizes, selected, min_time: float, max_runs: int, budget: float, verbose: bool = True) -> list[dict]:
+    results = []
+    too_slow: set[str] = set()
+    for rows in sizes:
+        path = dataset_path(rows)
+        state = AppState(path)
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            for bench in selected:
+                if bench.name in too_slow:
+                    results.append({"name": bench.name, "rows": rows, "skipped": "over time budget"})
+                    continue
+                function = bench.setup(state, workdir)
+                nbytes = None
+                if isinstance(function, tuple):
+                    function, nbytes = function
+                function()  # warm-up: imports, lazy caches
+                timings = measure(function, min_time, max_runs if rows < 1_000_000 else min(max_runs, 3))
+                entry = {"name": bench.name, "rows": rows, "runs": len(timings),
+                         "min_s": min(timings), "median_s": statistics.median(timings)}
+                if nbytes:
+                    entry["bytes"] = nbytes
+                    entry["mb_per_s"] = nbytes / 1e6 / entry["min_s"]
+                results.append(entry)
+                if entry["median_s"] > budget:
+                    too_slow.add(bench.name)
+                if verbose:
+                    throughput = f"  {entry['mb_per_s']:>7.1f} MB/s" if nbytes else ""
+                    print(f"{bench.name:<36} {rows:>9,} rows  min {entry['min_s'] * 1000:>10.2f} ms  "
+                          f"median {entry['median_s'] * 1000:>10.2f} ms  ({len(timings)} runs){throughput}",
+                          flush=True)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _metadata() -> dict:
+    import matplotlib
+    try:
+        import orjson
+        orjson_version = orjson.__version__
+    except ImportError:
+        orjson_version = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "orjson": orjson_version,
+        "json_codec": get_codec().name,
+    }
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Print current/baseline ratios; return the names of benchmarks slower than threshold."""
+    previous = {(r["name"], r["rows"]): r for r in baseline.get("results", []) if "min_s" in r}
+    regressions = []
+    print(f"\nCompared with {baseline.get('meta', {}).get('git_commit') or 'baseline'} (min times):")
+    for r in results:
+        old = previous.get((r["name"], r["rows"]))
+        if old is None or "min_s" not in r:
+            continue
+        ratio = r["min_s"] / old["min_s"] if old["min_s"] > 0 else float("inf")
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{r['name']:<36} {r['rows']:>9,} rows  {old['min_s'] * 1000:>10.2f} -> "
+              f"{r['min_s'] * 1000:>10.2f} ms  x{ratio:.2f}{flag}")
+        if flag:
+            regressions.append(f"{r['name']}@{r['rows']}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Finance Tracker benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="transaction counts to benchmark (default: 1k 10k 100k 1M)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to repeat each benchmark for")
+    parser.add_argument("--max-runs", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=10.0,
+                        help="skip a benchmark at larger sizes once one run takes longer than this (seconds)")
+    parser.add_argument("-o", "--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: 1.25)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 2 if any benchmark regressed")
+    parser.add_argument("--clean", action="store_true", help="delete cached datasets first")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if args.filter in b.name]
+    if not selected:
+        parser.error(f"no benchmark matches '{args.filter}'")
+    if args.clean and DATA_DIR.exists():
+        shutil.rmtree(DATA_DIR)
+
+    results = run(sorted(args.sizes), selected, args.min_time, args.max_runs, args.budget)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": _metadata(), "results": results}, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""
+finance_tracker/__main__.py
+
+Entry point for python -m finance_tracker (headless CLI; run.py starts the GUI).
+"""
+
+import sys
+
+from .cli import main
+
+# Guarded because the scenarios command starts worker processes, which re-import
+# this module under another name when processes are spawned (Windows, macOS)
+if __name__ == "__main__":
+    sys.exit(main())
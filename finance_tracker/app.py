@@ -4,14 +4,22 @@ finance_tracker/app.py
 Main application entry point and initialization.
 """
 
+import sys
 import tkinter as tk
 import traceback
 
+from . import perf
 from .state import AppState
 from .ui.main_view import MainView
+from .ui.performance_window import full_report
 
 
 def main():
+    # Before any widget exists, so every callback can be timed once enabled
+    perf.install_tk_hooks()
+    if perf.requested_by_env():
+        perf.enable()
+
     root = tk.Tk()
 
     def report_callback_exception(exc, val, tb):
@@ -22,3 +30,6 @@ def main():
     state = AppState()
     MainView(root, state)
     root.mainloop()
+
+    if perf.is_enabled():
+        print(full_report(), file=sys.stderr)
@@ -0,0 +1,49 @@
+"""
+finance_tracker/change_bus.py
+
+Publish/subscribe bus used by AppState to announce which part of the data changed.
+"""
+
+TOPIC_TRANSACTIONS = "transactions"
+TOPIC_FIXED_COSTS = "fixed_costs"
+TOPIC_INCOME_SOURCES = "income_sources"
+TOPIC_BALANCES = "balances"
+TOPIC_GOALS = "goals"
+TOPIC_SNAPSHOTS = "snapshots"
+
+TOPICS = (
+    TOPIC_TRANSACTIONS,
+    TOPIC_FIXED_COSTS,
+    TOPIC_INCOME_SOURCES,
+    TOPIC_BALANCES,
+    TOPIC_GOALS,
+    TOPIC_SNAPSHOTS,
+)
+
+
+class ChangeBus:
+    """
+    Dispatches change notifications per topic.
+    Subscribers are called synchronously as callback(change); `change` is a
+    TransactionChange for the transactions topic and None for the others.
+    """
+
+    def __init__(self):
+        self._subscribers = {topic: [] for topic in TOPICS}
+
+    def subscribe(self, topic: str, callback):
+        if topic not in self._subscribers:
+            raise ValueError(f"Unknown change topic: {topic}")
+        if callback not in self._subscribers[topic]:
+            self._subscribers[topic].append(callback)
+
+    def unsubscribe(self, topic: str, callback):
+        callbacks = self._subscribers.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, topic: str, change=None):
+        if topic not in self._subscribers:
+            raise ValueError(f"Unknown change topic: {topic}")
+        for callback in list(self._subscribers[topic]):
+            callback(change)
@@ -0,0 +1,320 @@
+"""
+finance_tracker/cli.py
+
+Headless command-line interface (python -m finance_tracker). Loads AppState
+without tkinter; services are imported inside each command so startup stays
+cheap, and matplotlib is only loaded by the chart export command.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, datetime
+
+from . import perf
+from .state import AppState
+
+TRANSACTION_TYPES = ("Expense", "Income")
+IMPORT_FORMATS = ("csv", "jsonl", "json")
+PROJECTION_MODES = ("target_savings", "net_worth_change", "monte_carlo", "cash_flow")
+CHART_KINDS = ("budget", "pace", "heatmap", "net-worth", "allocation", "breakdown", "cash-flow")
+
+
+class CliError(Exception):
+    """Raised for invalid input; reported on stderr with exit status 1."""
+
+
+def _month(value: str) -> str:
+    try:
+        datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM")
+    return value
+
+
+def _current_month() -> str:
+    return date.today().strftime("%Y-%m")
+
+
+def cmd_add(args, state) -> None:
+    from .services.transaction_import import (
+        TransactionImportError,
+        import_transactions,
+        import_transactions_file,
+        read_transaction_rows,
+    )
+    try:
+        if args.file:
+            count = import_transactions_file(state, args.file, args.format, args.type, args.dry_run)
+        else:
+            count = import_transactions(state, read_transaction_rows(sys.stdin, args.format),
+                                        args.type, args.dry_run)
+    except TransactionImportError as exc:
+        raise CliError(f"nothing added, invalid input:\n{exc}")
+    if args.dry_run:
+        print(f"{count} transaction(s) valid, nothing added (dry run).")
+    else:
+        print(f"Added {count} transaction(s).")
+
+
+def cmd_budget(args, state) -> None:
+    from .services.budget_calculator import generate_daily_budget_report
+    print(generate_daily_budget_report(state, args.month, args.carryover))
+
+
+def cmd_projection(args, state) -> None:
+    from .services.projection_service import projection_text
+    print(projection_text(state, args.months, args.mode, args.history))
+
+
+def _schedule_change(value: str) -> tuple[str, float, float | None]:
+    """NAME=+10% / NAME=-5% (percent change) or NAME=1200 (new amount) -> (name, percent, amount)."""
+    name, _, change = value.rpartition("=")
+    try:
+        if not name.strip():
+            raise ValueError
+        if change.endswith("%"):
+            return name.strip(), float(change[:-1]), None
+        return name.strip(), 0.0, float(change)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid change '{value}', expected NAME=+10% or NAME=AMOUNT")
+
+
+def _category_change(value: str) -> tuple[str, float]:
+    name, percent, amount = _schedule_change(value)
+    if amount is not None:
+        raise argparse.ArgumentTypeError(f"invalid change '{value}', expected CATEGORY=+10%")
+    return name, percent
+
+
+def cmd_scenarios(args, state) -> None:
+    from .services.projection_service import MONTE_CARLO_PATHS
+    from .services.scenario_service import (
+        CategoryChange,
+        FixedCostChange,
+        IncomeChange,
+        Scenario,
+        compare_scenarios,
+    )
+    overrides = [
+        *(FixedCostChange(name, percent, amount, args.start) for name, percent, amount in args.fixed_cost),
+        *(IncomeChange(name, percent, amount, args.start) for name, percent, amount in args.income),
+        *(CategoryChange(name, percent) for name, percent in args.category),
+    ]
+    if not overrides:
+        raise CliError("describe the scenario with at least one --fixed-cost, --income or --category change")
+    comparison = compare_scenarios(state, [Scenario(args.name, tuple(overrides))], args.months, args.history,
+                                   paths=args.paths or MONTE_CARLO_PATHS, seed=args.seed)
+    if args.json:
+        json.dump(comparison.chart_data(), sys.stdout, indent=2)
+        print()
+    else:
+        print(comparison.table())
+
+
+def cmd_net_worth(args, state) -> None:
+    from .services.asset_tracking_service import generate_net_worth_report
+    print(generate_net_worth_report(state))
+
+
+def cmd_goals(args, state) -> None:
+    from .services.goals_service import generate_goals_report
+    print(generate_goals_report(state))
+
+
+def cmd_reconcile(args, state) -> None:
+    from .services.reconciliation_service import (
+        STATUS_MATCHED,
+        get_summary,
+        match_transactions,
+        parse_bank_csv,
+        suggest_category,
+    )
+    try:
+        txns, meta = parse_bank_csv(args.csv)
+    except OSError as exc:
+        raise CliError(str(exc))
+    if "error" in meta:
+        raise CliError(meta["error"])
+    for t in txns:
+        t.suggested_category = suggest_category(t.payee, t.purpose, t.tx_type, state)
+    match_transactions(txns, state)
+    unmatched = [t for t in txns if t.status != STATUS_MATCHED]
+
+    if args.json:
+        rows = [{"date": t.date, "amount": t.amount, "type": t.tx_type, "payee": t.payee,
+                 "purpose": t.purpose, "status": t.status, "suggested_category": t.suggested_category,
+                 "matched_id": (t.matched_tx or {}).get("id")} for t in txns]
+        json.dump({"summary": get_summary(txns), "transactions": rows}, sys.stdout, indent=2)
+        print()
+    else:
+        summary = get_summary(txns)
+        print(f"Bank transactions {summary.get('date_from', '-')} to {summary.get('date_to', '-')}: "
+              f"{summary.get('total', 0)} ({summary.get('matched_count', 0)} matched, "
+              f"{summary.get('possible_count', 0)} possible, {summary.get('missing_count', 0)} missing)")
+        for t in unmatched:
+            print(f"{t.status:<9} {t.date}  {t.amount:>10,.2f}  {t.suggested_category:<16} "
+                  f"{(t.payee or t.purpose)[:50]}")
+    if args.fail_on_missing and unmatched:
+        sys.exit(3)
+
+
+def _chart_figure(args, state):
+    from .ui import charts
+    if args.kind == "budget":
+        return charts.create_budget_depletion_figure(state, args.month, args.carryover)
+    if args.kind == "pace":
+        return charts.create_spending_pace_figure(state, args.month)
+    if args.kind == "heatmap":
+        return charts.create_dow_heatmap_figure(state, args.months)
+    if args.kind == "cash-flow":
+        from .services.cash_flow_service import project_cash_flow
+        return charts.create_cash_flow_figure(project_cash_flow(state, args.months))
+
+    from .services.asset_tracking_service import get_asset_snapshots
+    snapshots = get_asset_snapshots(state)
+    if args.kind == "net-worth":
+        if not snapshots:
+            raise CliError("no asset snapshots recorded")
+        from .services.net_worth_history import reconstruct_net_worth
+        return charts.create_net_worth_figure(snapshots, reconstruct_net_worth(state))
+    if args.kind == "breakdown":
+        if not snapshots:
+            raise CliError("no asset snapshots recorded")
+        return charts.create_breakdown_figure(snapshots)
+
+    # allocation: current balances, as on the Net Worth tab
+    bs = state.budget_settings
+    balances = {
+        'Bank Account': bs.get('bank_account_balance', 0),
+        'Wallet': bs.get('wallet_balance', 0),
+        'Savings': bs.get('savings_balance', 0),
+        'Investments': bs.get('investment_balance', 0),
+        'Money Lent': bs.get('money_lent_balance', 0),
+    }
+    positive = {k: v for k, v in balances.items() if v > 0}
+    negative = {k: v for k, v in balances.items() if v < 0}
+    if not positive:
+        raise CliError("no positive balances to chart")
+    return charts.create_allocation_figure(positive, negative, sum(positive.values()))
+
+
+def cmd_chart(args, state) -> None:
+    figure = _chart_figure(args, state)
+    if figure is None:
+        raise CliError(f"nothing to chart for '{args.kind}'")
+    figure.savefig(args.output, dpi=args.dpi, bbox_inches="tight")
+    print(f"Saved {args.kind} chart to {args.output}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m finance_tracker",
+                                     description="Finance Tracker reports and data operations without the GUI.")
+    parser.add_argument("--data", help="data file (default: $FINANCE_DATA_FILE or finance_data.json)")
+    parser.add_argument("--perf", action="store_true",
+                        help="time service calls and print the slowest to stderr (also $FINANCE_PERF=1)")
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile of the command to FILE")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add transactions from a CSV / JSON lines / JSON file or stdin",
+                              description="Each row needs date (YYYY-MM-DD) and amount; optional type "
+                                          "(Expense/Income), category, description and behavior_date. "
+                                          "CSV files need a header row with these column names. "
+                                          "All rows are validated first and saved at once.")
+    add.add_argument("file", nargs="?", help="file to import (default: read stdin)")
+    add.add_argument("--format", choices=IMPORT_FORMATS,
+                     help="input format (default: from the file extension or the first line)")
+    add.add_argument("--type", choices=TRANSACTION_TYPES, default="Expense",
+                     help="type for records without a 'type' field (default: Expense)")
+    add.add_argument("--dry-run", action="store_true", help="validate only, do not save")
+    add.set_defaults(handler=cmd_add)
+
+    budget = commands.add_parser("budget", help="daily budget report for a month")
+    budget.add_argument("--month", type=_month, default=_current_month(), help="YYYY-MM (default: this month)")
+    budget.add_argument("--carryover", action="store_true", help="include negative carryover from last month")
+    budget.set_defaults(handler=cmd_budget)
+
+    projection = commands.add_parser("projection", help="savings projection")
+    projection.add_argument("--months", type=int, default=12, help="months to project (default: 12)")
+    projection.add_argument("--mode", choices=PROJECTION_MODES, default="target_savings")
+    projection.add_argument("--history", type=int, default=6, help="months of history to learn from (default: 6)")
+    projection.set_defaults(handler=cmd_projection)
+
+    scenarios = commands.add_parser("scenarios", help="compare a what-if scenario with the current plan",
+                                    description="Runs the Monte Carlo projection for the current plan and "
+                                                "for the plan with the given changes, on the same random "
+                                                "draws, and prints both side by side.")
+    scenarios.add_argument("--name", default="Scenario", help="scenario name in the table (default: Scenario)")
+    scenarios.add_argument("--fixed-cost", action="append", type=_schedule_change, default=[], metavar="DESC=CHANGE",
+                           help="change a fixed cost by a percentage (Rent=+5%%) or to an amount (Rent=950); "
+                                "an unknown description with an amount adds a new fixed cost; repeatable")
+    scenarios.add_argument("--income", action="append", type=_schedule_change, default=[], metavar="DESC=CHANGE",
+                           help="change an income source the same way; repeatable")
+    scenarios.add_argument("--category", action="append", type=_category_change, default=[],
+                           metavar="CATEGORY=PCT%", help="scale spending in an expense category; repeatable")
+    scenarios.add_argument("--start", type=_month, metavar="YYYY-MM",
+                           help="month the fixed-cost and income changes start (default: their whole range)")
+    scenarios.add_argument("--months", type=int, default=12, help="months to project (default: 12)")
+    scenarios.add_argument("--history", type=int, default=12, help="months of history to learn from (default: 12)")
+    scenarios.add_argument("--paths", type=int,
+                           help="simulated paths per scenario (default: as the monte_carlo projection)")
+    scenarios.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    scenarios.add_argument("--json", action="store_true", help="print the P10/P50/P90 series as JSON")
+    scenarios.set_defaults(handler=cmd_scenarios)
+
+    commands.add_parser("net-worth", help="net worth report").set_defaults(handler=cmd_net_worth)
+    commands.add_parser("goals", help="savings goals report").set_defaults(handler=cmd_goals)
+
+    reconcile = commands.add_parser("reconcile", help="match a bank CSV export against recorded transactions")
+    reconcile.add_argument("csv", help="bank CSV export")
+    reconcile.add_argument("--json", action="store_true", help="print the result as JSON")
+    reconcile.add_argument("--fail-on-missing", action="store_true",
+                           help="exit with status 3 if any bank transaction is not matched")
+    reconcile.set_defaults(handler=cmd_reconcile)
+
+    chart = commands.add_parser("chart", help="export a chart as an image")
+    chart.add_argument("kind", choices=CHART_KINDS)
+    chart.add_argument("-o", "--output", required=True, help="output file; the format follows the extension")
+    chart.add_argument("--month", type=_month, default=_current_month(), help="YYYY-MM for budget and pace charts")
+    chart.add_argument("--months", type=int, default=3, help="months for heatmap and cash-flow charts (default: 3)")
+    chart.add_argument("--carryover", action="store_true", help="budget chart: include negative carryover")
+    chart.add_argument("--dpi", type=int, default=100)
+    chart.set_defaults(handler=cmd_chart)
+    return parser
+
+
+def _run(args) -> None:
+    state = AppState(args.data)
+    args.handler(args, state)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.perf or perf.requested_by_env():
+        perf.enable()
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+    try:
+        if profiler is not None:
+            profiler.runcall(_run, args)
+        else:
+            _run(args)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output piped into e.g. head; stop quietly like other command-line tools
+        sys.stdout = open(os.devnull, "w")
+        return 0
+    except (CliError, OSError, json.JSONDecodeError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.dump_stats(args.profile)
+        if perf.is_enabled():
+            print(perf.format_report(), file=sys.stderr)
+    return 0
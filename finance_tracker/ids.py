@@ -0,0 +1,66 @@
+"""
+finance_tracker/ids.py
+
+ULID-style ids for transactions: 26 Crockford base32 characters encoding a 48-bit
+millisecond timestamp followed by 80 random bits. Ids from new_ulid() are strictly
+increasing within a process (inside one millisecond the random part is incremented),
+so they sort by creation time as plain strings.
+"""
+
+import os
+import threading
+import time
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+_RANDOM_LIMIT = 1 << _RANDOM_BITS
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def _encode(timestamp_ms: int, randomness: int) -> str:
+    value = (timestamp_ms << _RANDOM_BITS) | randomness
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def _random_part() -> int:
+    return int.from_bytes(os.urandom(10), "big")
+
+
+def new_ulid() -> str:
+    """A new id, greater than every id previously returned in this process."""
+    global _last_ms, _last_random
+    with _lock:
+        now = int(time.time() * 1000)
+        if now > _last_ms:
+            _last_ms, _last_random = now, _random_part()
+        else:
+            # Same millisecond (or the clock went back): continue from the last id
+            _last_random += 1
+            if _last_random >= _RANDOM_LIMIT:
+                _last_ms, _last_random = _last_ms + 1, 0
+        return _encode(_last_ms, _last_random)
+
+
+def ulid_at(timestamp_ms: int) -> str:
+    """An id for a given moment (e.g. a legacy row's date); unique but not monotonic."""
+    return _encode(max(timestamp_ms, 0), _random_part())
+
+
+def ulid_timestamp(value: str) -> int | None:
+    """Millisecond timestamp of a ULID, or None if value is not one."""
+    if len(value) != 26:
+        return None
+    number = 0
+    for char in value.upper():
+        digit = _ALPHABET.find(char)
+        if digit < 0:
+            return None
+        number = number * 32 + digit
+    return number >> _RANDOM_BITS
@@ -0,0 +1,120 @@
+"""
+finance_tracker/json_codec.py
+
+Encoding and decoding of the data file. orjson is used when it is installed and
+the standard library json module otherwise; FINANCE_JSON_CODEC=json|orjson picks
+one explicitly. Files are read as bytes and written compact (no whitespace, UTF-8)
+unless pretty output is requested with FINANCE_JSON_PRETTY=1, which indents by
+four spaces like the Android app's encoder. Both layouts parse the same on every
+platform; only the whitespace differs. The codecs may spell the same float
+differently (1e+16 or 1e16), which parses to the same value. NaN and infinity
+have no JSON form, so both codecs raise ValueError for them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+CODEC_ENV_VAR = "FINANCE_JSON_CODEC"
+PRETTY_ENV_VAR = "FINANCE_JSON_PRETTY"
+PRETTY_INDENT = 4
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _without_bom(data: bytes | str) -> bytes | str:
+    # Files saved by some Windows editors start with a UTF-8 byte order mark
+    if isinstance(data, bytes) and data.startswith(_UTF8_BOM):
+        return data[len(_UTF8_BOM):]
+    return data
+
+
+def _check_finite(obj: Any) -> None:
+    # orjson writes NaN and infinity as null without complaint; fail like json.dumps(allow_nan=False)
+    containers = [obj]
+    while containers:
+        container = containers.pop()
+        for value in (container.values() if isinstance(container, dict) else container):
+            kind = type(value)
+            if kind is str or kind is int or value is None:
+                continue
+            if kind is float or isinstance(value, float):
+                if value - value != 0.0:  # nan for both NaN and infinity
+                    raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+            elif isinstance(value, (dict, list, tuple)):
+                containers.append(value)
+
+
+class JsonCodec:
+    """Standard library codec; the reference behaviour for other codecs."""
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(_without_bom(data))
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=PRETTY_INDENT, ensure_ascii=False, allow_nan=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+        return text.encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson for compact output and all parsing; pretty output stays with the stdlib (orjson only indents by two)."""
+    name = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(_without_bom(data))
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return super().dumps(obj, pretty=True)
+        _check_finite([obj])
+        # Non-string keys are converted to strings, as json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+CODECS = {"json": JsonCodec, "orjson": OrjsonCodec}
+
+
+def available_codecs() -> list[str]:
+    return [name for name in CODECS if name != "orjson" or orjson is not None]
+
+
+def get_codec(name: str | None = None) -> JsonCodec:
+    """
+    The codec called name, else the one chosen by FINANCE_JSON_CODEC, else the
+    fastest installed. Asking for orjson when it is not installed falls back to
+    the standard library. Raises ValueError for unknown names.
+    """
+    name = (name or os.environ.get(CODEC_ENV_VAR, "")).strip().lower()
+    if not name:
+        name = "orjson" if orjson is not None else "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}', expected one of: {', '.join(CODECS)}")
+    if name == "orjson" and orjson is None:
+        name = "json"
+    return CODECS[name]()
+
+
+def pretty_from_env() -> bool:
+    return os.environ.get(PRETTY_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def read_json_file(path: str | Path, codec: JsonCodec | None = None) -> Any:
+    return (codec or get_codec()).loads(Path(path).read_bytes())
+
+
+def write_json_file(path: str | Path, obj: Any, pretty: bool | None = None,
+                    codec: JsonCodec | None = None) -> None:
+    if pretty is None:
+        pretty = pretty_from_env()
+    Path(path).write_bytes((codec or get_codec()).dumps(obj, pretty))
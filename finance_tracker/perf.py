@@ -0,0 +1,359 @@
+"""
+finance_tracker/perf.py
+
+Opt-in performance instrumentation. When enabled (FINANCE_PERF=1, the Settings
+toggle or the CLI --perf option) the public functions of the hot service modules,
+the chart builders and AppState.load/save are wrapped with timers and call
+counters, and Tk callbacks slower than a threshold are recorded. Disabled, the
+modules run unwrapped and Tk callbacks pay a single flag check.
+
+The wrappers replace the module attributes and every reference other
+finance_tracker modules imported with "from ... import", so UI code that was
+loaded before the toggle is measured as well.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from types import FunctionType
+
+ENV_VAR = "FINANCE_PERF"
+SLOW_MS_ENV_VAR = "FINANCE_PERF_SLOW_MS"
+DEFAULT_SLOW_CALLBACK_MS = 100.0
+MAX_SLOW_CALLBACKS = 50
+PROFILE_LINES = 25
+
+INSTRUMENTED_MODULES = (
+    "finance_tracker.services.budget_calculator",
+    "finance_tracker.services.report_builder",
+    "finance_tracker.services.reconciliation_service",
+    "finance_tracker.ui.charts",
+)
+PACKAGE = "finance_tracker"
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+@dataclass
+class SlowCallback:
+    when: datetime
+    name: str
+    widget: str
+    seconds: float
+
+
+_lock = threading.Lock()
+_stats: dict[str, CallStats] = {}
+_slow_callbacks: deque[SlowCallback] = deque(maxlen=MAX_SLOW_CALLBACKS)
+_enabled = False
+_profile_armed = False
+_listeners: list = []
+last_profile: str | None = None
+
+
+def _env_slow_ms() -> float:
+    try:
+        return float(os.environ.get(SLOW_MS_ENV_VAR, DEFAULT_SLOW_CALLBACK_MS))
+    except ValueError:
+        return DEFAULT_SLOW_CALLBACK_MS
+
+
+slow_callback_ms = _env_slow_ms()
+
+
+def requested_by_env() -> bool:
+    return os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record(name: str, seconds: float) -> None:
+    """Add one timed call to the statistics for name."""
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = CallStats()
+        stats.calls += 1
+        stats.total += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+
+
+class timed:
+    """Context manager timing a block under name (only while instrumentation is enabled)."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if _enabled:
+            record(self.name, time.perf_counter() - self._start)
+        return False
+
+
+def snapshot() -> dict[str, CallStats]:
+    with _lock:
+        return {name: CallStats(s.calls, s.total, s.max) for name, s in _stats.items()}
+
+
+def slow_callbacks() -> list[SlowCallback]:
+    with _lock:
+        return list(_slow_callbacks)
+
+
+def reset() -> None:
+    global last_profile
+    with _lock:
+        _stats.clear()
+        _slow_callbacks.clear()
+    last_profile = None
+
+
+# ---------------------------------------------------------------------------
+# Function wrapping
+# ---------------------------------------------------------------------------
+def _timed_function(function, name: str):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(name, time.perf_counter() - start)
+    wrapper._perf_name = name
+    return wrapper
+
+
+def _public_functions(module):
+    for attr, value in vars(module).items():
+        if not attr.startswith("_") and isinstance(value, FunctionType) and value.__module__ == module.__name__:
+            yield attr, value
+
+
+def _package_modules():
+    return [m for name, m in list(sys.modules.items())
+            if m is not None and (name == PACKAGE or name.startswith(PACKAGE + "."))]
+
+
+def _rebind(replacements: dict[int, object]) -> None:
+    """Point every finance_tracker module global that is a key (by id) at its replacement."""
+    for module in _package_modules():
+        namespace = vars(module)
+        for attr, value in list(namespace.items()):
+            replacement = replacements.get(id(value))
+            if replacement is not None:
+                namespace[attr] = replacement
+
+
+def _instrument() -> None:
+    from .state import AppState
+
+    replacements = {}
+    for module_name in INSTRUMENTED_MODULES:
+        module = importlib.import_module(module_name)
+        short = module_name.rsplit(".", 1)[-1]
+        for attr, function in _public_functions(module):
+            replacements[id(function)] = _timed_function(function, f"{short}.{attr}")
+    _rebind(replacements)
+    for method in ("load", "save"):
+        original = vars(AppState)[method]
+        if not hasattr(original, "_perf_name"):
+            setattr(AppState, method, _timed_function(original, f"AppState.{method}"))
+
+
+def _uninstrument() -> None:
+    from .state import AppState
+
+    replacements = {}
+    for module in _package_modules():
+        for value in vars(module).values():
+            if hasattr(value, "_perf_name") and isinstance(value, FunctionType):
+                replacements[id(value)] = value.__wrapped__
+    _rebind(replacements)
+    for method in ("load", "save"):
+        wrapper = vars(AppState)[method]
+        if hasattr(wrapper, "_perf_name"):
+            setattr(AppState, method, wrapper.__wrapped__)
+
+
+def add_listener(callback) -> None:
+    """Call callback(enabled) whenever instrumentation is switched on or off."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_listener(callback) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def _notify() -> None:
+    for callback in list(_listeners):
+        callback(_enabled)
+
+
+def enable() -> None:
+    """Start collecting timings (wrapping the instrumented modules)."""
+    global _enabled
+    if not _enabled:
+        _instrument()
+        _enabled = True
+        _notify()
+
+
+def disable() -> None:
+    """Stop collecting and restore the original functions; statistics are kept."""
+    global _enabled, _profile_armed
+    if _enabled:
+        _enabled = False
+        _profile_armed = False
+        _uninstrument()
+        _notify()
+
+
+# ---------------------------------------------------------------------------
+# Tk callbacks
+# ---------------------------------------------------------------------------
+def callback_name(function) -> str:
+    """Readable name of a Tk callback; after() callbacks report the function they wrap."""
+    code = getattr(function, "__code__", None)
+    if code is not None and code.co_name == "callit" and "func" in code.co_freevars:
+        function = function.__closure__[code.co_freevars.index("func")].cell_contents
+    function = getattr(function, "__func__", function)
+    module = getattr(function, "__module__", None) or ""
+    qualname = getattr(function, "__qualname__", None) or type(function).__name__
+    if module.startswith(PACKAGE + "."):
+        module = module[len(PACKAGE) + 1:]
+    return f"{module}.{qualname}" if module else qualname
+
+
+def _is_after_callback(function) -> bool:
+    code = getattr(function, "__code__", None)
+    return code is not None and code.co_name == "callit"
+
+
+def profile_next_action() -> None:
+    """Run the next user-triggered Tk callback (not an after() timer) under cProfile."""
+    global _profile_armed
+    _profile_armed = True
+
+
+def profile_armed() -> bool:
+    return _profile_armed
+
+
+def _profile_call(call, name: str):
+    global last_profile
+    # Imported here: cProfile and pstats are slow to load and rarely needed
+    import cProfile
+    import io
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(call)
+    finally:
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(PROFILE_LINES)
+        last_profile = f"Profile of {name} ({datetime.now():%H:%M:%S})\n{out.getvalue()}"
+
+
+def _timed_callback(wrapper, args):
+    global _profile_armed
+    name = None
+    if _profile_armed and not _is_after_callback(wrapper.func):
+        _profile_armed = False
+        name = callback_name(wrapper.func)
+        start = time.perf_counter()
+        result = _profile_call(lambda: wrapper.call_untimed(*args), name)
+    else:
+        start = time.perf_counter()
+        result = wrapper.call_untimed(*args)
+    seconds = time.perf_counter() - start
+    if _enabled:
+        name = name or callback_name(wrapper.func)
+        record(f"tk:{name}", seconds)
+        if seconds * 1000 >= slow_callback_ms:
+            with _lock:
+                _slow_callbacks.append(SlowCallback(datetime.now(), name, str(wrapper.widget), seconds))
+    return result
+
+
+def install_tk_hooks() -> None:
+    """
+    Route Tk callbacks through a timing wrapper. tkinter binds CallWrapper when a
+    callback is registered, so call this before the widgets are created.
+    """
+    import tkinter
+
+    if getattr(tkinter.CallWrapper, "_perf_hook", False):
+        return
+    base = tkinter.CallWrapper
+
+    class TimedCallWrapper(base):
+        _perf_hook = True
+
+        def call_untimed(self, *args):
+            return base.__call__(self, *args)
+
+        def __call__(self, *args):
+            if not _enabled and not _profile_armed:
+                return base.__call__(self, *args)
+            return _timed_callback(self, args)
+
+    tkinter.CallWrapper = TimedCallWrapper
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+def format_report(limit: int = 25) -> str:
+    """Top functions by total time, then the most recent slow Tk callbacks and the last profile."""
+    stats = snapshot()
+    lines = [f"Performance instrumentation: {'on' if _enabled else 'off'}", ""]
+    if stats:
+        lines.append(f"{'Function':<52} {'Calls':>8} {'Total ms':>11} {'Mean ms':>9} {'Max ms':>9}")
+        ranked = sorted(stats.items(), key=lambda item: item[1].total, reverse=True)
+        for name, s in ranked[:limit]:
+            lines.append(f"{name[:52]:<52} {s.calls:>8} {s.total * 1000:>11.1f} "
+                         f"{s.mean * 1000:>9.2f} {s.max * 1000:>9.1f}")
+        if len(ranked) > limit:
+            lines.append(f"... {len(ranked) - limit} more")
+    else:
+        lines.append("No calls recorded yet.")
+
+    slow = slow_callbacks()
+    lines += ["", f"Slow Tk callbacks (>= {slow_callback_ms:.0f} ms), newest first:"]
+    if slow:
+        for entry in reversed(slow):
+            lines.append(f"{entry.when:%H:%M:%S}  {entry.seconds * 1000:>9.1f} ms  {entry.name}  [{entry.widget}]")
+    else:
+        lines.append("None.")
+
+    if last_profile:
+        lines += ["", last_profile]
+    return "\n".join(lines)
@@ -6,15 +6,21 @@ Service for generating AI insights based on finance tracker data.
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 import json
-import urllib.request
-import urllib.error
+import re
+import threading
+import time
+import weakref
 
 from dateutil.relativedelta import relativedelta
 from .budget_calculator import get_active_fixed_costs, get_active_monthly_income
+from .ai_response_cache import cache_key
+from .http_client import RequestTiming, get_default_pool
+from .summary_encoder import SUMMARY_TOKEN_BUDGET, EncodedSummary, encode_summary, estimate_tokens
 
 
 @dataclass
@@ -23,6 +29,20 @@ class AIConfig:
     api_base_url: str
     api_key: str
     model: str
+    temperature: float = 0.3
+
+
+@dataclass
+class ProviderResult:
+    """Outcome of one provider's request in a fan-out."""
+    config: AIConfig
+    content: str = ""
+    error: str = ""
+    latency_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
 
 
 def _month_list(end_month: str, months_back: int) -> list[str]:
@@ -38,37 +58,56 @@ def _month_list(end_month: str, months_back: int) -> list[str]:
     return months
 
 
-def _aggregate_transactions(state, months: list[str]) -> dict[str, Any]:
-    month_set = set(months)
-    expenses = [e for e in state.expenses if e.get("date", "")[:7] in month_set]
-    incomes = [i for i in state.incomes if i.get("date", "")[:7] in month_set]
+def _aggregate_by_month(state, months: list[str]) -> dict[str, dict[str, Any]]:
+    """Per-month category, fixed-cost and base-income totals in one pass over the transactions."""
+    monthly = {
+        m: {"expenses": {}, "income": {}, "fixed": {}, "base_income": 0.0, "expense_count": 0, "income_count": 0}
+        for m in months
+    }
 
-    def totals_by_category(rows: list[dict[str, Any]]) -> dict[str, float]:
-        totals: dict[str, float] = {}
+    def add_rows(rows: list[dict[str, Any]], kind: str, count_key: str) -> None:
         for row in rows:
+            bucket = monthly.get(row.get("date", "")[:7])
+            if bucket is None:
+                continue
+            totals = bucket[kind]
             category = row.get("category", "Uncategorized")
             totals[category] = totals.get(category, 0.0) + float(row.get("amount", 0.0))
-        return totals
+            bucket[count_key] += 1
 
-    expense_totals = totals_by_category(expenses)
-    income_totals = totals_by_category(incomes)
+    add_rows(state.expenses, "expenses", "expense_count")
+    add_rows(state.incomes, "income", "income_count")
 
+    # Include fixed costs and base income for each month
+    for m in months:
+        fixed = monthly[m]["fixed"]
+        for fc in get_active_fixed_costs(state, m):
+            description = fc.get("desc") or fc.get("description") or "Untitled"
+            fixed[description] = fixed.get(description, 0.0) + float(fc.get("amount", 0.0))
+        monthly[m]["base_income"] = max(get_active_monthly_income(state, m), 0.0)
+    return monthly
+
+
+def _aggregate_transactions(months: list[str], monthly: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Window totals in the original JSON summary layout (one key per category and fixed cost)."""
+    expense_totals: dict[str, float] = {}
+    income_totals: dict[str, float] = {}
+    for m in months:
+        for category, amount in monthly[m]["expenses"].items():
+            expense_totals[category] = expense_totals.get(category, 0.0) + amount
+        for category, amount in monthly[m]["income"].items():
+            income_totals[category] = income_totals.get(category, 0.0) + amount
     total_flex_expenses = sum(expense_totals.values())
     total_flex_income = sum(income_totals.values())
 
     total_fixed_costs = 0.0
     total_base_income = 0.0
-
-    # Include fixed costs and base income for each month
     for m in months:
-        active_fixed = get_active_fixed_costs(state, m)
-        for fc in active_fixed:
-            amount = float(fc.get("amount", 0.0))
+        for description, amount in monthly[m]["fixed"].items():
             total_fixed_costs += amount
-            cat = f"Fixed: {fc.get('description', 'Untitled')}"
+            cat = f"Fixed: {description}"
             expense_totals[cat] = expense_totals.get(cat, 0.0) + amount
-        
-        base_income = get_active_monthly_income(state, m)
+        base_income = monthly[m]["base_income"]
         if base_income > 0:
             total_base_income += base_income
             cat = "Base Monthly Income"
@@ -92,15 +131,91 @@ def _aggregate_transactions(state, months: list[str]) -> dict[str, Any]:
         "expense_categories": expense_totals,
         "income_categories": income_totals,
         "transaction_counts": {
-            "flexible_expenses": len(expenses),
-            "flexible_incomes": len(incomes),
+            "flexible_expenses": sum(monthly[m]["expense_count"] for m in months),
+            "flexible_incomes": sum(monthly[m]["income_count"] for m in months),
         },
     }
 
 
-def build_insights_prompt(state, month_str: str, months_back: int) -> list[dict[str, str]]:
+# state -> {(month_str, months_back, token_budget): (data_version, EncodedSummary)}
+_summary_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Approximate token budgets for the chat history sent with each message and for the
+# digest that replaces older turns (estimated at ~4 characters per token).
+CHAT_HISTORY_TOKEN_BUDGET = 2000
+CHAT_DIGEST_TOKEN_BUDGET = 400
+_DIGEST_LINE_CHARS = 200
+
+
+def encoded_summary(state, month_str: str, months_back: int,
+                    token_budget: int = SUMMARY_TOKEN_BUDGET) -> EncodedSummary:
+    """
+    Compact summary for the given window, with its size before and after encoding.
+    Computed once per (month, months_back, token_budget, state.data_version) and
+    reused across chat turns and report requests.
+    """
+    per_state = _summary_cache.setdefault(state, {})
+    version = getattr(state, "data_version", None)
+    key = (month_str, months_back, token_budget)
+    cached = per_state.get(key)
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
+
     months = _month_list(month_str, months_back)
-    summary = _aggregate_transactions(state, months)
+    monthly = _aggregate_by_month(state, months)
+    original_tokens = estimate_tokens(json.dumps(_aggregate_transactions(months, monthly), indent=2))
+    summary = encode_summary(months, monthly, original_tokens, token_budget)
+    if version is not None:
+        # Entries for older data versions can never be hit again
+        for stale in [k for k, (v, _) in per_state.items() if v != version]:
+            del per_state[stale]
+        per_state[key] = (version, summary)
+    return summary
+
+
+def summary_context(state, month_str: str, months_back: int,
+                    token_budget: int = SUMMARY_TOKEN_BUDGET) -> str:
+    return encoded_summary(state, month_str, months_back, token_budget).text
+
+
+def _digest_line(message: dict[str, str]) -> str:
+    speaker = "AI" if message.get("role") == "assistant" else "User"
+    text = re.sub(r"\s+", " ", message.get("content", "")).strip()
+    if len(text) > _DIGEST_LINE_CHARS:
+        text = text[:_DIGEST_LINE_CHARS].rsplit(" ", 1)[0] + " ..."
+    return f"- {speaker}: {text}"
+
+
+def compact_chat_history(
+    chat_history: list[dict[str, str]],
+    digest: str = "",
+    token_budget: int = CHAT_HISTORY_TOKEN_BUDGET,
+    digest_budget: int = CHAT_DIGEST_TOKEN_BUDGET,
+) -> tuple[list[dict[str, str]], str]:
+    """
+    Fold the oldest turns into a running digest until the remaining history fits
+    token_budget. The digest keeps one shortened line per folded message and drops
+    its oldest lines beyond digest_budget. Returns (recent_history, digest).
+    """
+    total = sum(estimate_tokens(message.get("content", "")) for message in chat_history)
+    if total <= token_budget:
+        return chat_history, digest
+
+    recent = list(chat_history)
+    lines = digest.splitlines() if digest else []
+    # Always keep the latest exchange verbatim
+    while recent and (total > token_budget or recent[0].get("role") != "user") and len(recent) > 2:
+        message = recent.pop(0)
+        total -= estimate_tokens(message.get("content", ""))
+        lines.append(_digest_line(message))
+
+    while lines and estimate_tokens("\n".join(lines)) > digest_budget:
+        lines.pop(0)
+    return recent, "\n".join(lines)
+
+
+def build_insights_prompt(state, month_str: str, months_back: int) -> list[dict[str, str]]:
+    summary = summary_context(state, month_str, months_back)
 
     system_prompt = (
         "You are a financial coach. Use the provided summary to deliver concise, actionable insights. "
@@ -111,7 +226,7 @@ def build_insights_prompt(state, month_str: str, months_back: int) -> list[dict[
     user_prompt = (
         "Analyze the following finance summary and provide insights and advice. "
         "Be specific and reference the categories where possible.\n\n"
-        f"Summary JSON:\n{json.dumps(summary, indent=2)}"
+        f"Summary:\n{summary}"
     )
 
     return [
@@ -126,29 +241,37 @@ def build_chat_messages(
     months_back: int,
     chat_history: list[dict[str, str]],
     user_message: str,
+    chat_digest: str = "",
 ) -> list[dict[str, str]]:
-    months = _month_list(month_str, months_back)
-    summary = _aggregate_transactions(state, months)
+    """
+    Messages for one chat turn. chat_history should already be compacted with
+    compact_chat_history; chat_digest carries the turns folded out of it.
+    """
+    summary = summary_context(state, month_str, months_back)
 
     system_prompt = (
         "You are a financial coach. Use the provided summary to answer questions with clear, "
         "actionable advice grounded in the user's data."
     )
     summary_prompt = (
-        "Context summary JSON (use this as the source of truth for the user's finances):\n"
-        f"{json.dumps(summary, indent=2)}"
+        "Context summary (use this as the source of truth for the user's finances):\n"
+        f"{summary}"
     )
 
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": summary_prompt},
     ]
+    if chat_digest:
+        messages.append({"role": "system", "content": f"Digest of the earlier conversation:\n{chat_digest}"})
     messages.extend(chat_history)
     messages.append({"role": "user", "content": user_message})
     return messages
 
 
-def request_ai_insights(config: AIConfig, messages: list[dict[str, str]]) -> str:
+def _build_request(
+    config: AIConfig, messages: list[dict[str, str]], stream: bool = False
+) -> tuple[str, bytes, dict[str, str]]:
     if config.provider == "google":
         system_text = " ".join(
             message.get("content", "") for message in messages if message.get("role") == "system"
@@ -169,21 +292,26 @@ def request_ai_insights(config: AIConfig, messages: list[dict[str, str]]) -> str
 
         payload = {
             "contents": contents,
-            "generationConfig": {"temperature": 0.3},
+            "generationConfig": {"temperature": config.temperature},
         }
         if system_text:
             payload["system_instruction"] = {"parts": [{"text": system_text}]}
 
         base_url = config.api_base_url.rstrip("/")
-        request_url = f"{base_url}/models/{config.model}:generateContent?key={config.api_key}"
+        if stream:
+            request_url = f"{base_url}/models/{config.model}:streamGenerateContent?alt=sse&key={config.api_key}"
+        else:
+            request_url = f"{base_url}/models/{config.model}:generateContent?key={config.api_key}"
         request_body = json.dumps(payload).encode("utf-8")
         headers = {"Content-Type": "application/json"}
     else:
         payload = {
             "model": config.model,
             "messages": messages,
-            "temperature": 0.3,
+            "temperature": config.temperature,
         }
+        if stream:
+            payload["stream"] = True
         request_url = config.api_base_url
         request_body = json.dumps(payload).encode("utf-8")
         headers = {
@@ -191,22 +319,24 @@ def request_ai_insights(config: AIConfig, messages: list[dict[str, str]]) -> str
             "Authorization": f"Bearer {config.api_key}",
         }
 
-    request = urllib.request.Request(
-        request_url,
-        data=request_body,
-        headers=headers,
-        method="POST",
-    )
+    return request_url, request_body, headers
+
 
+def _open(request: tuple[str, bytes, dict[str, str]]):
+    """POST over a pooled keep-alive connection; 429/5xx are retried with backoff."""
+    request_url, request_body, headers = request
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8") if exc.fp else str(exc)
-        raise RuntimeError(f"API request failed ({exc.code}): {error_body}") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"API connection failed: {exc.reason}") from exc
+        response = get_default_pool().request("POST", request_url, body=request_body, headers=headers, timeout=30)
+    except OSError as exc:
+        raise RuntimeError(f"API connection failed: {exc}") from exc
+    if response.status >= 400:
+        with response:
+            error_body = response.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"API request failed ({response.status}): {error_body}")
+    return response
+
 
+def _extract_content(config: AIConfig, data: dict[str, Any]) -> str | None:
     if config.provider == "google":
         candidates = data.get("candidates", [])
         if not candidates:
@@ -221,8 +351,147 @@ def request_ai_insights(config: AIConfig, messages: list[dict[str, str]]) -> str
             raise RuntimeError("No response choices returned from the API.")
         message = choices[0].get("message", {})
         content = message.get("content")
+    return content
+
+
+def _extract_delta(config: AIConfig, data: dict[str, Any]) -> str:
+    """Text carried by one streamed event (empty for role/finish-only events)."""
+    if config.provider == "google":
+        candidates = data.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+    choices = data.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content") or ""
+
+
+def response_cache_key(config: AIConfig, messages: list[dict[str, str]]) -> str:
+    return cache_key(config.provider, config.model, messages, config.temperature, config.api_base_url)
 
+
+def _iter_lines(response) -> Iterator[bytes]:
+    try:
+        yield from response
+    except OSError as exc:
+        raise RuntimeError(f"API connection failed: {exc}") from exc
+
+
+def request_ai_insights(config: AIConfig, messages: list[dict[str, str]]) -> str:
+    with _open(_build_request(config, messages)) as response:
+        data = json.loads(response.read().decode("utf-8"))
+
+    content = _extract_content(config, data)
     if not content:
         raise RuntimeError("Empty response content returned from the API.")
 
     return content.strip()
+
+
+class AIResponseStream:
+    """
+    Text chunks of one streamed AI response, read lazily as it is iterated (see
+    stream_ai_insights). timing is this request's own connect/first-byte/total
+    metrics: set once the response headers arrive, with the total filled in when
+    the response is closed. It stays None if the request failed to connect.
+    """
+
+    def __init__(self, config: AIConfig, messages: list[dict[str, str]],
+                 cancel_event: threading.Event | None = None):
+        self.timing: RequestTiming | None = None
+        self._chunks = self._stream(config, messages, cancel_event)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._chunks
+
+    def _stream(self, config, messages, cancel_event) -> Iterator[str]:
+        with _open(_build_request(config, messages, stream=True)) as response:
+            self.timing = response.timing
+            content_type = response.headers.get("Content-Type", "")
+            if "text/event-stream" not in content_type:
+                content = _extract_content(config, json.loads(response.read().decode("utf-8")))
+                if not content:
+                    raise RuntimeError("Empty response content returned from the API.")
+                yield content
+                return
+
+            received = False
+            for raw_line in _iter_lines(response):
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue  # blank separators, comments and "event:" lines
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+                if "error" in event:
+                    raise RuntimeError(f"API stream failed: {event['error']}")
+                text = _extract_delta(config, event)
+                if text:
+                    received = True
+                    yield text
+
+        if not received:
+            raise RuntimeError("Empty response content returned from the API.")
+
+
+def stream_ai_insights(
+    config: AIConfig,
+    messages: list[dict[str, str]],
+    cancel_event: threading.Event | None = None,
+) -> AIResponseStream:
+    """
+    Yield the response text incrementally as the provider streams it: server-sent
+    events from OpenAI-compatible endpoints ("stream": true) and from Gemini's
+    streamGenerateContent. A non-streamed JSON reply is yielded as a single chunk.
+    Setting cancel_event stops reading and closes the connection. The returned
+    stream carries the request's timing.
+    """
+    return AIResponseStream(config, messages, cancel_event)
+
+
+def fan_out_ai_insights(
+    configs: list[AIConfig],
+    messages: list[dict[str, str]],
+    first_wins: bool = True,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[ProviderResult]:
+    """
+    Send the same messages to every provider concurrently and yield each result as it
+    completes, with its latency. With first_wins, the other requests are cancelled after
+    the first successful response and are not yielded. Failed providers are yielded with
+    their error instead of raising.
+    """
+    stop = threading.Event()
+
+    def run(config: AIConfig) -> ProviderResult:
+        started = time.perf_counter()
+        try:
+            content = "".join(stream_ai_insights(config, messages, stop)).strip()
+        except Exception as exc:  # any one provider's failure must not end the fan-out
+            error = str(exc) if isinstance(exc, RuntimeError) else f"{type(exc).__name__}: {exc}"
+            return ProviderResult(config, error=error, latency_ms=(time.perf_counter() - started) * 1000)
+        latency_ms = (time.perf_counter() - started) * 1000
+        if stop.is_set():
+            return ProviderResult(config, error="Cancelled.", latency_ms=latency_ms)
+        return ProviderResult(config, content=content, latency_ms=latency_ms)
+
+    executor = ThreadPoolExecutor(max_workers=max(len(configs), 1), thread_name_prefix="ai-fan-out")
+    try:
+        pending = {executor.submit(run, config) for config in configs}
+        while pending:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            for future in done:
+                result = future.result()
+                yield result
+                if first_wins and result.ok:
+                    return
+    finally:
+        # Stragglers stop at their next streamed chunk; nothing waits for them
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
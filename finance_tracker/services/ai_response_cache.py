@@ -0,0 +1,125 @@
+"""
+finance_tracker/services/ai_response_cache.py
+
+On-disk cache for AI insight responses. Entries are content-addressed by a
+hash of (provider, model, messages, temperature), expire after a TTL and are
+evicted least-recently-used once the cache grows past a size limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+CACHE_DIR_NAME = "ai_response_cache"
+
+
+def cache_key(provider: str, model: str, messages: list[dict[str, str]], temperature: float,
+              api_base_url: str = "") -> str:
+    """Hash of everything that determines the response; the API key is deliberately excluded."""
+    material = json.dumps(
+        {"provider": provider, "api_base_url": api_base_url, "model": model, "messages": messages,
+         "temperature": temperature},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    def __init__(self, directory: str | os.PathLike, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_state(cls, state) -> AIResponseCache:
+        """Cache stored next to the state's data file (override with FINANCE_AI_CACHE_DIR)."""
+        directory = os.environ.get("FINANCE_AI_CACHE_DIR") or state.data_file.parent / CACHE_DIR_NAME
+        return cls(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry ({"content", "created_at", ...}) or None if missing/expired."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._unlink(path)
+            return None
+        try:
+            os.utime(path)  # mtime doubles as the last-used time for eviction
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, content: str, **metadata: Any) -> None:
+        entry = {"content": content, "created_at": time.time(), **metadata}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            return  # A cache that cannot be written is simply a cache miss next time
+        self._evict()
+
+    def invalidate(self, key: str) -> None:
+        self._unlink(self._path(key))
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            self._unlink(path)
+
+    def _entries(self) -> list[tuple[Path, float, int]]:
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if item.name.endswith(".json"):
+                        stat = item.stat()
+                        entries.append((Path(item.path), stat.st_mtime, stat.st_size))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self) -> None:
+        """Drop entries unused for longer than the TTL, then least-recently-used ones until under max_bytes."""
+        now = time.time()
+        entries = []
+        for path, mtime, size in self._entries():
+            if now - mtime > self.ttl_seconds:
+                self._unlink(path)
+            else:
+                entries.append((mtime, size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._unlink(path)
+            total -= size
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -4,9 +4,12 @@ finance_tracker/services/asset_tracking_service.py
 Service for tracking asset snapshots and calculating net worth.
 """
 
-from datetime import datetime, date
+from datetime import date
 from dateutil.relativedelta import relativedelta
 
+from .net_worth_history import reconstruct_net_worth
+from .snapshot_series import snapshot_series
+
 def record_asset_snapshot(state, snapshot_date=None, note=""):
     """Record current asset balances as a snapshot"""
     if snapshot_date is None:
@@ -35,38 +38,19 @@ def record_asset_snapshot(state, snapshot_date=None, note=""):
     if 'asset_snapshots' not in state.budget_settings:
         state.budget_settings['asset_snapshots'] = []
 
-    # Check if snapshot for this date already exists
-    existing = [s for s in state.budget_settings['asset_snapshots'] if s['date'] == snapshot_date]
-    if existing:
-        # Update existing snapshot
-        idx = state.budget_settings['asset_snapshots'].index(existing[0])
-        state.budget_settings['asset_snapshots'][idx] = snapshot
-    else:
-        # Add new snapshot
-        state.budget_settings['asset_snapshots'].append(snapshot)
-
-    # Sort by date
-    state.budget_settings['asset_snapshots'].sort(key=lambda x: x['date'])
+    # Insert at its date, replacing an existing snapshot for the same date
+    snapshot_series(state).upsert(snapshot)
 
     return snapshot
 
 def get_asset_snapshots(state, start_date=None, end_date=None):
     """Get asset snapshots within a date range"""
-    snapshots = state.budget_settings.get('asset_snapshots', [])
-    
-    if not start_date and not end_date:
-        return snapshots
+    series = snapshot_series(state)
 
-    filtered = []
-    for snapshot in snapshots:
-        snap_date = snapshot['date']
-        if start_date and snap_date < start_date:
-            continue
-        if end_date and snap_date > end_date:
-            continue
-        filtered.append(snapshot)
+    if not start_date and not end_date:
+        return series.snapshots
 
-    return filtered
+    return series.between(start_date, end_date)
 
 def get_current_net_worth(state):
     """Calculate current net worth from current balances"""
@@ -79,48 +63,77 @@ def get_current_net_worth(state):
         bs.get('money_lent_balance', 0)
     )
 
-def get_net_worth_change(state, period_months=1):
-    """Calculate net worth change over a period"""
-    snapshots = state.budget_settings.get('asset_snapshots', [])
-    
-    if not snapshots:
-        return None, "No historical data available"
-
-    current_net_worth = get_current_net_worth(state)
-
-    # Get snapshot from period_months ago
-    target_date = (date.today() - relativedelta(months=period_months)).strftime('%Y-%m-%d')
-
-    # Find closest snapshot to target date
-    past_snapshot = None
-    for snapshot in reversed(snapshots):
-        if snapshot['date'] <= target_date:
-            past_snapshot = snapshot
-            break
+def get_net_worth_changes(state, periods):
+    """
+    Net worth change over each of several periods (in months) in one pass.
+    Returns a list of (change_data, error) pairs in the same order as periods.
+    """
+    series = snapshot_series(state)
 
-    if not past_snapshot:
-        return None, f"No data from {period_months} month(s) ago"
+    if not len(series):
+        return [(None, "No historical data available") for _ in periods]
 
-    change = current_net_worth - past_snapshot['net_worth']
-    change_pct = (change / past_snapshot['net_worth'] * 100) if past_snapshot['net_worth'] != 0 else 0
+    current_net_worth = get_current_net_worth(state)
+    today = date.today()
+    target_dates = [(today - relativedelta(months=months)).strftime('%Y-%m-%d') for months in periods]
+
+    # Closest snapshot on or before each target date, looked up together
+    past_values = series.value_at(target_dates)
+    results = []
+    for months, target_date, past in zip(periods, target_dates, past_values):
+        if past != past:  # NaN: nothing recorded that far back
+            results.append((None, f"No data from {months} month(s) ago"))
+            continue
+        past = float(past)
+        change = current_net_worth - past
+        change_pct = (change / past * 100) if past != 0 else 0
+        results.append(({
+            'current': current_net_worth,
+            'past': past,
+            'change': change,
+            'change_pct': change_pct,
+            'past_date': series.at_or_before(target_date)['date']
+        }, None))
+    return results
 
-    return {
-        'current': current_net_worth,
-        'past': past_snapshot['net_worth'],
-        'change': change,
-        'change_pct': change_pct,
-        'past_date': past_snapshot['date']
-    }, None
+def get_net_worth_change(state, period_months=1):
+    """Calculate net worth change over a period"""
+    return get_net_worth_changes(state, [period_months])[0]
+
+def get_periodic_net_worth_changes(state, frequency="monthly", method="last"):
+    """
+    Net worth at the end of each calendar month or quarter covered by the snapshots,
+    with the change from the previous period end. method is "last" (latest snapshot
+    on or before the period end) or "interpolate" (between surrounding snapshots).
+    """
+    series = snapshot_series(state)
+    labels, period_ends = series.periods(frequency)
+    if not labels:
+        return []
+
+    values = series.values_on(period_ends, method=method)
+    # Each period is compared with the end of the one before it
+    change, change_pct = series.period_change(period_ends[:-1], period_ends[1:], method=method)
+    rows = [{'period': labels[0], 'end_date': str(period_ends[0]), 'net_worth': float(values[0]),
+             'change': None, 'change_pct': None}]
+    for i in range(1, len(labels)):
+        rows.append({
+            'period': labels[i],
+            'end_date': str(period_ends[i]),
+            'net_worth': float(values[i]),
+            'change': float(change[i - 1]),
+            'change_pct': float(change_pct[i - 1]),
+        })
+    return rows
 
 def delete_snapshot(state, snapshot_date):
     """Delete a snapshot by date"""
-    snapshots = state.budget_settings.get('asset_snapshots', [])
-    state.budget_settings['asset_snapshots'] = [s for s in snapshots if s['date'] != snapshot_date]
+    snapshot_series(state).remove(snapshot_date)
     return True
 
 def generate_net_worth_report(state):
     """Generate a comprehensive net worth report"""
-    snapshots = state.budget_settings.get('asset_snapshots', [])
+    snapshots = snapshot_series(state).snapshots
     current_net_worth = get_current_net_worth(state)
 
     report = f"{'='*80}\n"
@@ -152,14 +165,49 @@ def generate_net_worth_report(state):
 
     # Calculate changes for different periods
     periods = [1, 3, 6, 12]
-    for months in periods:
-        change_data, error = get_net_worth_change(state, months)
+    for months, (change_data, error) in zip(periods, get_net_worth_changes(state, periods)):
         if change_data:
             sign = "+" if change_data['change'] >= 0 else ""
             report += f"Change over {months} month(s) (since {change_data['past_date']}):\n"
             report += f"  {sign}€{change_data['change']:,.2f} ({sign}{change_data['change_pct']:.1f}%)\n"
             report += f"  From: €{change_data['past']:,.2f} → To: €{change_data['current']:,.2f}\n\n"
 
+    # End-of-quarter values once the history spans more than one quarter
+    quarterly = get_periodic_net_worth_changes(state, "quarterly")
+    if len(quarterly) > 1:
+        report += f"Net worth at quarter end:\n"
+        report += f"{'Quarter':<10} {'Net Worth':>15} {'Change':>15} {'Change %':>10}\n"
+        for row in quarterly:
+            if row['change'] is None:
+                change_str, pct_str = "—", ""
+            else:
+                sign = "+" if row['change'] >= 0 else ""
+                change_str = f"{sign}€{row['change']:,.2f}"
+                pct_str = f"{sign}{row['change_pct']:.1f}%"
+            report += f"{row['period']:<10} €{row['net_worth']:>13,.2f} {change_str:>15} {pct_str:>10}\n"
+        report += "\n"
+
+    # Daily estimate from recorded flows, checked against each following snapshot
+    reconstruction = reconstruct_net_worth(state)
+    if reconstruction is not None:
+        report += f"{'='*80}\n"
+        report += f"SNAPSHOTS VS RECORDED FLOWS\n"
+        report += f"{'='*80}\n\n"
+        estimated_today = float(reconstruction.estimate[-1])
+        report += f"Estimated net worth today from snapshots + recorded flows: €{estimated_today:,.2f}\n"
+        report += f"Difference to current balances: €{current_net_worth - estimated_today:+,.2f}\n\n"
+        flagged = reconstruction.flagged
+        if flagged:
+            report += f"Intervals where recorded flows do not explain the next snapshot:\n"
+            report += f"{'Period':<27} {'Expected':>14} {'Actual':>14} {'Drift':>14}\n"
+            for drift in flagged:
+                period = f"{drift['from_date']} → {drift['to_date']}"
+                expected = f"€{drift['expected']:,.2f}"
+                actual = f"€{drift['actual']:,.2f}"
+                report += f"{period:<27} {expected:>14} {actual:>14} {drift['drift']:>+14,.2f}\n"
+        elif reconstruction.drifts:
+            report += "All snapshots match the recorded flows between them.\n"
+
     # Snapshot history
     report += f"\n{'='*80}\n"
     report += f"SNAPSHOT HISTORY\n"
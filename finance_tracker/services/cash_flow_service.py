@@ -0,0 +1,170 @@
+"""
+finance_tracker/services/cash_flow_service.py
+
+Day-by-day forward cash-flow projection. Base income sources and fixed costs are
+posted on their pay day in every month their date range covers, and flexible
+spending/income follow per-category weekday rates learned from recent history.
+Everything is computed as NumPy arrays over the horizon.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from .recurring_schedule import postings
+
+# 1970-01-01 was a Thursday; this shift makes Monday weekday 0
+_EPOCH_WEEKDAY = 3
+
+
+@dataclass
+class CashFlowProjection:
+    days: np.ndarray              # datetime64[D], one entry per projected day
+    income: np.ndarray            # base income posted per day
+    fixed_costs: np.ndarray       # fixed costs posted per day
+    spending: np.ndarray          # expected flexible spending per day
+    flexible_income: np.ndarray   # expected flexible (non-base) income per day
+    starting_balance: float
+    history_months: list[str] = field(default_factory=list)
+    category_spending: dict[str, float] = field(default_factory=dict)  # category -> total over horizon
+
+    @property
+    def net(self) -> np.ndarray:
+        return self.income + self.flexible_income - self.fixed_costs - self.spending
+
+    @property
+    def balance(self) -> np.ndarray:
+        """Projected total balance at the end of each day."""
+        return self.starting_balance + np.cumsum(self.net)
+
+    def monthly(self) -> tuple[list[str], dict[str, np.ndarray]]:
+        """Per-month sums of each flow plus the end-of-month balance."""
+        months = self.days.astype("datetime64[M]")
+        labels, starts = np.unique(months, return_index=True)
+        totals = {
+            name: np.add.reduceat(values, starts)
+            for name, values in (("income", self.income), ("flexible_income", self.flexible_income),
+                                 ("fixed_costs", self.fixed_costs), ("spending", self.spending),
+                                 ("net", self.net))
+        }
+        ends = np.append(starts[1:], len(self.days)) - 1
+        totals["balance"] = self.balance[ends]
+        return [str(label) for label in labels], totals
+
+    def lowest_balance(self) -> tuple[date, float]:
+        balance = self.balance
+        index = int(np.argmin(balance))
+        return self.days[index].astype(date), float(balance[index])
+
+
+def total_balance(state) -> float:
+    """Bank + wallet + savings + investments + money lent."""
+    settings = state.budget_settings
+    return sum(
+        settings.get(key, 0)
+        for key in ("bank_account_balance", "wallet_balance", "savings_balance",
+                    "investment_balance", "money_lent_balance")
+    )
+
+
+def post_schedule(entries: list[dict], days: np.ndarray) -> np.ndarray:
+    """Amount of entries posted on each of days (see recurring_schedule.postings)."""
+    posted = np.zeros(len(days))
+    if not entries or not len(days):
+        return posted
+    first_day, last_day = days[0].astype(date), days[-1].astype(date)
+    for day, amount in postings(entries, first_day, last_day):
+        posted[(day - first_day).days] += amount
+    return posted
+
+
+def _history_window(state, history_months: int, today: date) -> tuple[list[str], date, date] | None:
+    """Last history_months complete months, starting no earlier than the first transaction."""
+    first_month = min(
+        (row.get("date", "")[:7] for row in (*state.expenses, *state.incomes) if row.get("date")),
+        default=None,
+    )
+    if first_month is None:
+        return None
+    current = today.replace(day=1)
+    months = [
+        (current - relativedelta(months=offset)).strftime("%Y-%m")
+        for offset in range(history_months, 0, -1)
+    ]
+    months = [m for m in months if m >= first_month]
+    if not months:
+        return None
+    start = datetime.strptime(months[0] + "-01", "%Y-%m-%d").date()
+    return months, start, current - timedelta(days=1)
+
+
+def _weekday_rates(rows: list[dict], start: date, end: date) -> dict[str, np.ndarray]:
+    """Average amount per category for each weekday (Monday first) between start and end."""
+    window = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    weekday_counts = np.bincount((window.astype(int) + _EPOCH_WEEKDAY) % 7, minlength=7)
+    start_text, end_text = start.isoformat(), end.isoformat()
+
+    sums: dict[str, np.ndarray] = {}
+    for row in rows:
+        day = row.get("date", "")
+        if not start_text <= day[:10] <= end_text:
+            continue
+        try:
+            weekday = datetime.strptime(day[:10], "%Y-%m-%d").weekday()
+        except ValueError:
+            continue
+        category = row.get("category", "Uncategorized")
+        if category not in sums:
+            sums[category] = np.zeros(7)
+        sums[category][weekday] += float(row.get("amount", 0.0))
+    return {category: totals / np.maximum(weekday_counts, 1) for category, totals in sums.items()}
+
+
+def project_cash_flow(state, num_months: int, history_months: int = 6,
+                      today: date | None = None) -> CashFlowProjection:
+    """
+    Project each day from tomorrow to the end of the num_months-th month ahead,
+    starting from the current total balance (bank, wallet, savings, investments
+    and money lent).
+    """
+    today = today or date.today()
+    end = (today.replace(day=1) + relativedelta(months=num_months + 1)) - timedelta(days=1)
+    days = np.arange(np.datetime64(today + timedelta(days=1), "D"), np.datetime64(end, "D") + 1)
+
+    settings = state.budget_settings
+    income_sources = settings.get("monthly_income", [])
+    if isinstance(income_sources, (int, float)):
+        # Pre-migration format: one open-ended source
+        income_sources = [{"amount": income_sources}] if income_sources else []
+    income = post_schedule(income_sources, days)
+    fixed_costs = post_schedule(settings.get("fixed_costs", []), days)
+
+    weekdays = (days.astype(int) + _EPOCH_WEEKDAY) % 7
+    spending = np.zeros(len(days))
+    flexible_income = np.zeros(len(days))
+    category_spending: dict[str, float] = {}
+    history: list[str] = []
+    window = _history_window(state, history_months, today)
+    if window is not None:
+        history, start, stop = window
+        weekday_totals = np.bincount(weekdays, minlength=7)
+        for category, rates in _weekday_rates(state.expenses, start, stop).items():
+            spending += rates[weekdays]
+            category_spending[category] = float(rates @ weekday_totals)
+        for rates in _weekday_rates(state.incomes, start, stop).values():
+            flexible_income += rates[weekdays]
+
+    return CashFlowProjection(
+        days=days,
+        income=income,
+        fixed_costs=fixed_costs,
+        spending=spending,
+        flexible_income=flexible_income,
+        starting_balance=total_balance(state),
+        history_months=history,
+        category_spending=category_spending,
+    )
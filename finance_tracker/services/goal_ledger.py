@@ -0,0 +1,117 @@
+"""
+finance_tracker/services/goal_ledger.py
+
+Dated ledger of allocation changes per savings goal. Each goal keeps two parallel
+arrays under 'allocation_ledger' ({"days": [...], "amounts": [...]}): the day of a
+change as a proleptic ordinal and the signed amount added or withdrawn that day
+(same-day changes are merged). Velocities are exponentially weighted towards recent
+activity and computed for all goals in one pass over their ledgers. Ledgers hold
+one entry per allocation day, so plain Python keeps the goals report (and the
+CLI) clear of the NumPy import.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime
+
+LEDGER_KEY = "allocation_ledger"
+# Allocation activity loses half its weight after this many days
+VELOCITY_HALF_LIFE_DAYS = 90.0
+# Shortest history a velocity is measured over, so a fresh lump sum is not
+# extrapolated as a daily rate
+MIN_VELOCITY_WINDOW_DAYS = 30
+DAYS_PER_MONTH = 365.25 / 12
+
+
+def _ordinal(value: str | None, default: int) -> int:
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date().toordinal()
+    except (TypeError, ValueError):
+        return default
+
+
+def _initial_ledger(goal: dict) -> dict:
+    # Goals saved before the ledger existed start with their whole allocation on
+    # their creation date, which is what the old average-since-creation estimate assumed
+    ledger = {"days": [], "amounts": []}
+    allocated = float(goal.get("allocated_amount", 0) or 0)
+    if allocated:
+        ledger["days"].append(_ordinal(goal.get("created_date"), date.today().toordinal()))
+        ledger["amounts"].append(round(allocated, 2))
+    return ledger
+
+
+def goal_ledger(goal: dict) -> dict:
+    """The goal's ledger without modifying the goal; older goals get a derived one that is not stored."""
+    ledger = goal.get(LEDGER_KEY)
+    return ledger if ledger is not None else _initial_ledger(goal)
+
+
+def ensure_ledger(goal: dict) -> dict:
+    """Return the goal's ledger, storing the derived one first for goals that have none."""
+    ledger = goal.get(LEDGER_KEY)
+    if ledger is None:
+        ledger = goal[LEDGER_KEY] = _initial_ledger(goal)
+    return ledger
+
+
+def record_allocation(goal: dict, new_amount: float, on: date | None = None) -> float:
+    """
+    Set the goal's allocated_amount and record the change in its ledger.
+    Returns the recorded change.
+    """
+    ledger = ensure_ledger(goal)
+    change = round(float(new_amount) - float(goal.get("allocated_amount", 0) or 0), 2)
+    goal["allocated_amount"] = new_amount
+    if not change:
+        return 0.0
+    day = (on or date.today()).toordinal()
+    days, amounts = ledger["days"], ledger["amounts"]
+    if days and days[-1] == day:
+        amounts[-1] = round(amounts[-1] + change, 2)
+        if not amounts[-1]:
+            days.pop()
+            amounts.pop()
+    else:
+        days.append(day)
+        amounts.append(change)
+    return change
+
+
+def allocation_velocities(goals: list[dict], today: date | None = None,
+                          half_life_days: float = VELOCITY_HALF_LIFE_DAYS) -> list[float]:
+    """
+    Recent-weighted allocation velocity (€/month) of every goal. Each change is
+    weighted by exp(-age/tau) and divided by the decayed length of the goal's
+    history, so a steady daily rate comes out unchanged while older activity fades.
+    Goals without ledger entries get 0.
+    """
+    today_ordinal = (today or date.today()).toordinal()
+    tau = half_life_days / math.log(2)
+    velocities = []
+    for goal in goals:
+        ledger = goal_ledger(goal)
+        days, amounts = ledger["days"], ledger["amounts"]
+        if not days:
+            velocities.append(0.0)
+            continue
+        weighted = sum(amount * math.exp(-max(today_ordinal - day, 0) / tau) for day, amount in zip(days, amounts))
+        window = max(today_ordinal - min(min(days), today_ordinal), MIN_VELOCITY_WINDOW_DAYS)
+        decayed_window = tau * (1 - math.exp(-window / tau))
+        velocities.append(weighted / decayed_window * DAYS_PER_MONTH)
+    return velocities
+
+
+def allocation_activity(goals: list[dict], today: date | None = None,
+                        periods: tuple[int, ...] = (30, 90, 365)) -> dict[int, float]:
+    """Net amount allocated across all goals within the last N days, for each N in periods."""
+    today_ordinal = (today or date.today()).toordinal()
+    activity = dict.fromkeys(periods, 0.0)
+    for goal in goals:
+        ledger = goal_ledger(goal)
+        for day, amount in zip(ledger["days"], ledger["amounts"]):
+            for n in periods:
+                if day > today_ordinal - n:
+                    activity[n] += amount
+    return activity
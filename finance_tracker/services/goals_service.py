@@ -4,9 +4,18 @@ finance_tracker/services/goals_service.py
 Service for managing savings goals, including progress calculation and reports.
 """
 
+import uuid
 from datetime import date, timedelta, datetime
 from dateutil.relativedelta import relativedelta
 
+from .goal_ledger import allocation_activity, allocation_velocities, record_allocation
+
+def ensure_goal_id(goal):
+    """Give the goal a stable id if it has none yet; returns the id."""
+    if not goal.get('id'):
+        goal['id'] = uuid.uuid4().hex
+    return goal['id']
+
 def calculate_goal_progress(goal, current_savings):
     """Calculate progress for a single goal"""
     target = goal['target_amount']
@@ -21,36 +30,31 @@ def calculate_goal_progress(goal, current_savings):
         'is_complete': allocated >= target
     }
 
-def estimate_completion_date(goal):
-    """Estimate when a goal will be completed based on average monthly allocation."""
+# Forecasts further out than this are reported as out of reach (dates end at year 9999)
+MAX_FORECAST_MONTHS = 1200
+
+def estimate_completion_date(goal, velocity=None, today=None):
+    """
+    Estimate when a goal will be completed from its recent allocation velocity
+    (see goal_ledger.allocation_velocities). velocity can be passed in when it was
+    computed for all goals at once.
+    """
     remaining = goal['target_amount'] - goal.get('allocated_amount', 0)
     if remaining <= 0:
         return None, "Goal already achieved!"
 
-    created_date_str = goal.get('created_date')
-    if not created_date_str:
-        return None, "Cannot estimate without a creation date."
-
-    created_date = datetime.strptime(created_date_str, '%Y-%m-%d').date()
-    today = date.today()
-    
-    # Calculate months since creation, with a minimum of 1 to avoid division by zero
-    delta = relativedelta(today, created_date)
-    months_since_creation = delta.years * 12 + delta.months
-    if months_since_creation == 0:
-        months_since_creation = 1
-
-    allocated_amount = goal.get('allocated_amount', 0)
-    if allocated_amount <= 0:
+    today = today or date.today()
+    if goal.get('allocated_amount', 0) <= 0 and not goal.get('allocation_ledger', {}).get('days'):
         return None, "Allocate funds to estimate completion."
 
-    # Calculate average monthly savings for this goal
-    average_monthly_savings = allocated_amount / months_since_creation
-    
-    if average_monthly_savings <= 0:
-        return None, "No average monthly savings to estimate completion."
+    if velocity is None:
+        velocity = float(allocation_velocities([goal], today)[0])
+    if velocity <= 0:
+        return None, "No recent allocations to estimate completion."
 
-    months_needed = remaining / average_monthly_savings
+    months_needed = remaining / velocity
+    if months_needed > MAX_FORECAST_MONTHS:
+        return None, "Not within 100 years at the recent pace."
     
     completion_date = today + relativedelta(months=int(months_needed))
     
@@ -126,10 +130,119 @@ def validate_allocation(state, goal_index, new_amount):
         return False, f"Insufficient savings. Available: €{available:.2f}", available
     
     return True, "", available
+
+
+PRIORITY_WEIGHTS = {'High': 3, 'Medium': 2, 'Low': 1}
+# Goals without a target date are planned as if due this many months from now
+UNDATED_GOAL_MONTHS = 60
+
+def _months_until(target_date_str, today):
+    """Months (fractional) until a goal's target date; overdue goals count as one month."""
+    try:
+        target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+    except (ValueError, TypeError):
+        return None
+    delta = relativedelta(target_date, today)
+    return max(delta.years * 12 + delta.months + delta.days / 30.0, 1.0)
+
+def plan_savings_allocation(goals, total_savings, today=None):
+    """
+    Split total_savings across goals to keep goals on track for their deadlines.
+
+    This solves the linear program: minimize the priority-weighted savings still
+    required per month, sum(weight * (target - amount) / months), subject to the
+    amounts summing to at most total_savings and each amount lying between the goal's
+    optional 'min_allocation' and its 'max_allocation' (or target). With only box
+    constraints and one budget constraint the optimum is a fractional knapsack: after
+    the minimums, goals are filled in order of weight / months, so urgent and
+    high-priority goals are completed first (O(n log n)). Overdue goals count as due
+    in one month; goals without a date as due in UNDATED_GOAL_MONTHS.
+
+    Returns one dict per goal, in the same order:
+    {'goal', 'amount', 'monthly_needed', 'months', 'bound', 'explanation'} where bound is
+    'target', 'max', 'min' or None.
+    """
+    today = today or date.today()
+    plans = []
+    for position, goal in enumerate(goals):
+        target = max(float(goal.get('target_amount', 0) or 0), 0.0)
+        high = min(float(goal['max_allocation']), target) if goal.get('max_allocation') is not None else target
+        low = min(max(float(goal.get('min_allocation') or 0), 0.0), high)
+        months = _months_until(goal.get('target_date'), today)
+        weight = PRIORITY_WEIGHTS.get(goal.get('priority', 'Medium'), 2)
+        plans.append({
+            'goal': goal, 'target': target, 'low': low, 'high': high,
+            'months': months, 'dated': months is not None, 'weight': weight, 'position': position,
+            'overdue': months is not None and goal['target_date'] < today.strftime('%Y-%m-%d'),
+            # Months per unit of weight: the smaller, the more each euro lowers the objective
+            'urgency': (months if months is not None else UNDATED_GOAL_MONTHS) / weight,
+        })
+    order = sorted(plans, key=lambda p: (p['urgency'], p['position']))
+
+    remaining = max(float(total_savings), 0.0)
+    for plan in plans:
+        plan['amount'] = 0.0
+    for plan in order:
+        plan['amount'] = min(plan['low'], remaining)
+        remaining -= plan['amount']
+    for plan in order:
+        if remaining <= 0:
+            break
+        extra = min(plan['high'] - plan['amount'], remaining)
+        plan['amount'] += extra
+        remaining -= extra
+
+    for plan in plans:
+        plan['amount'] = round(plan['amount'], 2)
+    return [_explain_allocation(plan) for plan in plans]
+
+def _explain_allocation(plan):
+    amount = plan['amount']
+    goal = plan['goal']
+    left = max(plan['target'] - amount, 0)
+    months = plan['months']
+    monthly_needed = left / months if months else None
+    priority = goal.get('priority', 'Medium')
+
+    if amount >= plan['target'] > 0:
+        bound, reason = 'target', "fully funded"
+    elif amount >= plan['high'] and plan['high'] < plan['target']:
+        bound, reason = 'max', f"capped at its maximum of €{plan['high']:,.2f}"
+    elif amount <= plan['low'] and amount < plan['high']:
+        bound = 'min'
+        if plan['low'] > 0 and amount < plan['low']:
+            reason = f"minimum of €{plan['low']:,.2f} only partly covered; more urgent minimums came first"
+        elif plan['low'] > 0:
+            reason = f"held at its minimum of €{plan['low']:,.2f}; other goals are more urgent"
+        else:
+            reason = "nothing allocated; goals that are due sooner or rank higher were funded first"
+    else:
+        bound = None
+        reason = "received the savings left after more urgent goals"
+
+    if not plan['dated']:
+        timing = "no target date"
+    elif plan['overdue'] and left > 0:
+        timing = f"overdue since {goal['target_date']}, €{left:,.2f} still needed"
+    elif monthly_needed:
+        timing = f"€{monthly_needed:,.2f}/month still needed to finish by {goal['target_date']}"
+    else:
+        timing = f"due {goal['target_date']}"
+
+    return {
+        'goal': goal,
+        'amount': amount,
+        'monthly_needed': monthly_needed,
+        'months': months,
+        'bound': bound,
+        'explanation': f"{goal.get('name', '')}: €{amount:,.2f} ({priority} priority) - {reason}; {timing}.",
+    }
+
 def auto_distribute_savings(state):
     """
-    Automatically distribute available savings across goals based on priority and need
-    Returns: (success, message)
+    Automatically distribute available savings across goals based on priority and deadlines
+    (see plan_savings_allocation). Returns: (success, message) where the message explains
+    each goal's allocation.
     """
     goals = state.budget_settings.get('savings_goals', [])
     
@@ -141,39 +254,19 @@ def auto_distribute_savings(state):
     if total_savings <= 0:
         return False, "No savings available to distribute."
     
-    # Reset all allocations first
-    for goal in goals:
-        goal['allocated_amount'] = 0
-    
-    # Sort goals by priority and then by how close they are to completion
-    priority_order = {'High': 3, 'Medium': 2, 'Low': 1}
-    active_goals = [g for g in goals if g.get('allocated_amount', 0) < g['target_amount']]
-    
-    if not active_goals:
+    if not any(g['target_amount'] > 0 for g in goals):
         return False, "All goals are already complete."
     
-    # Sort by priority (high first) and then by percentage complete (higher first)
-    active_goals.sort(
-        key=lambda g: (
-            priority_order.get(g.get('priority', 'Medium'), 2),
-            g.get('allocated_amount', 0) / g['target_amount'] if g['target_amount'] > 0 else 0
-        ),
-        reverse=True
-    )
-    
-    remaining_savings = total_savings
-    
-    # First pass: try to complete goals starting with highest priority
-    for goal in active_goals:
-        if remaining_savings <= 0:
-            break
-        
-        needed = goal['target_amount'] - goal.get('allocated_amount', 0)
-        allocation = min(needed, remaining_savings)
-        goal['allocated_amount'] = goal.get('allocated_amount', 0) + allocation
-        remaining_savings -= allocation
+    allocations = plan_savings_allocation(goals, total_savings)
+    for allocation in allocations:
+        record_allocation(allocation['goal'], allocation['amount'])
     
-    return True, f"Distributed €{total_savings:.2f} across {len(active_goals)} goal(s)."
+    distributed = sum(a['amount'] for a in allocations)
+    message = f"Distributed €{distributed:.2f} across {sum(1 for a in allocations if a['amount'] > 0)} goal(s)."
+    if distributed < total_savings - 0.005:
+        message += f" €{total_savings - distributed:,.2f} stays unallocated (all goals are at their target or maximum)."
+    message += "\n\n" + "\n".join(a['explanation'] for a in allocations)
+    return True, message
 
 def generate_goals_report(state) -> str:
     """Generate a comprehensive goals report"""
@@ -195,8 +288,8 @@ def generate_goals_report(state) -> str:
     report += f"SAVINGS GOALS REPORT\n"
     report += f"{'='*80}\n\n"
     report += f"Generated: {date.today().strftime('%B %d, %Y')}\n"
-    report += f"Note: The completion estimate is based on the average monthly allocation to the goal since its creation.\n"
-    report += f"      If no funds are allocated, no estimate can be provided.\n\n"
+    report += f"Note: The completion estimate is based on each goal's recent allocation velocity\n"
+    report += f"      (allocations weighted towards the last few months). Without allocations, no estimate can be provided.\n\n"
     report += f"{'-'*80}\n\n"
     
     total_target = sum(g['target_amount'] for g in goals)
@@ -204,6 +297,12 @@ def generate_goals_report(state) -> str:
     active_goals = [g for g in goals if g.get('allocated_amount', 0) < g['target_amount']]
     completed_goals = [g for g in goals if g.get('allocated_amount', 0) >= g['target_amount']]
     
+    # One vectorized pass over every goal's ledger
+    today = date.today()
+    velocities = allocation_velocities(goals, today)
+    velocity_by_goal = {id(goal): float(v) for goal, v in zip(goals, velocities)}
+    activity = allocation_activity(goals, today)
+    
     report += f"SAVINGS SUMMARY\n"
     report += f"{'-'*80}\n"
     report += f"Total Savings Balance:        €{total_savings:>12,.2f}\n"
@@ -216,6 +315,17 @@ def generate_goals_report(state) -> str:
     report += f"Total Target Amount:          €{total_target:>12,.2f}\n"
     report += f"Overall Progress:             {(total_allocated/total_target*100) if total_target > 0 else 0:.1f}%\n\n"
     
+    report += f"ALLOCATION VELOCITY\n"
+    report += f"{'-'*80}\n"
+    for days, amount in activity.items():
+        report += f"Allocated, last {days:>3} days:    €{amount:>12,.2f}\n"
+    active_velocity = sum(velocity_by_goal[id(g)] for g in active_goals)
+    report += f"Active goals, recent pace:    €{active_velocity:>12,.2f}/month\n"
+    active_remaining = sum(g['target_amount'] - g.get('allocated_amount', 0) for g in active_goals)
+    if active_remaining > 0 and active_velocity > 0:
+        report += f"All active goals funded in:   {active_remaining / active_velocity:>12.1f} months at this pace\n"
+    report += f"\n"
+    
     if unallocated > 0:
         report += f"⚠️  You have €{unallocated:.2f} in unallocated savings.\n"
         report += f"   Consider allocating this to your goals!\n\n"
@@ -227,7 +337,7 @@ def generate_goals_report(state) -> str:
         
         for goal in active_goals:
             progress = calculate_goal_progress(goal, goal.get('allocated_amount', 0))
-            completion_date, completion_msg = estimate_completion_date(goal)
+            completion_date, completion_msg = estimate_completion_date(goal, velocity_by_goal[id(goal)], today)
             monthly_savings, monthly_savings_str = calculate_monthly_savings(goal)
     
             report += f"Goal: {goal['name']}\n"
@@ -245,6 +355,7 @@ def generate_goals_report(state) -> str:
                 if monthly_savings is not None:
                     report += f"Required Monthly:      {monthly_savings_str}\n"
     
+            report += f"Recent Pace:           €{velocity_by_goal[id(goal)]:,.2f}/month\n"
             report += f"Completion Estimate:   {completion_msg}\n"
     
             # Progress bar
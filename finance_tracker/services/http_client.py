@@ -0,0 +1,244 @@
+"""
+finance_tracker/services/http_client.py
+
+Small HTTP client with persistent keep-alive connections per host, bounded
+retries with exponential backoff on 429/5xx responses, and per-request timing
+metrics (connect, time to first byte, total) for diagnosing slow providers.
+Proxies configured the way urllib reads them (http_proxy, https_proxy, no_proxy)
+are honoured: HTTPS is tunnelled with CONNECT, plain HTTP is forwarded.
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import threading
+import time
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator
+from urllib.parse import unquote, urlsplit
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Errors raised when a kept-alive connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+def _proxy_for(scheme: str, host: str) -> tuple[str, int, str | None] | None:
+    """
+    (host, port, Proxy-Authorization value or None) of the proxy urllib would use
+    for this URL, or None for a direct connection.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    parts = urlsplit(proxy)
+    authorization = None
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        authorization = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    # Like urllib, the proxy itself is spoken to in plain HTTP
+    return parts.hostname, parts.port or 80, authorization
+
+
+@dataclass
+class RequestTiming:
+    host: str
+    status: int = 0
+    attempts: int = 0
+    reused_connection: bool = False
+    connect_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def describe(self) -> str:
+        connect = "reused connection" if self.reused_connection else f"connect {self.connect_ms:.0f} ms"
+        text = f"{self.host}: {connect}, first byte {self.ttfb_ms:.0f} ms, total {self.total_ms:.0f} ms"
+        if self.attempts > 1:
+            text += f" ({self.attempts} attempts)"
+        return text
+
+
+class PooledResponse:
+    """
+    Wraps an http.client response. Iterating yields raw lines. Closing it (or leaving
+    the with-block) returns the connection to the pool if the body was fully read and
+    the server allows keep-alive, and records the request's total time.
+    """
+
+    def __init__(self, pool: ConnectionPool, key, connection, response, timing: RequestTiming, started: float):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.timing = timing
+        self._started = started
+        self._closed = False
+        self.status = response.status
+        self.headers = response.headers
+
+    def read(self) -> bytes:
+        return self._response.read()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            line = self._response.readline()
+            if not line:
+                return
+            yield line
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+            self._connection.close()
+        self.timing.total_ms = (time.perf_counter() - self._started) * 1000
+        self._pool._release(self._key, self._connection if reusable else None, self.timing)
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by (scheme, host, port, proxy)."""
+
+    def __init__(self, max_idle_per_host: int = 4, max_retries: int = 2, backoff: float = 0.5,
+                 max_backoff: float = 8.0, history: int = 50):
+        self.max_idle_per_host = max_idle_per_host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._idle: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self.timings: deque[RequestTiming] = deque(maxlen=history)
+
+    def _acquire(self, key, timeout: float):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port, proxy = key
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout), False
+            return http.client.HTTPConnection(host, port, timeout=timeout), False
+        proxy_host, proxy_port, authorization = proxy
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout)
+            connection.set_tunnel(host, port, headers={"Proxy-Authorization": authorization} if authorization else None)
+            return connection, False
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout), False
+
+    def _release(self, key, connection, timing: RequestTiming) -> None:
+        """Record a finished request and keep its connection if it can be reused."""
+        with self._lock:
+            self.timings.append(timing)
+        if connection is not None:
+            self._keep_idle(key, connection)
+
+    def _keep_idle(self, key, connection) -> None:
+        """Return a connection to the idle list, or close it if max_idle_per_host are already kept."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def last_timing(self) -> RequestTiming | None:
+        with self._lock:
+            return self.timings[-1] if self.timings else None
+
+    def _retry_delay(self, attempt: int, response) -> float:
+        retry_after = response.getheader("Retry-After") if response is not None else None
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return min(self.backoff * (2 ** attempt), self.max_backoff)
+
+    def request(self, method: str, url: str, body: bytes | None = None,
+                headers: dict[str, str] | None = None, timeout: float = 30) -> PooledResponse:
+        """
+        Send a request over a pooled connection and return once response headers have
+        arrived. 429/5xx responses are retried up to max_retries times with exponential
+        backoff (honouring a numeric Retry-After); the last response is returned as-is.
+        Connection errors raise OSError.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = dict(headers or {})
+        proxy = _proxy_for(scheme, parts.hostname or "")
+        if proxy is not None and scheme != "https":
+            # A forwarding proxy takes the absolute URL and its credentials on every request
+            path = f"{scheme}://{parts.netloc}{path}"
+            if proxy[2]:
+                headers["Proxy-Authorization"] = proxy[2]
+        key = (scheme, parts.hostname, port, proxy)
+
+        timing = RequestTiming(host=parts.hostname or "")
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            timing.attempts += 1
+            connection, reused = self._acquire(key, timeout)
+            timing.reused_connection = reused
+            try:
+                if connection.sock is None:
+                    connect_start = time.perf_counter()
+                    connection.connect()
+                    timing.connect_ms = (time.perf_counter() - connect_start) * 1000
+                send_start = time.perf_counter()
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                timing.ttfb_ms = (time.perf_counter() - send_start) * 1000
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one
+                    timing.attempts -= 1
+                    continue
+                raise
+            except OSError:
+                connection.close()
+                raise
+            except http.client.HTTPException as exc:
+                connection.close()
+                raise OSError(str(exc)) from exc
+
+            timing.status = response.status
+            if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                return PooledResponse(self, key, connection, response, timing, started)
+            delay = self._retry_delay(attempt, response)
+            response.read()
+            if response.will_close:
+                connection.close()
+            else:
+                self._keep_idle(key, connection)
+            time.sleep(delay)
+            attempt += 1
+
+
+_default_pool = ConnectionPool()
+
+
+def get_default_pool() -> ConnectionPool:
+    return _default_pool
@@ -0,0 +1,115 @@
+"""
+finance_tracker/services/net_worth_history.py
+
+Daily net-worth estimate between recorded snapshots. Each snapshot anchors the
+series; on the days after it the recorded incomes, expenses, base income and
+fixed costs are added as a running (cumulative) sum. Where the estimate carried
+forward from one snapshot disagrees with the next real snapshot, the interval is
+flagged as drift (unrecorded spending, market moves, wrong balances). Flows are
+bucketed per day in one pass over the transactions and summed with accumulate,
+so the net-worth report runs without loading NumPy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any
+
+from .recurring_schedule import postings
+from .snapshot_series import snapshot_series
+
+# An interval is flagged when the estimate misses the next snapshot by more than
+# both of these.
+DRIFT_ABSOLUTE_THRESHOLD = 50.0
+DRIFT_RELATIVE_THRESHOLD = 0.02
+
+
+@dataclass
+class NetWorthReconstruction:
+    days: list[date]          # first snapshot date to end date
+    estimate: list[float]     # estimated net worth at the end of each day
+    flows: list[float]        # recorded net flow on each day
+    drifts: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def flagged(self) -> list[dict[str, Any]]:
+        return [d for d in self.drifts if d["flagged"]]
+
+
+def _post_transactions(rows: list[dict[str, Any]], first_day: date, sign: float, flows: list[float]) -> None:
+    # Rows share few distinct dates, so each date string is parsed once
+    offsets: dict[str, int | None] = {}
+    first_ordinal, count = first_day.toordinal(), len(flows)
+    for row in rows:
+        day = row.get("date") or ""
+        offset = offsets.get(day, -1)
+        if offset == -1:
+            try:
+                offset = date.fromisoformat(day[:10]).toordinal() - first_ordinal
+            except (TypeError, ValueError):
+                offset = None
+            if offset is not None and not 0 <= offset < count:
+                offset = None
+            offsets[day] = offset
+        if offset is not None:
+            flows[offset] += sign * float(row.get("amount", 0) or 0)
+
+
+def reconstruct_net_worth(state, end_date: date | None = None,
+                          absolute_threshold: float = DRIFT_ABSOLUTE_THRESHOLD,
+                          relative_threshold: float = DRIFT_RELATIVE_THRESHOLD) -> NetWorthReconstruction | None:
+    """
+    Estimate net worth for every day from the first snapshot to end_date (today by
+    default). A snapshot is taken to include that day's flows, so the estimate for
+    day d is the latest snapshot on or before d plus the flows after it up to d.
+    Returns None when there are no snapshots.
+    """
+    series = snapshot_series(state)
+    if not len(series):
+        return None
+    ordinals = series.ordinals()
+    values = series.values()
+    first_day = date.fromordinal(ordinals[0])
+    end = max(end_date or date.today(), date.fromordinal(ordinals[-1]))
+    days = [first_day + timedelta(days=offset) for offset in range((end - first_day).days + 1)]
+
+    settings = state.budget_settings
+    income_sources = settings.get("monthly_income", [])
+    if isinstance(income_sources, (int, float)):
+        income_sources = [{"amount": income_sources}] if income_sources else []
+    flows = [0.0] * len(days)
+    for day, amount in postings(income_sources, first_day, end):
+        flows[(day - first_day).days] += amount
+    for day, amount in postings(settings.get("fixed_costs", []), first_day, end):
+        flows[(day - first_day).days] -= amount
+    _post_transactions(state.incomes, first_day, 1.0, flows)
+    _post_transactions(state.expenses, first_day, -1.0, flows)
+    cumulative = list(accumulate(flows))
+
+    # Anchor every day on the latest snapshot at or before it
+    snapshot_index = [ordinal - ordinals[0] for ordinal in ordinals]
+    estimate = []
+    anchor = 0
+    for offset, running in enumerate(cumulative):
+        while anchor + 1 < len(snapshot_index) and snapshot_index[anchor + 1] <= offset:
+            anchor += 1
+        estimate.append(values[anchor] + running - cumulative[snapshot_index[anchor]])
+
+    # Expected value of each snapshot carried forward from the previous one
+    drifts = []
+    dates = [s["date"] for s in series.snapshots]
+    for i in range(len(values) - 1):
+        expected = values[i] + cumulative[snapshot_index[i + 1]] - cumulative[snapshot_index[i]]
+        actual = values[i + 1]
+        drift = actual - expected
+        drifts.append({
+            "from_date": dates[i],
+            "to_date": dates[i + 1],
+            "expected": expected,
+            "actual": actual,
+            "drift": drift,
+            "flagged": abs(drift) > max(absolute_threshold, relative_threshold * abs(actual)),
+        })
+    return NetWorthReconstruction(days=days, estimate=estimate, flows=flows, drifts=drifts)
@@ -4,10 +4,19 @@ finance_tracker/services/projection_service.py
 Service for generating financial projections based on current data.
 """
 
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, datetime
 
+import numpy as np
 from dateutil.relativedelta import relativedelta
 
+from .budget_calculator import get_active_fixed_costs, get_active_monthly_income
+from .cash_flow_service import project_cash_flow, total_balance
+from .snapshot_series import snapshot_series
+
+MONTE_CARLO_PATHS = 10_000
+PERCENTILES = (10, 50, 90)
+
 
 def _format_signed_euro(value: float) -> str:
     sign = "+" if value >= 0 else "-"
@@ -67,7 +76,7 @@ def _build_target_savings_projection(state, num_months: int) -> str:
 
 
 def _build_monthly_net_worth_change_projection(state, num_months: int, history_months: int) -> str:
-    snapshots = state.budget_settings.get("asset_snapshots", [])
+    snapshots = snapshot_series(state).snapshots
 
     report = f"{'='*80}\n"
     report += "FINANCIAL PROJECTION (NET WORTH TREND)\n"
@@ -142,7 +151,263 @@ def _build_monthly_net_worth_change_projection(state, num_months: int, history_m
     return report
 
 
+@dataclass
+class MonteCarloProjection:
+    months: list[str]                  # projected months, "YYYY-MM"
+    history_months: list[str]          # complete months the flows were sampled from
+    starting_balance: float
+    bands: np.ndarray                  # shape (len(PERCENTILES), len(months)) of total balances
+    scheduled_net: np.ndarray          # base income minus fixed costs for each projected month
+    paths: int
+    seasonal: bool
+    goal_probabilities: list[dict] = field(default_factory=list)
+
+
+def _history_flows(state, history_months: int, today: date):
+    """
+    Per-category flexible net flow (income positive, expenses negative) for the last
+    history_months complete months, starting no earlier than the first transaction.
+    Returns (months, categories, matrix of shape (months, categories)).
+    """
+    first_month = min(
+        (row.get("date", "")[:7] for row in (*state.expenses, *state.incomes) if row.get("date")),
+        default=None,
+    )
+    current = today.replace(day=1)
+    months = []
+    for offset in range(history_months, 0, -1):
+        month = (current - relativedelta(months=offset)).strftime("%Y-%m")
+        if first_month is not None and month >= first_month:
+            months.append(month)
+    month_index = {m: i for i, m in enumerate(months)}
+
+    categories: dict[str, int] = {}
+    cells: dict[tuple[int, int], float] = {}
+    for rows, sign, prefix in ((state.expenses, -1.0, "Expense"), (state.incomes, 1.0, "Income")):
+        for row in rows:
+            i = month_index.get(row.get("date", "")[:7])
+            if i is None:
+                continue
+            c = categories.setdefault(f"{prefix}: {row.get('category', 'Uncategorized')}", len(categories))
+            cells[i, c] = cells.get((i, c), 0.0) + sign * float(row.get("amount", 0.0))
+
+    matrix = np.zeros((len(months), len(categories)))
+    if cells:
+        index = np.array(list(cells.keys()))
+        matrix[index[:, 0], index[:, 1]] = list(cells.values())
+    return months, list(categories), matrix
+
+
+def _seasonal_offsets(months: list[str], matrix: np.ndarray) -> np.ndarray | None:
+    """
+    Additive per-category offset for each calendar month, shape (12, categories).
+    Only calendar months seen at least twice get an offset, so a single unusual
+    month is not mistaken for a seasonal pattern. None if no month qualifies.
+    """
+    calendar_month = np.array([int(m[5:7]) - 1 for m in months])
+    counts = np.bincount(calendar_month, minlength=12)
+    if not (counts >= 2).any():
+        return None
+    overall = matrix.mean(axis=0)
+    offsets = np.zeros((12, matrix.shape[1]))
+    for month in np.flatnonzero(counts >= 2):
+        offsets[month] = matrix[calendar_month == month].mean(axis=0) - overall
+    return offsets
+
+
+def _goal_probabilities(state, months: list[str], cumulative: np.ndarray) -> list[dict]:
+    """
+    Probability that unallocated savings plus the simulated cumulative net flow cover
+    every unfinished goal due up to each goal's target date (goals without a date, or
+    due after the projection, are checked at its end).
+    """
+    goals = [
+        g for g in state.budget_settings.get("savings_goals", [])
+        if g.get("allocated_amount", 0) < g.get("target_amount", 0)
+    ]
+    if not goals:
+        return []
+    settings = state.budget_settings
+    unallocated = max(
+        settings.get("savings_balance", 0) - sum(g.get("allocated_amount", 0)
+                                                 for g in settings.get("savings_goals", [])),
+        0,
+    )
+
+    def due_index(goal):
+        try:
+            due = datetime.strptime(goal.get("target_date") or "", "%Y-%m-%d").strftime("%Y-%m")
+        except ValueError:
+            return len(months) - 1, False
+        if due < months[0]:
+            return None, False
+        if due > months[-1]:
+            return len(months) - 1, False
+        return months.index(due), True
+
+    scheduled = sorted(((due_index(g), g) for g in goals), key=lambda item: (item[0][0] is None, item[0][0] or 0))
+    results = []
+    required = 0.0
+    for (index, within_horizon), goal in scheduled:
+        remaining = goal["target_amount"] - goal.get("allocated_amount", 0)
+        if index is None:
+            results.append({"name": goal.get("name", ""), "month": None, "probability": None,
+                            "required": remaining})
+            continue
+        required += remaining
+        probability = float(np.mean(unallocated + cumulative[:, index] >= required))
+        results.append({
+            "name": goal.get("name", ""),
+            "month": months[index] if within_horizon else None,
+            "probability": probability,
+            "required": required,
+        })
+    return results
+
+
+def simulate_projection(state, num_months: int, history_months: int = 12,
+                        paths: int = MONTE_CARLO_PATHS, seed: int | None = None,
+                        today: date | None = None) -> MonteCarloProjection | None:
+    """
+    Monte Carlo projection of the total balance for the months after the current one.
+    Each path draws every category's flexible flow for a projected month from a random
+    historical month of that category (plus the category's seasonal offset for that
+    calendar month, when the history shows one). Scheduled base income and fixed costs
+    are added exactly for each projected month. Returns None without history.
+    """
+    today = today or date.today()
+    history, _, matrix = _history_flows(state, history_months, today)
+    if not history:
+        return None
+
+    start = today.replace(day=1)
+    months = [(start + relativedelta(months=i)).strftime("%Y-%m") for i in range(1, num_months + 1)]
+    scheduled = np.array([
+        get_active_monthly_income(state, m) - sum(fc.get("amount", 0) for fc in get_active_fixed_costs(state, m))
+        for m in months
+    ], dtype=float)
+
+    offsets = _seasonal_offsets(history, matrix)
+    residuals = matrix
+    seasonal_net = np.zeros(num_months)
+    if offsets is not None:
+        history_calendar = [int(m[5:7]) - 1 for m in history]
+        residuals = matrix - offsets[history_calendar]
+        seasonal_net = offsets[[int(m[5:7]) - 1 for m in months]].sum(axis=1)
+
+    rng = np.random.default_rng(seed)
+    flows = np.zeros((paths, num_months))
+    # One category at a time keeps memory at paths x months regardless of category count.
+    # Every column draws, so the same seed gives comparable paths across scenarios.
+    for column in residuals.T:
+        flows += column[rng.integers(0, len(history), size=(paths, num_months))]
+    flows += scheduled + seasonal_net
+
+    cumulative = np.cumsum(flows, axis=1)
+    starting_balance = total_balance(state)
+    bands = starting_balance + np.percentile(cumulative, PERCENTILES, axis=0)
+    return MonteCarloProjection(
+        months=months,
+        history_months=history,
+        starting_balance=starting_balance,
+        bands=bands,
+        scheduled_net=scheduled,
+        paths=paths,
+        seasonal=offsets is not None,
+        goal_probabilities=_goal_probabilities(state, months, cumulative),
+    )
+
+
+def _build_monte_carlo_projection(state, num_months: int, history_months: int) -> str:
+    report = f"{'='*80}\n"
+    report += "FINANCIAL PROJECTION (MONTE CARLO SIMULATION)\n"
+    report += f"{'='*80}\n\n"
+    report += (
+        "This report simulates your total balance many times by resampling each category's\n"
+        "monthly income and spending from your history. Scheduled base income and fixed\n"
+        "costs are applied as configured. Bands show the 10th, 50th and 90th percentiles.\n\n"
+    )
+
+    projection = simulate_projection(state, num_months, history_months)
+    if projection is None:
+        report += "No transaction history in the months to analyze.\n"
+        report += "Record some income and expenses (or analyze more months) and try again.\n"
+        return report
+
+    history = projection.history_months
+    report += f"Simulated paths: {projection.paths:,}\n"
+    report += f"History used: {history[0]} to {history[-1]} ({len(history)} months)\n"
+    report += f"Seasonality: {'applied' if projection.seasonal else 'not applied (needs repeated calendar months)'}\n"
+    report += f"Total Starting Balance: €{projection.starting_balance:,.2f}\n"
+    report += f"{'-'*80}\n"
+    report += f"{'Month':<12} {'P10':>16} {'P50 (median)':>16} {'P90':>16}\n"
+    report += f"{'-'*80}\n"
+    for i, month in enumerate(projection.months):
+        p10, p50, p90 = projection.bands[:, i]
+        report += f"{month:<12} {f'€{p10:,.2f}':>16} {f'€{p50:,.2f}':>16} {f'€{p90:,.2f}':>16}\n"
+    report += f"{'-'*80}\n"
+
+    if projection.goal_probabilities:
+        report += "\nGOAL PROBABILITIES\n"
+        report += "Chance that unallocated savings plus projected net flow cover each goal and\n"
+        report += "every goal due before it.\n"
+        report += f"{'-'*80}\n"
+        for goal in projection.goal_probabilities:
+            if goal["probability"] is None:
+                report += f"{goal['name']:<30} target date has passed\n"
+                continue
+            due = f"by {goal['month']}" if goal["month"] else "by end of projection"
+            report += f"{goal['name']:<30} {due:<24} {goal['probability']:>6.1%}\n"
+        report += f"{'-'*80}\n"
+    return report
+
+
+def _build_cash_flow_projection(state, num_months: int, history_months: int) -> str:
+    projection = project_cash_flow(state, num_months, history_months)
+    months, totals = projection.monthly()
+
+    report = f"{'='*80}\n"
+    report += "FINANCIAL PROJECTION (DAILY CASH FLOW)\n"
+    report += f"{'='*80}\n\n"
+    report += (
+        "This report walks every future day. Base income and fixed costs are paid on their\n"
+        "start day each month within their date ranges; flexible spending and income follow\n"
+        "your average per category and weekday over the months analyzed.\n\n"
+    )
+    if projection.history_months:
+        history = projection.history_months
+        report += f"History used: {history[0]} to {history[-1]} ({len(history)} months)\n"
+    else:
+        report += "History used: none (no transactions recorded yet; flexible flows assumed zero)\n"
+    report += f"Total Starting Balance: €{projection.starting_balance:,.2f}\n"
+    if len(projection.days):
+        low_day, low_balance = projection.lowest_balance()
+        report += f"Lowest projected balance: €{low_balance:,.2f} on {low_day.isoformat()}\n"
+    report += f"{'-'*80}\n"
+    report += (f"{'Month':<9} {'Base Income':>12} {'Flex Income':>12} {'Fixed Costs':>12} "
+               f"{'Spending':>12} {'Net':>13} {'End Balance':>14}\n")
+    report += f"{'-'*80}\n"
+    for i, month in enumerate(months):
+        end_balance = f"€{totals['balance'][i]:,.2f}"
+        report += (
+            f"{month:<9} {totals['income'][i]:>12,.2f} {totals['flexible_income'][i]:>12,.2f} "
+            f"{totals['fixed_costs'][i]:>12,.2f} {totals['spending'][i]:>12,.2f} "
+            f"{_format_signed_euro(totals['net'][i]):>13} {end_balance:>14}\n"
+        )
+    report += f"{'-'*80}\n"
+
+    if projection.category_spending:
+        report += "\nEXPECTED SPENDING BY CATEGORY (WHOLE PROJECTION)\n"
+        for category, amount in sorted(projection.category_spending.items(), key=lambda item: -item[1]):
+            report += f"{category:<30} €{amount:>12,.2f}\n"
+    return report
+
+
 def projection_text(state, num_months: int, mode: str = "target_savings", history_months: int = 6) -> str:
+    if mode == "cash_flow":
+        return _build_cash_flow_projection(state, num_months, history_months)
+    if mode == "monte_carlo":
+        return _build_monte_carlo_projection(state, num_months, history_months)
     if mode == "net_worth_change":
         return _build_monthly_net_worth_change_projection(state, num_months, history_months)
     return _build_target_savings_projection(state, num_months)
@@ -0,0 +1,40 @@
+"""
+finance_tracker/services/recurring_schedule.py
+
+Posting days of recurring entries (base income sources and fixed costs). Each
+entry is posted once in every month its [start_date, end_date] range overlaps,
+on the day of month it started (clamped to the month and the range), matching
+how get_active_fixed_costs/get_active_monthly_income count months. Plain Python,
+so report paths that only need a few years of postings do not load NumPy.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date, datetime
+from typing import Iterator
+
+DEFAULT_START = date(2000, 1, 1)
+
+
+def _parse_date(value, default: date) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return default
+
+
+def postings(entries: list[dict], first_day: date, last_day: date) -> Iterator[tuple[date, float]]:
+    """(day, amount) of every posting of entries from first_day to last_day inclusive."""
+    for entry in entries:
+        start = _parse_date(entry.get("start_date"), DEFAULT_START)
+        end = _parse_date(entry.get("end_date"), date.max)
+        amount = float(entry.get("amount", 0))
+        year, month = first_day.year, first_day.month
+        while (year, month) <= (last_day.year, last_day.month):
+            length = calendar.monthrange(year, month)[1]
+            if start <= date(year, month, length) and end >= date(year, month, 1):
+                day = min(max(date(year, month, min(start.day, length)), start), end)
+                if first_day <= day <= last_day:
+                    yield day, amount
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
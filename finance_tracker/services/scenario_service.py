@@ -0,0 +1,318 @@
+"""
+finance_tracker/services/scenario_service.py
+
+What-if scenarios on top of the Monte Carlo projection. Each scenario is a list of
+overrides (fixed costs, income sources, category spending/budgets, savings goals)
+applied to an immutable snapshot of the state; scenarios are projected in parallel
+on a process pool and returned as a comparison table plus chart data.
+"""
+
+from __future__ import annotations
+
+import calendar
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+
+from .budget_calculator import compute_net_available_for_spending
+from .projection_service import MONTE_CARLO_PATHS, PERCENTILES, simulate_projection
+
+BASELINE_NAME = "Current plan"
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """
+    Read-only copy of the data a projection needs. It exposes the same attributes the
+    services read from AppState, can be pickled to worker processes, and is never
+    mutated: overrides always produce a new snapshot.
+    """
+    expenses: tuple
+    incomes: tuple
+    budget_settings: dict
+    categories: dict
+
+    @classmethod
+    def from_state(cls, state) -> StateSnapshot:
+        return cls(
+            expenses=tuple(copy.deepcopy(state.expenses)),
+            incomes=tuple(copy.deepcopy(state.incomes)),
+            budget_settings=copy.deepcopy(state.budget_settings),
+            categories=copy.deepcopy(getattr(state, "categories", {})),
+        )
+
+
+def _month_start(month: str) -> str:
+    return f"{month}-01"
+
+
+def _month_end(month: str) -> str:
+    year, month_number = map(int, month.split("-"))
+    return f"{month}-{calendar.monthrange(year, month_number)[1]:02d}"
+
+
+def _previous_month_end(month: str) -> str:
+    previous = datetime.strptime(_month_start(month), "%Y-%m-%d").date() - relativedelta(months=1)
+    return _month_end(previous.strftime("%Y-%m"))
+
+
+def _description(entry: dict[str, Any]) -> str:
+    # Fixed costs are stored with 'desc', income sources with 'description'
+    return entry.get("desc", entry.get("description", ""))
+
+
+@dataclass(frozen=True)
+class _ScheduleChange:
+    """
+    Change a dated fixed cost or income source matched by description (case-insensitive).
+    percent scales the amount and amount replaces it, from start_month onwards (the
+    existing entry is split at that month) or for its whole range without start_month.
+    end_month ends the entry after that month. If nothing matches and amount is given,
+    a new entry is added from start_month (or the current month).
+    """
+    description: str
+    percent: float = 0.0
+    amount: float | None = None
+    start_month: str | None = None
+    end_month: str | None = None
+
+    settings_key = ""
+    description_key = ""
+
+    def _new_amount(self, amount: float) -> float:
+        if self.amount is not None:
+            return float(self.amount)
+        return amount * (1 + self.percent / 100.0)
+
+    def apply(self, settings: dict, expenses: list, incomes: tuple) -> None:
+        entries = settings.get(self.settings_key)
+        if not isinstance(entries, list):
+            entries = settings[self.settings_key] = []
+        wanted = self.description.strip().lower()
+        matches = [e for e in entries if _description(e).strip().lower() == wanted]
+        if not matches:
+            if self.amount is not None:
+                start = self.start_month or date.today().strftime("%Y-%m")
+                entries.append({
+                    self.description_key: self.description,
+                    "amount": float(self.amount),
+                    "start_date": _month_start(start),
+                    "end_date": _month_end(self.end_month) if self.end_month else None,
+                })
+            return
+
+        changes_amount = self.amount is not None or self.percent != 0
+        for entry in matches:
+            if changes_amount:
+                if self.start_month and entry.get("start_date", "2000-01-01") < _month_start(self.start_month):
+                    if entry.get("end_date") is None or entry["end_date"] >= _month_start(self.start_month):
+                        changed = dict(entry, start_date=_month_start(self.start_month),
+                                       amount=self._new_amount(entry.get("amount", 0)))
+                        entry["end_date"] = _previous_month_end(self.start_month)
+                        entries.append(changed)
+                else:
+                    entry["amount"] = self._new_amount(entry.get("amount", 0))
+        if self.end_month:
+            end = _month_end(self.end_month)
+            for entry in entries:
+                if _description(entry).strip().lower() == wanted and (
+                        entry.get("end_date") is None or entry["end_date"] > end):
+                    entry["end_date"] = end
+
+
+@dataclass(frozen=True)
+class FixedCostChange(_ScheduleChange):
+    settings_key = "fixed_costs"
+    description_key = "desc"
+
+
+@dataclass(frozen=True)
+class IncomeChange(_ScheduleChange):
+    settings_key = "monthly_income"
+    description_key = "description"
+
+
+@dataclass(frozen=True)
+class CategoryChange:
+    """
+    Scale spending in an expense category by percent, and/or set its budget share
+    (percent of net available for spending, as on the Budgets tab) and cap each
+    month's spending in the category at that budget.
+    """
+    category: str
+    percent: float = 0.0
+    budget_pct: float | None = None
+
+    def apply(self, settings: dict, expenses: list, incomes: tuple) -> None:
+        factor = 1 + self.percent / 100.0
+        if factor != 1:
+            for i, row in enumerate(expenses):
+                if row.get("category") == self.category:
+                    expenses[i] = dict(row, amount=float(row.get("amount", 0)) * factor)
+        if self.budget_pct is None:
+            return
+        settings.setdefault("category_budgets", {}).setdefault("Expense", {})[self.category] = self.budget_pct
+
+        # Cap per month by scaling that month's rows in the category down to the budget
+        spent: dict[str, float] = {}
+        for row in expenses:
+            if row.get("category") == self.category:
+                month = row.get("date", "")[:7]
+                spent[month] = spent.get(month, 0.0) + float(row.get("amount", 0))
+        view = StateSnapshot(tuple(expenses), incomes, settings, {})
+        scale = {}
+        for month, total in spent.items():
+            limit = self.budget_pct / 100.0 * compute_net_available_for_spending(view, month)
+            if total > limit:
+                scale[month] = limit / total if total else 0.0
+        for i, row in enumerate(expenses):
+            month_scale = scale.get(row.get("date", "")[:7])
+            if month_scale is not None and row.get("category") == self.category:
+                expenses[i] = dict(row, amount=float(row.get("amount", 0)) * month_scale)
+
+
+@dataclass(frozen=True)
+class GoalChange:
+    """Change a savings goal's target amount, target date or current allocation."""
+    name: str
+    target_amount: float | None = None
+    target_date: str | None = None
+    allocated_amount: float | None = None
+
+    def apply(self, settings: dict, expenses: list, incomes: tuple) -> None:
+        for goal in settings.get("savings_goals", []):
+            if goal.get("name") != self.name:
+                continue
+            if self.target_amount is not None:
+                goal["target_amount"] = float(self.target_amount)
+            if self.target_date is not None:
+                goal["target_date"] = self.target_date
+            if self.allocated_amount is not None:
+                goal["allocated_amount"] = float(self.allocated_amount)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    overrides: tuple = ()
+
+    def apply(self, snapshot: StateSnapshot) -> StateSnapshot:
+        if not self.overrides:
+            return snapshot
+        settings = copy.deepcopy(snapshot.budget_settings)
+        expenses = list(snapshot.expenses)
+        for override in self.overrides:
+            override.apply(settings, expenses, snapshot.incomes)
+        return StateSnapshot(tuple(expenses), snapshot.incomes, settings, snapshot.categories)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    months: list[str]
+    bands: list[list[float]]  # one list per percentile in PERCENTILES
+    goal_probabilities: list[dict] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def median(self) -> list[float]:
+        return self.bands[PERCENTILES.index(50)] if self.bands else []
+
+
+def _evaluate_scenario(task) -> ScenarioResult:
+    """Worker entry point; module-level so it can be pickled to a process pool."""
+    snapshot, scenario, num_months, history_months, paths, seed, today = task
+    try:
+        projection = simulate_projection(scenario.apply(snapshot), num_months, history_months,
+                                         paths=paths, seed=seed, today=today)
+    except (ValueError, KeyError, TypeError) as exc:
+        return ScenarioResult(scenario.name, [], [], error=str(exc))
+    if projection is None:
+        return ScenarioResult(scenario.name, [], [], error="No transaction history to project from.")
+    return ScenarioResult(
+        name=scenario.name,
+        months=projection.months,
+        bands=projection.bands.tolist(),
+        goal_probabilities=projection.goal_probabilities,
+    )
+
+
+@dataclass
+class ScenarioComparison:
+    results: list[ScenarioResult]
+
+    def chart_data(self) -> dict[str, Any]:
+        """Month labels plus P10/P50/P90 series per scenario, ready for a band chart."""
+        months = next((r.months for r in self.results if r.months), [])
+        return {
+            "months": months,
+            "scenarios": [
+                {"name": r.name, **{f"p{p}": r.bands[i] if r.bands else [] for i, p in enumerate(PERCENTILES)}}
+                for r in self.results
+            ],
+        }
+
+    def table(self) -> str:
+        """Month-by-month median balance per scenario, end-of-projection bands and goal odds."""
+        ok = [r for r in self.results if not r.error]
+        report = f"{'='*80}\n"
+        report += "SCENARIO COMPARISON (MONTE CARLO MEDIAN BALANCE)\n"
+        report += f"{'='*80}\n\n"
+        for r in self.results:
+            if r.error:
+                report += f"{r.name}: {r.error}\n"
+        if not ok:
+            return report
+
+        width = max(14, *(len(r.name) + 2 for r in ok))
+        report += f"{'Month':<10}" + "".join(f"{r.name:>{width}}" for r in ok) + "\n"
+        report += f"{'-'*(10 + width * len(ok))}\n"
+        for i, month in enumerate(ok[0].months):
+            report += f"{month:<10}" + "".join(f"{f'€{r.median[i]:,.0f}':>{width}}" for r in ok) + "\n"
+        report += f"{'-'*(10 + width * len(ok))}\n\n"
+
+        baseline = ok[0].median[-1]
+        report += f"{'Scenario':<24} {'P10':>14} {'P50':>14} {'P90':>14} {'vs ' + ok[0].name:>18}\n"
+        for r in ok:
+            p10, p50, p90 = (band[-1] for band in r.bands)
+            diff = p50 - baseline
+            report += (f"{r.name:<24} {f'€{p10:,.0f}':>14} {f'€{p50:,.0f}':>14} {f'€{p90:,.0f}':>14} "
+                       f"{f'{diff:+,.0f}':>18}\n")
+
+        goal_names = [g["name"] for g in ok[0].goal_probabilities if g["probability"] is not None]
+        if goal_names:
+            report += "\nGOAL PROBABILITIES\n"
+            report += f"{'Goal':<24}" + "".join(f"{r.name:>{width}}" for r in ok) + "\n"
+            for name in goal_names:
+                row = f"{name:<24}"
+                for r in ok:
+                    probability = next((g["probability"] for g in r.goal_probabilities if g["name"] == name), None)
+                    row += f"{'-' if probability is None else f'{probability:.0%}':>{width}}"
+                report += row + "\n"
+        return report
+
+
+def compare_scenarios(state, scenarios: list[Scenario], num_months: int = 12, history_months: int = 12,
+                      paths: int = MONTE_CARLO_PATHS, seed: int = 0, include_baseline: bool = True,
+                      max_workers: int | None = None) -> ScenarioComparison:
+    """
+    Project each scenario (plus the unchanged baseline first) on one snapshot of state.
+    All scenarios share the random seed, so differences come from the overrides rather
+    than sampling noise. With more than one scenario they run on a process pool.
+    """
+    snapshot = StateSnapshot.from_state(state)
+    if include_baseline:
+        scenarios = [Scenario(BASELINE_NAME), *scenarios]
+    today = date.today()
+    tasks = [(snapshot, scenario, num_months, history_months, paths, seed, today) for scenario in scenarios]
+
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return ScenarioComparison([_evaluate_scenario(task) for task in tasks])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return ScenarioComparison(list(executor.map(_evaluate_scenario, tasks)))
@@ -0,0 +1,229 @@
+"""
+finance_tracker/services/search_index.py
+
+Inverted token/trigram index over transaction descriptions and categories.
+Supports case-insensitive substring and word-prefix queries plus ranked
+autocomplete, and is kept current by adding/removing single records.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+from typing import Any, Callable, Iterable
+
+SEARCH_FIELDS = ("description", "category")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text))
+
+
+class _FieldIndex:
+    """
+    Postings for one text field. Records are grouped by their distinct value, so
+    trigram and token postings grow with the number of distinct strings rather
+    than with the number of transactions.
+    """
+
+    def __init__(self):
+        self.docs: dict[str, set[int]] = {}        # value -> record keys
+        self.normalized: dict[str, str] = {}       # value -> lowercased value
+        self.trigrams: dict[str, set[str]] = {}    # trigram -> values
+        self.tokens: dict[str, set[str]] = {}      # token -> values
+        self._sorted_tokens: list[str] | None = None
+
+    def add(self, value: str, key: int) -> None:
+        docs = self.docs.get(value)
+        if docs is None:
+            docs = self.docs[value] = set()
+            text = value.lower()
+            self.normalized[value] = text
+            for gram in _trigrams(text):
+                self.trigrams.setdefault(gram, set()).add(value)
+            for token in _tokens(text):
+                if token not in self.tokens:
+                    self._sorted_tokens = None
+                self.tokens.setdefault(token, set()).add(value)
+        docs.add(key)
+
+    def discard(self, value: str, key: int) -> None:
+        docs = self.docs.get(value)
+        if docs is None:
+            return
+        docs.discard(key)
+        if docs:
+            return
+        del self.docs[value]
+        text = self.normalized.pop(value)
+        for gram in _trigrams(text):
+            self._drop(self.trigrams, gram, value)
+        for token in _tokens(text):
+            if self._drop(self.tokens, token, value):
+                self._sorted_tokens = None
+
+    @staticmethod
+    def _drop(postings: dict[str, set[str]], term: str, value: str) -> bool:
+        """Remove value from a posting list; return True if the term disappeared."""
+        values = postings.get(term)
+        if values is None:
+            return False
+        values.discard(value)
+        if values:
+            return False
+        del postings[term]
+        return True
+
+    def values_containing(self, query: str) -> list[str]:
+        """Distinct values containing query (already lowercased)."""
+        normalized = self.normalized
+        if len(query) < 3:
+            return [value for value, text in normalized.items() if query in text]
+        postings = []
+        for gram in _trigrams(query):
+            values = self.trigrams.get(gram)
+            if not values:
+                return []
+            postings.append(values)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        # Trigrams can match out of order, so confirm the actual substring
+        return [value for value in candidates if query in normalized[value]]
+
+    def values_with_token_prefix(self, prefix: str) -> set[str]:
+        """Distinct values containing a word that starts with prefix (already lowercased)."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self.tokens)
+        tokens = self._sorted_tokens
+        result: set[str] = set()
+        position = bisect.bisect_left(tokens, prefix)
+        while position < len(tokens) and tokens[position].startswith(prefix):
+            result |= self.tokens[tokens[position]]
+            position += 1
+        return result
+
+
+class TransactionSearchIndex:
+    """
+    Search index over transaction records (the dicts stored in AppState.expenses and
+    AppState.incomes). Records are keyed by identity, matching how the transaction
+    view keys its rows, so rows without an id are indexed too.
+
+    `source` returns the records to index. The index is built from it on the first
+    query after construction or invalidate(), and maintained by add()/remove() after.
+    """
+
+    def __init__(self, source: Callable[[], Iterable[dict[str, Any]]]):
+        self._source = source
+        self._fields = {name: _FieldIndex() for name in SEARCH_FIELDS}
+        self._indexed: dict[int, tuple[str, ...]] = {}  # record key -> indexed values
+        self._stale = True
+
+    @staticmethod
+    def key(record: dict[str, Any]) -> int:
+        return id(record)
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt from the source on the next query."""
+        self._fields = {name: _FieldIndex() for name in SEARCH_FIELDS}
+        self._indexed = {}
+        self._stale = True
+
+    def _ensure_built(self) -> None:
+        if not self._stale:
+            return
+        self._stale = False
+        for record in self._source():
+            self.add(record)
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Index a record, replacing whatever was indexed for it before."""
+        if self._stale:
+            return
+        key = self.key(record)
+        values = tuple(str(record.get(name) or "") for name in SEARCH_FIELDS)
+        old_values = self._indexed.get(key)
+        if old_values == values:
+            return
+        if old_values is not None:
+            self.remove(record)
+        self._indexed[key] = values
+        for name, value in zip(SEARCH_FIELDS, values):
+            if value:
+                self._fields[name].add(value, key)
+
+    def remove(self, record: dict[str, Any]) -> None:
+        if self._stale:
+            return
+        key = self.key(record)
+        values = self._indexed.pop(key, None)
+        if values is None:
+            return
+        for name, value in zip(SEARCH_FIELDS, values):
+            if value:
+                self._fields[name].discard(value, key)
+
+    def search(self, field: str, text: str) -> set[int]:
+        """Keys of records whose field contains text, case-insensitively."""
+        self._ensure_built()
+        index = self._fields[field]
+        query = text.strip().lower()
+        if not query:
+            return set(self._indexed)
+        keys: set[int] = set()
+        for value in index.values_containing(query):
+            keys |= index.docs[value]
+        return keys
+
+    def search_prefix(self, field: str, prefix: str) -> set[int]:
+        """Keys of records whose field has a word starting with prefix."""
+        self._ensure_built()
+        index = self._fields[field]
+        query = prefix.strip().lower()
+        keys: set[int] = set()
+        for value in index.values_with_token_prefix(query):
+            keys |= index.docs[value]
+        return keys
+
+    def suggest(self, field: str, text: str, limit: int = 10,
+                weights: dict[str, int] | None = None) -> list[str]:
+        """
+        Rank distinct values of field for autocomplete. Values starting with text come
+        first, then values with a word starting with it, then other substring matches;
+        ties are broken by weight (transaction count unless weights is given) and then
+        alphabetically. With weights, only values present in weights are suggested.
+        """
+        self._ensure_built()
+        index = self._fields[field]
+        query = text.strip().lower()
+        if query:
+            candidates = index.values_containing(query)
+            word_matches = index.values_with_token_prefix(query)
+        else:
+            candidates = list(index.docs)
+            word_matches = set()
+        if weights is not None:
+            candidates = [value for value in candidates if value in weights]
+            weight = weights.get
+        else:
+            weight = lambda value: len(index.docs[value])
+        normalized = index.normalized
+
+        def rank(value):
+            text_value = normalized[value]
+            if text_value.startswith(query):
+                tier = 0
+            elif value in word_matches:
+                tier = 1
+            else:
+                tier = 2
+            return (tier, -weight(value), text_value)
+
+        return heapq.nsmallest(limit, candidates, key=rank)
@@ -0,0 +1,207 @@
+"""
+finance_tracker/services/snapshot_series.py
+
+Date-sorted series over the asset snapshots stored in budget_settings, with
+bisect-based insert and lookup, monthly/quarterly resampling and batched
+period-over-period changes. Series hold one point per recorded snapshot, so the
+columns are plain arrays and the lookups bisect; loading NumPy would cost more
+than every query a report makes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import weakref
+from array import array
+from datetime import date
+from typing import Any, Iterable
+
+RESAMPLE_FREQUENCIES = ("monthly", "quarterly")
+RESAMPLE_METHODS = ("last", "interpolate")
+
+# state -> SnapshotSeries over its current asset_snapshots list
+_series_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class SnapshotSeries:
+    """
+    Wraps the list of snapshot dicts (it stays the persisted list and is kept sorted
+    by date in place) together with a parallel list of dates for bisect lookups.
+    Day ordinals and numeric columns are materialized as arrays on first use and
+    dropped again whenever a snapshot is inserted, replaced or removed.
+    """
+
+    def __init__(self, snapshots: list[dict[str, Any]]):
+        self.snapshots = snapshots
+        dates = [s["date"] for s in snapshots]
+        if any(a > b for a, b in zip(dates, dates[1:])):
+            snapshots.sort(key=lambda s: s["date"])
+            dates = [s["date"] for s in snapshots]
+        self._dates = dates
+        self._columns: dict[str, array] = {}
+        self._ordinals: array | None = None
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def _changed(self) -> None:
+        self._columns = {}
+        self._ordinals = None
+
+    def upsert(self, snapshot: dict[str, Any]) -> None:
+        """Insert a snapshot at its date, replacing any snapshot with the same date."""
+        position = bisect.bisect_left(self._dates, snapshot["date"])
+        if position < len(self._dates) and self._dates[position] == snapshot["date"]:
+            self.snapshots[position] = snapshot
+        else:
+            self._dates.insert(position, snapshot["date"])
+            self.snapshots.insert(position, snapshot)
+        self._changed()
+
+    def remove(self, snapshot_date: str) -> bool:
+        start = bisect.bisect_left(self._dates, snapshot_date)
+        end = bisect.bisect_right(self._dates, snapshot_date)
+        if start == end:
+            return False
+        del self._dates[start:end]
+        del self.snapshots[start:end]
+        self._changed()
+        return True
+
+    def at_or_before(self, snapshot_date: str) -> dict[str, Any] | None:
+        """Latest snapshot dated on or before snapshot_date (YYYY-MM-DD)."""
+        position = bisect.bisect_right(self._dates, snapshot_date)
+        return self.snapshots[position - 1] if position else None
+
+    def between(self, start_date: str | None = None, end_date: str | None = None) -> list[dict[str, Any]]:
+        start = bisect.bisect_left(self._dates, start_date) if start_date else 0
+        end = bisect.bisect_right(self._dates, end_date) if end_date else len(self._dates)
+        return self.snapshots[start:end]
+
+    def ordinals(self) -> array:
+        """Snapshot dates as proleptic day ordinals."""
+        if self._ordinals is None:
+            self._ordinals = array("l", (_ordinal(d) for d in self._dates))
+        return self._ordinals
+
+    def values(self, field: str = "net_worth") -> array:
+        column = self._columns.get(field)
+        if column is None:
+            column = array("d", (float(s.get(field, 0) or 0) for s in self.snapshots))
+            self._columns[field] = column
+        return column
+
+    def value_at(self, dates: Iterable[str | date], field: str = "net_worth") -> list[float]:
+        """Value of the latest snapshot on or before each date; NaN where none exists."""
+        ordinals, values = self.ordinals(), self.values(field)
+        result = []
+        for target in dates:
+            position = bisect.bisect_right(ordinals, _ordinal(target)) - 1
+            result.append(values[position] if position >= 0 else math.nan)
+        return result
+
+    def interpolated_at(self, dates: Iterable[str | date], field: str = "net_worth") -> list[float]:
+        """
+        Value on each date linearly interpolated between the surrounding snapshots and
+        held flat after the last one; NaN before the first snapshot.
+        """
+        ordinals, values = self.ordinals(), self.values(field)
+        result = []
+        for target in dates:
+            day = _ordinal(target)
+            position = bisect.bisect_right(ordinals, day)
+            if not position:
+                result.append(math.nan)
+            elif position == len(ordinals) or ordinals[position - 1] == day:
+                result.append(values[position - 1])
+            else:
+                before, after = ordinals[position - 1], ordinals[position]
+                weight = (day - before) / (after - before)
+                result.append(values[position - 1] + (values[position] - values[position - 1]) * weight)
+        return result
+
+    def values_on(self, dates, field: str = "net_worth", method: str = "last") -> list[float]:
+        """Value on each date as value_at ("last") or interpolated_at ("interpolate") gives it."""
+        if method not in RESAMPLE_METHODS:
+            raise ValueError(f"Unknown resample method: {method}")
+        if method == "last":
+            return self.value_at(dates, field)
+        return self.interpolated_at(dates, field)
+
+    def period_change(self, start_dates, end_dates, field: str = "net_worth",
+                      method: str = "last") -> tuple[list[float], list[float]]:
+        """
+        Change in field between pairs of dates, valued by method (see resample).
+        Returns (change, change_pct) lists; pct is 0 where the start value is 0 and
+        both are NaN where there is no snapshot on or before the start date.
+        """
+        start_values = self.values_on(start_dates, field, method)
+        end_values = self.values_on(end_dates, field, method)
+        change, change_pct = [], []
+        for start, end in zip(start_values, end_values):
+            change.append(end - start)
+            if math.isnan(start):
+                change_pct.append(math.nan)
+            else:
+                change_pct.append((end - start) / start * 100 if start != 0 else 0.0)
+        return change, change_pct
+
+    def periods(self, frequency: str = "monthly") -> tuple[list[str], list[date]]:
+        """
+        Labels ("YYYY-MM" or "YYYY-Qn") and last days of every calendar month or
+        quarter from the first to the last snapshot.
+        """
+        if frequency not in RESAMPLE_FREQUENCIES:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        ordinals = self.ordinals()
+        if not ordinals:
+            return [], []
+        first, last = date.fromordinal(ordinals[0]), date.fromordinal(ordinals[-1])
+        step = 3 if frequency == "quarterly" else 1
+        # Index of the period's last month, counted in months since year 0
+        month = first.year * 12 + (first.month - 1) // step * step + step - 1
+        last_month = last.year * 12 + (last.month - 1) // step * step + step - 1
+        labels, ends = [], []
+        while month <= last_month:
+            year, month_index = divmod(month, 12)
+            if frequency == "quarterly":
+                labels.append(f"{year}-Q{month_index // 3 + 1}")
+            else:
+                labels.append(f"{year}-{month_index + 1:02d}")
+            next_year, next_index = divmod(month + 1, 12)
+            ends.append(date.fromordinal(date(next_year, next_index + 1, 1).toordinal() - 1))
+            month += step
+        return labels, ends
+
+    def resample(self, frequency: str = "monthly", method: str = "last",
+                 field: str = "net_worth") -> tuple[list[str], list[float]]:
+        """
+        One value per period (see periods()), taken at the period's last day: the
+        latest snapshot on or before it ("last"), or linearly interpolated between the
+        surrounding snapshots ("interpolate").
+        """
+        labels, period_ends = self.periods(frequency)
+        return labels, self.values_on(period_ends, field, method)
+
+
+def _ordinal(value: str | date) -> int:
+    if isinstance(value, date):
+        return value.toordinal()
+    return date.fromisoformat(str(value)[:10]).toordinal()
+
+
+def snapshot_series(state) -> SnapshotSeries:
+    """
+    Series over state's asset_snapshots, reused while the underlying list is the same
+    object with the same length (i.e. as long as it is only changed through the series).
+    """
+    snapshots = state.budget_settings.get("asset_snapshots")
+    if snapshots is None:
+        snapshots = []
+    series = _series_cache.get(state)
+    if series is None or series.snapshots is not snapshots or len(series) != len(snapshots):
+        series = SnapshotSeries(snapshots)
+        if snapshots or "asset_snapshots" in state.budget_settings:
+            _series_cache[state] = series
+    return series
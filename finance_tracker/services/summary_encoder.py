@@ -0,0 +1,184 @@
+"""
+finance_tracker/services/summary_encoder.py
+
+Compact text encoding of the per-month finance summary sent to AI providers.
+Long-tail categories are merged into an "Other" row, months become columns of
+pipe-separated tables, and detail is reduced step by step until the text fits
+an approximate token budget.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+SUMMARY_TOKEN_BUDGET = 1200
+MAX_CATEGORIES = 12
+# Categories that together make up less than this share of a table are merged
+TAIL_SHARE = 0.05
+_MIN_CATEGORIES = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class EncodedSummary:
+    text: str
+    tokens: int
+    original_tokens: int  # size of the uncompressed JSON summary
+    truncated: bool = False
+
+    def describe(self) -> str:
+        text = f"summary ~{self.tokens:,} tokens (was ~{self.original_tokens:,})"
+        if self.truncated:
+            text += ", truncated to fit"
+        return text
+
+
+def _amount(value: float) -> str:
+    return f"{value:.0f}"
+
+
+def merge_long_tail(totals: dict[str, float], max_rows: int = MAX_CATEGORIES,
+                    tail_share: float = TAIL_SHARE) -> tuple[list[str], list[str]]:
+    """
+    Split categories into (kept, merged). The largest categories are kept until
+    the rest sum to less than tail_share of the total or max_rows is reached.
+    A single leftover category is kept rather than merged on its own.
+    """
+    ordered = sorted(totals, key=lambda name: (-abs(totals[name]), name))
+    grand_total = sum(abs(value) for value in totals.values())
+    kept = []
+    remaining = grand_total
+    for name in ordered:
+        if len(kept) >= max_rows or (kept and remaining < tail_share * grand_total):
+            break
+        kept.append(name)
+        remaining -= abs(totals[name])
+    merged = ordered[len(kept):]
+    if len(merged) == 1:
+        kept.append(merged.pop())
+    return kept, merged
+
+
+def _category_table(title: str, months: list[str], per_month: dict[str, dict[str, float]],
+                    max_rows: int, monthly_columns: bool) -> list[str]:
+    totals: dict[str, float] = {}
+    for month in months:
+        for name, value in per_month[month].items():
+            totals[name] = totals.get(name, 0.0) + value
+    if not totals:
+        return []
+
+    kept, merged = merge_long_tail(totals, max_rows)
+    rows = [(name, [per_month[m].get(name, 0.0) for m in months]) for name in kept]
+    if merged:
+        rows.append((
+            f"Other ({len(merged)} categories)",
+            [sum(per_month[m].get(name, 0.0) for name in merged) for m in months],
+        ))
+
+    header = f"{title}|total"
+    if monthly_columns:
+        header += "|" + "|".join(months)
+    lines = [header]
+    for name, values in rows:
+        line = f"{name}|{_amount(sum(values))}"
+        if monthly_columns:
+            line += "|" + "|".join(_amount(value) for value in values)
+        lines.append(line)
+    return lines
+
+
+def _fixed_cost_table(months: list[str], fixed: dict[str, dict[str, float]], max_rows: int) -> list[str]:
+    totals: dict[str, float] = {}
+    active_months: dict[str, int] = {}
+    for month in months:
+        for name, value in fixed[month].items():
+            totals[name] = totals.get(name, 0.0) + value
+            active_months[name] = active_months.get(name, 0) + 1
+    if not totals:
+        return []
+
+    kept, merged = merge_long_tail(totals, max_rows)
+    lines = ["Fixed cost|total|per month|months active"]
+    for name in kept:
+        count = active_months[name]
+        lines.append(f"{name}|{_amount(totals[name])}|{_amount(totals[name] / count)}|{count}")
+    if merged:
+        lines.append(f"Other ({len(merged)} fixed costs)|{_amount(sum(totals[name] for name in merged))}||")
+    return lines
+
+
+def _render(months: list[str], monthly: dict[str, dict[str, Any]], max_rows: int,
+            monthly_columns: bool) -> list[str]:
+    income = {m: sum(monthly[m]["income"].values()) + monthly[m]["base_income"] for m in months}
+    expenses = {m: sum(monthly[m]["expenses"].values()) + sum(monthly[m]["fixed"].values()) for m in months}
+    fixed_total = sum(sum(monthly[m]["fixed"].values()) for m in months)
+    base_total = sum(monthly[m]["base_income"] for m in months)
+    flex_expenses = sum(sum(monthly[m]["expenses"].values()) for m in months)
+    flex_income = sum(sum(monthly[m]["income"].values()) for m in months)
+    expense_count = sum(monthly[m]["expense_count"] for m in months)
+    income_count = sum(monthly[m]["income_count"] for m in months)
+    total_income = sum(income.values())
+    total_expenses = sum(expenses.values())
+
+    lines = [
+        f"Finance summary for {months[0]}..{months[-1]} ({len(months)} months); amounts rounded, "
+        "tables are pipe-separated.",
+        f"Totals: income {_amount(total_income)}, expenses {_amount(total_expenses)}, "
+        f"net {_amount(total_income - total_expenses)}, fixed costs {_amount(fixed_total)}, "
+        f"base income {_amount(base_total)}, flexible expenses {_amount(flex_expenses)} "
+        f"({expense_count} transactions), flexible income {_amount(flex_income)} ({income_count} transactions)",
+        "",
+        "Month|income|expenses|net",
+    ]
+    lines += [f"{m}|{_amount(income[m])}|{_amount(expenses[m])}|{_amount(income[m] - expenses[m])}"
+              for m in months]
+
+    sections = [
+        _category_table("Expense category", months, {m: monthly[m]["expenses"] for m in months},
+                        max_rows, monthly_columns),
+        _category_table("Income category", months, {m: monthly[m]["income"] for m in months},
+                        max_rows, monthly_columns),
+        _fixed_cost_table(months, {m: monthly[m]["fixed"] for m in months}, max_rows),
+    ]
+    for section in sections:
+        if section:
+            lines.append("")
+            lines += section
+    return lines
+
+
+def encode_summary(months: list[str], monthly: dict[str, dict[str, Any]], original_tokens: int = 0,
+                   token_budget: int = SUMMARY_TOKEN_BUDGET) -> EncodedSummary:
+    """
+    Encode per-month aggregates (month -> {"expenses", "income", "fixed": {name: amount},
+    "base_income", "expense_count", "income_count"}) within token_budget. Detail is
+    dropped in order: fewer category rows, then per-month category columns, then
+    trailing lines as a last resort.
+    """
+    max_rows = MAX_CATEGORIES
+    monthly_columns = True
+    while True:
+        text = "\n".join(_render(months, monthly, max_rows, monthly_columns))
+        tokens = estimate_tokens(text)
+        if tokens <= token_budget:
+            return EncodedSummary(text, tokens, original_tokens)
+        if max_rows > _MIN_CATEGORIES:
+            max_rows = max(_MIN_CATEGORIES, max_rows // 2)
+        elif monthly_columns:
+            monthly_columns = False
+            max_rows = MAX_CATEGORIES
+        else:
+            break
+
+    lines = text.splitlines()
+    marker = "(truncated to fit the size limit)"
+    while len(lines) > 1 and estimate_tokens("\n".join(lines + [marker])) > token_budget:
+        lines.pop()
+    text = "\n".join(lines + [marker])
+    return EncodedSummary(text, estimate_tokens(text), original_tokens, truncated=True)
@@ -0,0 +1,168 @@
+"""
+finance_tracker/services/transaction_import.py
+
+Bulk transaction import. Rows are read lazily from CSV, JSON lines or a JSON
+array, validated one by one, and handed to AppState.add_transactions so the
+whole import is stored with a single save. Nothing is added if any row is invalid.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from .currency_service import parse_amount
+
+TRANSACTION_TYPES = ("Expense", "Income")
+IMPORT_FORMATS = ("csv", "jsonl", "json")
+# Stop collecting errors after this many; the import is rejected either way
+MAX_REPORTED_ERRORS = 20
+
+
+class TransactionImportError(ValueError):
+    """Raised when rows fail validation; errors is a list of (row_number, message)."""
+
+    def __init__(self, errors: list[tuple[int, str]]):
+        self.errors = errors
+        lines = [f"row {number}: {message}" for number, message in errors]
+        super().__init__("\n".join(lines))
+
+
+def validate_transaction(row: dict[str, Any], categories: dict[str, list[str]],
+                         default_type: str = "Expense") -> tuple:
+    """
+    Check one input row and return the AppState.add_transactions tuple
+    (trans_type, date, amount, category, description, behavior_date).
+    Amounts may be numbers or strings in comma notation ("1.234,56").
+    Raises ValueError with a readable message.
+    """
+    trans_type = str(row.get("type") or default_type).strip().capitalize()
+    if trans_type not in TRANSACTION_TYPES:
+        raise ValueError(f"unknown transaction type '{row.get('type')}'")
+    date_str = str(row.get("date") or "").strip()
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"invalid date '{date_str}', expected YYYY-MM-DD")
+    behavior_date = str(row.get("behavior_date") or "").strip() or None
+    if behavior_date:
+        try:
+            datetime.strptime(behavior_date, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"invalid behavior_date '{behavior_date}', expected YYYY-MM-DD")
+    amount = row.get("amount")
+    if isinstance(amount, str):
+        amount = parse_amount(amount)
+    try:
+        amount = float(amount) if isinstance(amount, (int, float)) and not isinstance(amount, bool) else None
+    except OverflowError:  # integers beyond float range
+        amount = None
+    # NaN and infinity would be saved as invalid JSON and break every report
+    if amount is None or not math.isfinite(amount) or amount <= 0:
+        raise ValueError(f"invalid amount '{row.get('amount')}'")
+    category = str(row.get("category") or "Other").strip()
+    if category not in categories.get(trans_type, []):
+        raise ValueError(f"unknown {trans_type.lower()} category '{category}'")
+    return trans_type, date_str, amount, category, str(row.get("description") or ""), behavior_date
+
+
+def detect_format(first_line: str) -> str:
+    stripped = first_line.lstrip()
+    if stripped.startswith("["):
+        return "json"
+    if stripped.startswith("{"):
+        return "jsonl"
+    return "csv"
+
+
+def _csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    lines = iter(lines)
+    header = next(lines, "")
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    reader = csv.DictReader(itertools.chain([header], lines), delimiter=delimiter)
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _jsonl_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, ValueError(f"invalid JSON: {exc.msg}")
+
+
+def _json_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    try:
+        rows = json.loads("".join(lines))
+    except json.JSONDecodeError as exc:
+        yield exc.lineno, ValueError(f"invalid JSON: {exc.msg}")
+        return
+    if not isinstance(rows, list):
+        yield 1, ValueError("expected a JSON array of transactions")
+        return
+    yield from enumerate(rows, 1)
+
+
+def read_transaction_rows(stream: IO[str], fmt: str | None = None) -> Iterator[tuple[int, Any]]:
+    """
+    Yield (row_number, row) from a text stream without reading it all first (CSV
+    and JSON lines; a JSON array is parsed as a whole). fmt is detected from the
+    first line when None. Unparseable rows are yielded as ValueError instances.
+    """
+    first_line = stream.readline()
+    fmt = fmt or detect_format(first_line)
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"unknown import format '{fmt}'")
+    lines = itertools.chain([first_line], stream)
+    if fmt == "csv":
+        yield from _csv_rows(lines)
+    elif fmt == "jsonl":
+        yield from _jsonl_rows(lines)
+    else:
+        yield from _json_rows(lines)
+
+
+def import_transactions(state, rows: Iterable[tuple[int, Any]], default_type: str = "Expense",
+                        dry_run: bool = False) -> int:
+    """
+    Validate (row_number, row) pairs and add them all with one save. Raises
+    TransactionImportError listing the bad rows (nothing is added then).
+    Returns the number of transactions added (or that would be, for dry_run).
+    """
+    valid = []
+    errors = []
+    for number, row in rows:
+        try:
+            if isinstance(row, Exception):
+                raise row
+            if not isinstance(row, dict):
+                raise ValueError("not an object")
+            valid.append(validate_transaction(row, state.categories, default_type))
+        except ValueError as exc:
+            errors.append((number, str(exc)))
+            if len(errors) >= MAX_REPORTED_ERRORS:
+                break
+    if errors:
+        raise TransactionImportError(errors)
+    if not dry_run:
+        state.add_transactions(valid)
+    return len(valid)
+
+
+def import_transactions_file(state, path: str | Path, fmt: str | None = None,
+                             default_type: str = "Expense", dry_run: bool = False) -> int:
+    """Import a CSV / JSON lines / JSON file; fmt defaults to the file extension or the content."""
+    path = Path(path)
+    if fmt is None and path.suffix.lower().lstrip(".") in IMPORT_FORMATS:
+        fmt = path.suffix.lower().lstrip(".")
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return import_transactions(state, read_transaction_rows(f, fmt), default_type, dry_run)
@@ -4,35 +4,72 @@ finance_tracker/state.py
 Manages the application state, including data loading, saving, and transaction management.
 """
 
+from bisect import bisect_left, insort
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-import json
 import os
 
+from .change_bus import ChangeBus, TOPIC_TRANSACTIONS
+from .ids import new_ulid, ulid_at
+from .json_codec import get_codec, pretty_from_env
+
 DEFAULT_EXPENSE_CATEGORIES = [
     "Food", "Transportation", "Entertainment", "Utilities",
     "Shopping", "Healthcare", "Money Lent", "Other"
 ]
 DEFAULT_INCOME_CATEGORIES = ["Salary", "Side Gig", "Bonus", "Gift", "Investment", "Other"]
 
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_UPDATED = "updated"
+
+
+@dataclass
+class TransactionChange:
+    """A single transaction mutation emitted by AppState."""
+    action: str                    # CHANGE_ADDED, CHANGE_REMOVED or CHANGE_UPDATED
+    trans_type: str                # "Expense" or "Income" (after the change)
+    record: dict                   # The stored transaction dict (same object as in the list)
+    previous_type: str | None = None  # Set on updates that moved the row between lists
+
+    @property
+    def trans_id(self) -> str:
+        return self.record.get("id", "")
+
+
+# Deletions an id list absorbs before its index is renumbered; see _remove_at()
+MAX_PENDING_REMOVALS = 256
+
+
 class AppState:
-    def __init__(self, data_file=None):
+    def __init__(self, data_file=None, codec=None, pretty=None):
         if data_file is None:
             data_file = os.environ.get("FINANCE_DATA_FILE", "finance_data.json")
         self.data_file = Path(data_file)
+        # See json_codec: orjson when installed; compact files unless FINANCE_JSON_PRETTY is set
+        self.codec = get_codec(codec)
+        self.pretty_json = pretty_from_env() if pretty is None else pretty
         self.expenses = []
         self.incomes = []
         self.budget_settings = {}
         self.categories = {}
+        self.bus = ChangeBus()
+        # Bumped on every load/save so derived data can be cached per version
+        self.data_version = 0
+        # Transaction id -> (trans_type, position in that list); see _locate()
+        self._id_index: dict[str, tuple[str, int]] = {}
+        # Per list, sorted indexed positions of rows deleted since it was last renumbered
+        self._removed: dict[str, list[int]] = {"Expense": [], "Income": []}
         self.load()
 
     def load(self):
         if self.data_file.exists():
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self.codec.loads(self.data_file.read_bytes())
         else:
             data = {}
 
+        self.data_version += 1
         self.expenses = data.get("expenses", [])
         self.incomes = data.get("incomes", [])
         self.budget_settings = data.get("budget_settings", {})
@@ -84,32 +121,190 @@ class AppState:
         if "Income" not in self.categories or not self.categories["Income"]:
             self.categories["Income"] = DEFAULT_INCOME_CATEGORIES.copy()
 
+        self._migrate_transaction_ids()
+
+    def _migrate_transaction_ids(self):
+        """
+        Give every transaction a unique id and build the id index. Rows without an id
+        (or repeating an earlier row's id) get a ULID for noon of their date, so they
+        sort among the others by date. Existing ids are kept, whatever their format.
+        """
+        self._id_index = {}
+        self._removed = {"Expense": [], "Income": []}
+        for trans_type, rows in (("Expense", self.expenses), ("Income", self.incomes)):
+            for position, record in enumerate(rows):
+                trans_id = record.get("id")
+                if not trans_id or trans_id in self._id_index:
+                    trans_id = record["id"] = self._legacy_transaction_id(record)
+                self._id_index[trans_id] = (trans_type, position)
+
+    def _legacy_transaction_id(self, record: dict) -> str:
+        try:
+            moment = datetime.strptime(str(record.get("date", ""))[:10], "%Y-%m-%d").replace(hour=12)
+            trans_id = ulid_at(int(moment.timestamp() * 1000))
+        except (ValueError, OverflowError, OSError):
+            trans_id = new_ulid()
+        while trans_id in self._id_index:
+            trans_id = new_ulid()
+        return trans_id
+
     def save(self):
+        self.data_version += 1
         data = {
             "expenses": self.expenses,
             "incomes": self.incomes,
             "budget_settings": self.budget_settings,
             "categories": self.categories,
         }
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        self.data_file.write_bytes(self.codec.dumps(data, self.pretty_json))
 
-    def add_transaction(self, trans_type: str, date_str: str, amount: float, category: str, description: str, behavior_date: str = None):
-        trans_id = f"{datetime.now().timestamp()}"
+    def publish(self, topic: str, change=None):
+        """Announce a mutation on one of the change_bus topics (call after save())."""
+        self.bus.publish(topic, change)
+
+    def _transactions_for(self, trans_type: str) -> list:
+        return self.expenses if trans_type == "Expense" else self.incomes
+
+    def _new_transaction_id(self) -> str:
+        trans_id = new_ulid()
+        while trans_id in self._id_index:
+            trans_id = new_ulid()
+        return trans_id
+
+    def _locate(self, trans_id) -> tuple[str, int] | None:
+        """
+        (trans_type, position) of the transaction with trans_id. The indexed position is
+        shifted by the deletions before it that are still pending (O(log k), k at most
+        MAX_PENDING_REMOVALS). The index is verified against the lists and rebuilt if
+        they were changed behind its back.
+        """
+        if not trans_id:
+            return None
+        for _ in range(2):
+            entry = self._id_index.get(trans_id)
+            if entry is not None:
+                trans_type, indexed = entry
+                rows = self._transactions_for(trans_type)
+                position = indexed - bisect_left(self._removed[trans_type], indexed)
+                if position < len(rows) and rows[position].get("id") == trans_id:
+                    return trans_type, position
+            elif len(self._id_index) == len(self.expenses) + len(self.incomes):
+                return None
+            self._migrate_transaction_ids()
+        return None
+
+    def get_transaction(self, trans_id: str) -> tuple[str, dict] | None:
+        """(trans_type, record) for a transaction id, or None."""
+        entry = self._locate(trans_id)
+        if entry is None:
+            return None
+        return entry[0], self._transactions_for(entry[0])[entry[1]]
+
+    def _append(self, trans_type: str, record: dict):
+        rows = self._transactions_for(trans_type)
+        rows.append(record)
+        # Indexed positions count the pending deletions, which all lie before the new row
+        self._id_index[record["id"]] = (trans_type, len(rows) - 1 + len(self._removed[trans_type]))
+
+    def _remove_at(self, trans_type: str, position: int) -> dict:
+        """
+        Remove a row, keeping the stored order of the others: views break ties between
+        rows of the same date by that order. The rows after it are not reindexed;
+        its indexed position is recorded instead and _locate() subtracts the deletions
+        before a row. The list is renumbered once MAX_PENDING_REMOVALS deletions have
+        accumulated, so a bulk delete (e.g. reconciliation) costs O(n) per that many
+        rows rather than per row. list.pop() itself still shifts the tail (a memmove).
+        """
+        rows = self._transactions_for(trans_type)
+        record = rows.pop(position)
+        entry = self._id_index.pop(record.get("id"), None)
+        removed = self._removed[trans_type]
+        if entry is None or len(removed) >= MAX_PENDING_REMOVALS:
+            self._reindex(trans_type)
+        else:
+            insort(removed, entry[1])
+        return record
+
+    def _reindex(self, trans_type: str):
+        """Renumber the index entries of one list and clear its pending deletions."""
+        for position, record in enumerate(self._transactions_for(trans_type)):
+            self._id_index[record["id"]] = (trans_type, position)
+        self._removed[trans_type] = []
+
+    @staticmethod
+    def _make_record(trans_id: str, date_str: str, amount: float, category: str, description: str,
+                     behavior_date: str = None) -> dict:
         record = {"id": trans_id, "date": date_str, "amount": amount, "category": category, "description": description}
         if behavior_date:
             record["behavior_date"] = behavior_date
-        if trans_type == "Expense":
-            self.expenses.append(record)
-        else:
-            self.incomes.append(record)
+        return record
+
+    def add_transaction(self, trans_type: str, date_str: str, amount: float, category: str, description: str, behavior_date: str = None):
+        record = self._make_record(self._new_transaction_id(), date_str, amount, category, description, behavior_date)
+        self._append(trans_type, record)
+        self.save()
+        self.publish(TOPIC_TRANSACTIONS, TransactionChange(CHANGE_ADDED, trans_type, record))
+        return record
+
+    def add_transactions(self, transactions) -> list[TransactionChange]:
+        """
+        Add many transactions with a single save. transactions is an iterable of
+        (trans_type, date_str, amount, category, description[, behavior_date]) tuples,
+        consumed once; callers validate beforehand (see services.transaction_import).
+        Each row gets a new ULID. One change per row is published after the save.
+        """
+        changes = []
+        for trans_type, *fields in transactions:
+            record = self._make_record(self._new_transaction_id(), *fields)
+            self._append(trans_type, record)
+            changes.append(TransactionChange(CHANGE_ADDED, trans_type, record))
+        if not changes:
+            return changes
         self.save()
+        for change in changes:
+            self.publish(TOPIC_TRANSACTIONS, change)
+        return changes
+
+    def update_transaction(self, trans_type: str, record: dict, new_type: str, **fields) -> dict:
+        """
+        Update a stored transaction in place and move it to the other list if its type changed.
+        A field passed as None is removed from the record (e.g. a cleared behavior_date).
+        """
+        for key, value in fields.items():
+            if value is None:
+                record.pop(key, None)
+            else:
+                record[key] = value
+
+        previous_type = None
+        if new_type != trans_type:
+            entry = self._locate(record.get("id"))
+            if entry is not None and self._transactions_for(entry[0])[entry[1]] is record:
+                self._remove_at(*entry)
+            else:
+                self._transactions_for(trans_type).remove(record)
+            self._append(new_type, record)
+            previous_type = trans_type
+
+        self.save()
+        self.publish(TOPIC_TRANSACTIONS, TransactionChange(CHANGE_UPDATED, new_type, record, previous_type))
+        return record
+
+    def delete_transaction(self, trans_type: str, record: dict) -> bool:
+        """Delete a specific stored transaction dict."""
+        entry = self._locate(record.get("id"))
+        if entry is None or entry[0] != trans_type or self._transactions_for(trans_type)[entry[1]] is not record:
+            return False
+        self._remove_at(*entry)
+        self.save()
+        self.publish(TOPIC_TRANSACTIONS, TransactionChange(CHANGE_REMOVED, trans_type, record))
+        return True
 
     def delete_transaction_by_id(self, trans_type: str, trans_id: str) -> bool:
-        target = self.expenses if trans_type == "Expense" else self.incomes
-        for i, t in enumerate(target):
-            if t.get("id") == trans_id:
-                del target[i]
-                self.save()
-                return True
-        return False
+        entry = self._locate(trans_id)
+        if entry is None or entry[0] != trans_type:
+            return False
+        record = self._remove_at(*entry)
+        self.save()
+        self.publish(TOPIC_TRANSACTIONS, TransactionChange(CHANGE_REMOVED, trans_type, record))
+        return True
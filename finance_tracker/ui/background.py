@@ -0,0 +1,94 @@
+"""
+finance_tracker/ui/background.py
+
+Runs slow work (network requests) on a worker thread and hands the results
+back to the Tk thread, which is the only thread allowed to touch widgets.
+"""
+
+import queue
+import threading
+import tkinter as tk
+
+
+class StreamingTask:
+    """
+    Run produce(cancel_event) on a daemon thread. produce returns an iterable whose
+    items are delivered to on_chunk(item) on the Tk thread, polled every poll_ms.
+    When the iterable is exhausted or cancelled on_done(cancelled) is called; if it
+    raises, on_error(exc) is called instead.
+    """
+
+    def __init__(self, widget, produce, on_chunk, on_done, on_error, poll_ms=40):
+        self.widget = widget
+        self._produce = produce
+        self._on_chunk = on_chunk
+        self._on_done = on_done
+        self._on_error = on_error
+        self._poll_ms = poll_ms
+        self._queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._poll_job = None
+        self.running = False
+
+    def start(self):
+        self.running = True
+        threading.Thread(target=self._run, daemon=True).start()
+        self._poll_job = self.widget.after(self._poll_ms, self._poll)
+        return self
+
+    def cancel(self, notify=True):
+        """
+        Stop delivering output now; the worker stops at its next chunk. Pass
+        notify=False when the owning widgets are being destroyed.
+        """
+        if not self.running:
+            return
+        self._cancel_event.set()
+        self._finish()
+        if notify:
+            self._on_done(True)
+
+    def _run(self):
+        try:
+            for item in self._produce(self._cancel_event):
+                if self._cancel_event.is_set():
+                    return
+                self._queue.put(("chunk", item))
+        except Exception as exc:  # delivered to on_error on the Tk thread
+            self._queue.put(("error", exc))
+        else:
+            self._queue.put(("done", None))
+
+    def _poll(self):
+        self._poll_job = None
+        if not self.running:
+            return
+        while True:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "chunk":
+                self._on_chunk(payload)
+                continue
+            self._finish()
+            if kind == "error":
+                self._on_error(payload)
+            else:
+                self._on_done(False)
+            return
+        try:
+            self._poll_job = self.widget.after(self._poll_ms, self._poll)
+        except tk.TclError:
+            # Widget destroyed while the request was running
+            self._cancel_event.set()
+            self.running = False
+
+    def _finish(self):
+        self.running = False
+        if self._poll_job is not None:
+            try:
+                self.widget.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
+            self._poll_job = None
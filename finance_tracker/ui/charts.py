@@ -147,8 +147,12 @@ def create_budget_depletion_figure(state, month_str: str, include_negative_carry
     
     return fig
 
-def create_net_worth_figure(snapshots):
-    """Generate net worth over time line chart"""
+def create_net_worth_figure(snapshots, reconstruction=None):
+    """
+    Generate net worth over time line chart. With a NetWorthReconstruction, the
+    daily estimate from recorded flows is drawn dashed and snapshots that drift
+    from it are marked.
+    """
     dates = [datetime.strptime(s['date'], '%Y-%m-%d') for s in snapshots]
     net_worths = [s['net_worth'] for s in snapshots]
     
@@ -156,7 +160,17 @@ def create_net_worth_figure(snapshots):
     ax = fig.add_subplot(111)
     
     # Plot line
-    ax.plot(dates, net_worths, marker='o', linewidth=2, markersize=6, color='steelblue')
+    ax.plot(dates, net_worths, marker='o', linewidth=2, markersize=6, color='steelblue', label='Snapshots')
+
+    if reconstruction is not None and len(reconstruction.days):
+        ax.plot(reconstruction.days, reconstruction.estimate, linestyle='--',
+                linewidth=1, color='darkorange', label='Estimated from recorded flows')
+        flagged = reconstruction.flagged
+        if flagged:
+            ax.scatter([datetime.strptime(d['to_date'], '%Y-%m-%d') for d in flagged],
+                       [d['actual'] for d in flagged], marker='x', s=60, color='red', zorder=4,
+                       label='Drift from estimate')
+        ax.legend(loc='best', fontsize=8)
     
     # Fill area - handle positive and negative separately
     ax.fill_between(dates, net_worths, 0, where=[nw >= 0 for nw in net_worths], 
@@ -183,6 +197,43 @@ def create_net_worth_figure(snapshots):
     
     return fig
 
+def create_cash_flow_figure(projection):
+    """Generate projected daily balance with month-end markers from a CashFlowProjection"""
+    fig = Figure(figsize=(9, 5), dpi=100)
+    ax = fig.add_subplot(111)
+
+    if not len(projection.days):
+        ax.text(0.5, 0.5, "Nothing to project", ha='center', va='center', transform=ax.transAxes)
+        return fig
+
+    dates = projection.days.astype('datetime64[D]').astype(datetime)
+    balance = projection.balance
+
+    ax.plot(dates, balance, linewidth=1.5, color='steelblue', label='Projected balance')
+    ax.fill_between(dates, balance, 0, where=balance >= 0, alpha=0.2, color='green', interpolate=True)
+    ax.fill_between(dates, balance, 0, where=balance < 0, alpha=0.2, color='red', interpolate=True)
+
+    months, totals = projection.monthly()
+    month_ends = [datetime.strptime(m + "-01", '%Y-%m-%d') for m in months]
+    month_ends = [d.replace(day=calendar.monthrange(d.year, d.month)[1]) for d in month_ends]
+    ax.scatter(month_ends, totals['balance'], s=12, color='steelblue', zorder=3)
+
+    low_day, low_balance = projection.lowest_balance()
+    ax.annotate(f"Low: €{low_balance:,.0f}", xy=(datetime.combine(low_day, datetime.min.time()), low_balance),
+                xytext=(0, -18), textcoords='offset points', ha='center', fontsize=8, color='darkred')
+
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.8, alpha=0.5)
+    ax.set_title('Projected Daily Balance', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Balance (€)')
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    fig.autofmt_xdate(rotation=45)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
+    return fig
+
 def create_allocation_figure(positive_assets, negative_assets, total_positive):
     """Generate current asset allocation pie chart"""
     labels = list(positive_assets.keys())
@@ -655,9 +706,9 @@ def create_pie_figure(labels, sizes, title, value_type="Total"):
     total = sum(sizes) if sizes else 0
     n = len(sizes)
     if n <= 20:
-        cmap = plt.cm.get_cmap('tab20', n)
+        cmap = plt.get_cmap('tab20', n)
     else:
-        cmap = plt.cm.get_cmap('hsv', n)
+        cmap = plt.get_cmap('hsv', n)
     colors = [cmap(i) for i in range(n)]
 
     wedges, _ = ax.pie(sizes, startangle=140, labels=None, colors=colors)
@@ -11,6 +11,16 @@ from .style import apply_styles, get_current_theme, get_theme_colors
 from .help_window import show_help
 from .shortcuts import ShortcutManager
 from .windowing import close_window, create_child_window, show_main_window
+from .tab_refresh import TabRefreshScheduler
+from . import watchdog
+from ..change_bus import (
+    TOPIC_BALANCES,
+    TOPIC_FIXED_COSTS,
+    TOPIC_GOALS,
+    TOPIC_INCOME_SOURCES,
+    TOPIC_SNAPSHOTS,
+    TOPIC_TRANSACTIONS,
+)
 
 from .tabs.add_transaction_tab import AddTransactionTab
 from .tabs.view_transactions_tab import ViewTransactionsTab
@@ -59,19 +69,9 @@ class MainView:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill='both', expand=True)
 
-        # Callback to refresh UI after data changes
-        def on_data_changed():
-            self.view_tab.refresh()
-            self.settings_tab.refresh_fixed_costs_tree()
-            self.settings_tab.refresh_balance_entries()
-            self.goals_tab.refresh_goals()
-            if hasattr(self, 'reconciliation_tab'):
-                self.reconciliation_tab.refresh_after_data_change()
-        self.on_data_changed = on_data_changed
-
         # Tabs
-        self.add_tab = AddTransactionTab(self.notebook, self.state, self.on_data_changed)
-        self.view_tab = ViewTransactionsTab(self.notebook, self.state, self.on_data_changed)
+        self.add_tab = AddTransactionTab(self.notebook, self.state)
+        self.view_tab = ViewTransactionsTab(self.notebook, self.state)
         self.reports_tab = ReportsTab(self.notebook, self.state)
         self.settings_tab = SettingsTab(self.notebook, self.state)
         self.budgets_tab = BudgetsTab(self.notebook, self.state)
@@ -79,7 +79,8 @@ class MainView:
         self.net_worth_tab = NetWorthTab(self.notebook, self.state)
         self.projection_tab = ProjectionTab(self.notebook, self.state)
         self.ai_insights_tab = AIInsightsTab(self.notebook, self.state)
-        self.reconciliation_tab = ReconciliationTab(self.notebook, self.state, self.on_data_changed)
+        self.reconciliation_tab = ReconciliationTab(self.notebook, self.state)
+        self._subscribe_tabs()
         self._refresh_theme_sensitive_widgets()
 
         # Setup keyboard shortcuts
@@ -87,6 +88,32 @@ class MainView:
         self.shortcut_manager.setup_shortcuts()
         show_main_window(self.root)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Measures event-loop lag while performance monitoring is on
+        self.watchdog = watchdog.attach(self.root)
+
+    def _subscribe_tabs(self):
+        """Route AppState change topics to the tabs that render them."""
+        self.refresh_scheduler = TabRefreshScheduler(self.notebook, self.state.bus)
+        subscribe = self.refresh_scheduler.subscribe
+
+        subscribe(self.view_tab.frame, [TOPIC_TRANSACTIONS],
+                  self.view_tab.apply_transaction_changes, pass_changes=True)
+        subscribe(self.view_tab.frame, [TOPIC_FIXED_COSTS, TOPIC_INCOME_SOURCES],
+                  self.view_tab.update_summary)
+
+        settings = self.settings_tab
+        subscribe(settings.frame, [TOPIC_FIXED_COSTS], settings.refresh_fixed_costs)
+        subscribe(settings.frame, [TOPIC_INCOME_SOURCES], settings.refresh_income_sources)
+        subscribe(settings.frame, [TOPIC_BALANCES], settings.refresh_balance_entries)
+        subscribe(settings.frame, [TOPIC_TRANSACTIONS], settings.refresh_budget_graph)
+
+        subscribe(self.budgets_tab.frame,
+                  [TOPIC_TRANSACTIONS, TOPIC_FIXED_COSTS, TOPIC_INCOME_SOURCES, TOPIC_BALANCES],
+                  self.budgets_tab.update_monetary_labels)
+        subscribe(self.goals_tab.frame, [TOPIC_GOALS, TOPIC_BALANCES], self.goals_tab.refresh_goals)
+        subscribe(self.net_worth_tab.frame, [TOPIC_SNAPSHOTS, TOPIC_BALANCES], self.net_worth_tab.refresh)
+        subscribe(self.reconciliation_tab.frame, [TOPIC_TRANSACTIONS],
+                  self.reconciliation_tab.refresh_after_data_change)
 
     def _on_close(self):
         if self._closing:
@@ -97,6 +124,9 @@ class MainView:
         view_tab = getattr(self, "view_tab", None)
         if view_tab is not None:
             view_tab.cancel_pending_refresh()
+        main_loop_watchdog = getattr(self, "watchdog", None)
+        if main_loop_watchdog is not None:
+            main_loop_watchdog.stop()
 
         try:
             current_grab = self.root.grab_current()
@@ -231,7 +261,8 @@ class MainView:
             ("Alt+E", "shortcut"), (" - Toggle Expense/Income type (in Add Transaction)\n\n", "description"),
             
             ("View Shortcuts\n", "section"),
-            ("Ctrl+F", "shortcut"), (" - Focus search/filter field\n\n", "description"),
+            ("Ctrl+F", "shortcut"), (" - Focus search/filter field\n", "description"),
+            ("Shift+Click", "shortcut"), (" - Add a column header as a secondary sort (View Transactions)\n\n", "description"),
             
             ("Help\n", "section"),
             ("Ctrl+H", "shortcut"), (" - Show Help & Instructions\n", "description"),
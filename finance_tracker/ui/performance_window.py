@@ -0,0 +1,96 @@
+"""
+finance_tracker/ui/performance_window.py
+
+Shows the performance instrumentation report (slowest functions, slow Tk
+callbacks, last cProfile capture) collected by finance_tracker.perf.
+"""
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from .. import perf
+from . import watchdog
+from .style import get_theme_colors
+from .windowing import close_window, create_child_window
+
+
+def full_report(limit: int = 25) -> str:
+    """The perf report followed by the main-loop watchdog's lag histogram and stalls."""
+    report = perf.format_report(limit)
+    current = watchdog.current()
+    if current is not None:
+        report += "\n\n" + current.format_report()
+    return report
+
+
+def show_performance(root):
+    win = create_child_window(
+        root,
+        title="Performance",
+        geometry="900x600",
+        minsize=(650, 400),
+    )
+
+    main_frame = ttk.Frame(win, padding=10)
+    main_frame.pack(fill='both', expand=True)
+
+    button_frame = ttk.Frame(main_frame)
+    button_frame.pack(side='bottom', fill='x', pady=(10, 0))
+    status = ttk.Label(main_frame)
+    status.pack(side='bottom', fill='x', pady=(5, 0))
+
+    text_frame = ttk.Frame(main_frame)
+    text_frame.pack(fill='both', expand=True)
+    colors = get_theme_colors()
+    text = tk.Text(text_frame, wrap='none', font=('Courier', 9),
+                   background=colors["text_bg"], foreground=colors["text_fg"])
+    yscroll = ttk.Scrollbar(text_frame, orient='vertical', command=text.yview)
+    xscroll = ttk.Scrollbar(text_frame, orient='horizontal', command=text.xview)
+    text.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+    yscroll.pack(side='right', fill='y')
+    xscroll.pack(side='bottom', fill='x')
+    text.pack(side='left', fill='both', expand=True)
+
+    def refresh():
+        text.config(state='normal')
+        text.delete('1.0', tk.END)
+        text.insert(tk.END, full_report())
+        text.config(state='disabled')
+        if perf.profile_armed():
+            status.config(text="Profiling armed: the next button, menu or key action will be captured.")
+        elif not perf.is_enabled():
+            status.config(text="Instrumentation is off. Enable it with the Performance monitoring "
+                               f"toggle on the Budget Report tab or {perf.ENV_VAR}=1.")
+        else:
+            status.config(text="")
+
+    def reset():
+        perf.reset()
+        if watchdog.current() is not None:
+            watchdog.current().reset()
+        refresh()
+
+    def arm_profile():
+        perf.profile_next_action()
+        refresh()
+
+    def export():
+        path = filedialog.asksaveasfilename(parent=win, defaultextension=".txt",
+                                            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+                                            initialfile="performance_report.txt")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(full_report(limit=200))
+        except OSError as e:
+            messagebox.showerror("Export Failed", str(e), parent=win)
+
+    ttk.Button(button_frame, text="Refresh", command=refresh).pack(side='left')
+    ttk.Button(button_frame, text="Reset", command=reset).pack(side='left', padx=(5, 0))
+    ttk.Button(button_frame, text="Profile Next Action", command=arm_profile).pack(side='left', padx=(5, 0))
+    ttk.Button(button_frame, text="Export", command=export).pack(side='left', padx=(5, 0))
+    ttk.Button(button_frame, text="Close", command=lambda: close_window(win)).pack(side='right')
+
+    refresh()
+    return win
@@ -206,7 +206,7 @@ class ShortcutManager:
         elif current_index == 3:  # Budget Report
             self.mv.settings_tab.generate_report()
         elif current_index == 4:  # Budgets Limits
-            self.mv.budgets_tab._update_monetary_labels()
+            self.mv.budgets_tab.update_monetary_labels()
         elif current_index == 5:  # Goals
             self.mv.goals_tab.refresh_goals()
         elif current_index == 6:  # Net Worth
@@ -274,8 +274,8 @@ class ShortcutManager:
         current_index = self.notebook.index(self.notebook.select())
         
         if current_index == 1:  # View Transactions
-            self.mv.view_tab.month_filter.focus_set()
-            # For Combobox, focusing will open the dropdown
+            self.mv.view_tab.description_filter.focus_set()
+            self.mv.view_tab.description_filter.select_range(0, tk.END)
         elif current_index == 2:  # Charts
             self.mv.reports_tab.month_entry.focus_set()
             self.mv.reports_tab.month_entry.select_range(0, tk.END)
@@ -0,0 +1,134 @@
+"""
+finance_tracker/ui/sort_index.py
+
+Presorted permutation indexes for ordering table rows by one or more columns.
+"""
+
+from bisect import bisect_left, insort
+
+
+class SortIndex:
+    """
+    Holds table rows in a base order plus, per column, the (key, sequence) pairs that
+    sort them ascending. Every row gets an increasing sequence number, so ties between
+    equal keys fall back to base order. Sort keys are extracted once per row when a
+    column is first sorted; adding or removing a row then bisects its pair into or out
+    of each cached column instead of rebuilding it. The descending order and the dense
+    ranks used by multi-column sorts are derived from those pairs on demand and
+    dropped on every mutation; deriving them is a linear pass, not a sort.
+    """
+
+    def __init__(self, key_funcs):
+        self._key_funcs = key_funcs  # column -> callable(row) returning a comparable key
+        self.reset([])
+
+    def reset(self, rows):
+        self._rows = dict(enumerate(rows))  # sequence number -> row, in base order
+        self._sequences = {id(row): sequence for sequence, row in self._rows.items()}
+        self._next_sequence = len(self._rows)
+        self._entries = {}  # column -> ascending list of (key, sequence)
+        self._keys = {}  # column -> sequence -> key, to find a row's entry on removal
+        self._derived_changed()
+
+    def _derived_changed(self):
+        self._descending = {}  # column -> sequences in descending order
+        self._ranks = {}  # column -> sequence -> dense rank
+
+    def add(self, row):
+        """Add a row at the end of the base order."""
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._rows[sequence] = row
+        self._sequences[id(row)] = sequence
+        for column, entries in self._entries.items():
+            key = self._key_funcs[column](row)
+            self._keys[column][sequence] = key
+            insort(entries, (key, sequence))
+        self._derived_changed()
+
+    def remove(self, row):
+        """Remove a row (the same object that was added), using the key cached for it."""
+        sequence = self._sequences.pop(id(row), None)
+        if sequence is None:
+            return
+        del self._rows[sequence]
+        for column, entries in self._entries.items():
+            key = self._keys[column].pop(sequence)
+            del entries[bisect_left(entries, (key, sequence))]
+        self._derived_changed()
+
+    def _column_entries(self, column):
+        entries = self._entries.get(column)
+        if entries is None:
+            key = self._key_funcs[column]
+            keys = {sequence: key(row) for sequence, row in self._rows.items()}
+            # Stable sort of the sequences (already ascending) by key, then pair them up
+            entries = [(keys[sequence], sequence) for sequence in sorted(keys, key=keys.__getitem__)]
+            self._entries[column] = entries
+            self._keys[column] = keys
+        return entries
+
+    def _column_ranks(self, column):
+        ranks = self._ranks.get(column)
+        if ranks is None:
+            ranks = {}
+            rank = -1
+            previous = None
+            for value, sequence in self._column_entries(column):
+                if rank < 0 or value != previous:
+                    rank += 1
+                    previous = value
+                ranks[sequence] = rank
+            self._ranks[column] = ranks
+        return ranks
+
+    def _descending_sequences(self, column):
+        perm = self._descending.get(column)
+        if perm is None:
+            perm = self._reverse_groups(self._column_entries(column))
+            self._descending[column] = perm
+        return perm
+
+    @staticmethod
+    def _reverse_groups(entries):
+        """Reverse ascending (key, sequence) pairs while keeping each run of equal keys in base order."""
+        result = []
+        end = len(entries)
+        while end > 0:
+            start = end - 1
+            value = entries[start][0]
+            while start > 0 and entries[start - 1][0] == value:
+                start -= 1
+            result.extend(sequence for _, sequence in entries[start:end])
+            end = start
+        return result
+
+    def order(self, sort_keys):
+        """
+        Return the rows ordered by sort_keys, a list of (column, descending) pairs with
+        the primary column first. Rows tied on every column keep their base order.
+        """
+        rows = self._rows
+        if not sort_keys:
+            return list(rows.values())
+        if len(sort_keys) == 1:
+            column, descending = sort_keys[0]
+            if descending:
+                return [rows[sequence] for sequence in self._descending_sequences(column)]
+            return [rows[sequence] for _, sequence in self._column_entries(column)]
+
+        # Multi-column: stably sort sequences by the integer ranks of each column,
+        # least significant first, instead of comparing the raw (string/float) keys.
+        perm = list(rows)
+        for column, descending in reversed(sort_keys):
+            perm.sort(key=self._column_ranks(column).__getitem__, reverse=descending)
+        return [rows[sequence] for sequence in perm]
+
+    def precedes(self, sort_keys, row, other):
+        """Return True if row sorts strictly before other under sort_keys."""
+        for column, descending in sort_keys:
+            key = self._key_funcs[column]
+            a, b = key(row), key(other)
+            if a != b:
+                return a > b if descending else a < b
+        return False
@@ -0,0 +1,77 @@
+"""
+finance_tracker/ui/tab_refresh.py
+
+Routes AppState change-bus topics to tab refresh callbacks. Refreshes for the
+visible tab run on the next idle cycle; hidden tabs are marked dirty and
+refreshed when they are selected.
+"""
+
+import tkinter as tk
+
+
+class _Subscription:
+    def __init__(self, frame, refresh, pass_changes):
+        self.frame = frame
+        self.refresh = refresh
+        self.pass_changes = pass_changes
+        self.dirty = False
+        self.changes = []
+
+
+class TabRefreshScheduler:
+    def __init__(self, notebook, bus):
+        self.notebook = notebook
+        self.bus = bus
+        self._subscriptions = []
+        self._flush_job = None
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+
+    def subscribe(self, frame, topics, refresh, pass_changes=False):
+        """
+        Call refresh() when any of topics is published and the tab owning frame is visible.
+        With pass_changes=True refresh receives the list of change objects collected since
+        its last run (in publish order) instead of no arguments.
+        """
+        subscription = _Subscription(frame, refresh, pass_changes)
+        self._subscriptions.append(subscription)
+
+        def on_change(change):
+            subscription.dirty = True
+            if pass_changes:
+                subscription.changes.append(change)
+            if self._is_visible(frame):
+                self._schedule_flush()
+
+        for topic in topics:
+            self.bus.subscribe(topic, on_change)
+        return subscription
+
+    def _is_visible(self, frame):
+        try:
+            return self.notebook.select() == str(frame)
+        except tk.TclError:
+            return False
+
+    def _schedule_flush(self):
+        if self._flush_job is not None:
+            return
+        try:
+            self._flush_job = self.notebook.after_idle(self._flush)
+        except tk.TclError:
+            self._flush_job = None
+
+    def _on_tab_changed(self, _event=None):
+        self._schedule_flush()
+
+    def _flush(self):
+        """Run the pending refreshes of the tab that is currently selected."""
+        self._flush_job = None
+        for subscription in self._subscriptions:
+            if not subscription.dirty or not self._is_visible(subscription.frame):
+                continue
+            subscription.dirty = False
+            if subscription.pass_changes:
+                changes, subscription.changes = subscription.changes, []
+                subscription.refresh(changes)
+            else:
+                subscription.refresh()
@@ -9,9 +9,8 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 
 class AddTransactionTab:
-    def __init__(self, notebook, state, on_data_changed):
+    def __init__(self, notebook, state):
         self.state = state
-        self.on_data_changed = on_data_changed
 
         self.frame = ttk.Frame(notebook, padding="20")
         notebook.add(self.frame, text="Add Transaction")
@@ -113,7 +112,6 @@ class AddTransactionTab:
                 return
             self.amount_entry.delete(0, tk.END)
             self.description_entry.delete(0, tk.END)
-            self.on_data_changed()
             self._show_message("showinfo", "Success", f"{trans_type} added successfully!")
         except ValueError:
             self._show_message("showerror", "Error", "Invalid amount or date format (YYYY-MM-DD).")
@@ -147,7 +145,6 @@ class AddTransactionTab:
                 return
             self.amount_entry.delete(0, tk.END)
             self.description_entry.delete(0, tk.END)
-            self.on_data_changed()
             self._show_message("showinfo", "Success", f"{trans_type} scheduled for {klarna_date_str} (BNPL).")
         except ValueError:
             self._show_message("showerror", "Error", "Invalid amount or date format (YYYY-MM-DD).")
\ No newline at end of file
@@ -12,14 +12,39 @@ from ...services.ai_insights_service import (
     AIConfig,
     build_chat_messages,
     build_insights_prompt,
-    request_ai_insights,
+    compact_chat_history,
+    encoded_summary,
+    fan_out_ai_insights,
+    response_cache_key,
+    stream_ai_insights,
 )
+from ...services.ai_response_cache import AIResponseCache
+from ..background import StreamingTask
 from ..windowing import create_child_window
 
+PROVIDER_MAP = {
+    "Google Gemini": "google",
+    "OpenAI-Compatible": "openai",
+    "Groq": "groq",
+}
+PRESET_MODELS = {
+    "Google Gemini": ["gemini-3-flash-preview", "gemini-2.5-flash"],
+    "OpenAI-Compatible": ["gpt-4o-mini"],
+    "Groq": ["llama-3.1-70b-versatile"],
+}
+PRESET_BASE_URLS = {
+    "Google Gemini": "https://generativelanguage.googleapis.com/v1beta",
+    "OpenAI-Compatible": "https://api.openai.com/v1/chat/completions",
+    "Groq": "https://api.groq.com/openai/v1/chat/completions",
+}
+FAN_OUT_FIRST = "First response wins"
+FAN_OUT_SIDE_BY_SIDE = "Side by side"
+
 
 class AIInsightsTab:
     def __init__(self, notebook, state):
         self.state = state
+        self.response_cache = AIResponseCache.for_state(state)
 
         main = ttk.Frame(notebook, padding="10")
         notebook.add(main, text="AI Insights")
@@ -36,7 +61,7 @@ class AIInsightsTab:
             settings,
             textvariable=self.provider_var,
             state="readonly",
-            values=["Google Gemini", "OpenAI-Compatible", "Groq"],
+            values=list(PROVIDER_MAP),
         )
         self.provider_combo.grid(row=0, column=1, sticky="ew", pady=5)
         self.provider_combo.bind("<<ComboboxSelected>>", self._apply_preset)
@@ -80,53 +105,94 @@ class AIInsightsTab:
         input_frame.columnconfigure(0, weight=1)
         self.chat_entry = ttk.Entry(input_frame)
         self.chat_entry.grid(row=0, column=0, sticky="ew", padx=(0, 10))
-        ttk.Button(input_frame, text="Send", command=self.send_chat).grid(row=0, column=1, sticky="e")
+        self.send_button = ttk.Button(input_frame, text="Send", command=self.send_chat)
+        self.send_button.grid(row=0, column=1, sticky="e")
+        self.cancel_chat_button = ttk.Button(input_frame, text="Cancel", command=self.cancel_chat,
+                                             state="disabled")
+        self.cancel_chat_button.grid(row=0, column=2, sticky="e", padx=(5, 0))
 
         self.chat_history = []
+        self.chat_digest = ""  # Shortened form of turns folded out of chat_history
+        self._chat_task = None
         self.last_month = datetime.now().strftime("%Y-%m")
         self.last_months_back = 3
 
+        self._migrate_legacy_api_key()
         self._load_saved_api_key()
 
-    def _apply_preset(self, _event=None):
+    def _apply_preset(self, event=None):
         preset = self.provider_var.get()
-        if preset == "Google Gemini":
-            self.model_combo["values"] = ["gemini-3-flash-preview", "gemini-2.5-flash"]
-            if self.model_var.get() not in self.model_combo["values"]:
-                self.model_var.set("gemini-3-flash-preview")
-        elif preset == "Groq":
-            self.model_combo["values"] = ["llama-3.1-70b-versatile"]
-            if self.model_var.get() not in self.model_combo["values"]:
-                self.model_var.set("llama-3.1-70b-versatile")
-        else:
-            self.model_combo["values"] = ["gpt-4o-mini"]
-            if self.model_var.get() not in self.model_combo["values"]:
-                self.model_var.set("gpt-4o-mini")
+        models = PRESET_MODELS.get(preset, PRESET_MODELS["OpenAI-Compatible"])
+        self.model_combo["values"] = models
+        if self.model_var.get() not in self.model_combo["values"]:
+            self.model_var.set(models[0])
+        if event is not None:
+            # Keys are remembered per preset; keep the one typed for the previous preset
+            self._persist_api_key(self._key_preset)
+            self._load_saved_api_key()
+
+    def _migrate_legacy_api_key(self):
+        """
+        Older versions kept a single api_key for whichever preset was selected, which
+        is the startup preset unless the user switched. Move it there once, so a key is
+        never offered to (or sent to) a different provider.
+        """
+        ai_settings = self.state.budget_settings.setdefault("ai_settings", {})
+        legacy_key = ai_settings.get("api_key", "")
+        if not legacy_key:
+            return
+        provider_keys = ai_settings.setdefault("provider_keys", {})
+        provider_keys.setdefault(self.provider_var.get(), legacy_key)
+        ai_settings["api_key"] = ""
+        self.state.save()
 
-    def _load_saved_api_key(self):
+    def _saved_api_key(self, preset):
         ai_settings = self.state.budget_settings.get("ai_settings", {})
-        saved_key = ai_settings.get("api_key", "")
+        return ai_settings.get("provider_keys", {}).get(preset, "")
+
+    def _load_saved_api_key(self):
+        self._key_preset = self.provider_var.get()
+        saved_key = self._saved_api_key(self._key_preset)
+        self.api_key_entry.delete(0, tk.END)
         if saved_key:
-            self.api_key_entry.delete(0, tk.END)
             self.api_key_entry.insert(0, saved_key)
             self.remember_key_var.set(True)
 
-    def _persist_api_key(self):
+    def _persist_api_key(self, preset=None):
+        preset = preset or self.provider_var.get()
         ai_settings = self.state.budget_settings.setdefault("ai_settings", {})
-        if self.remember_key_var.get():
-            ai_settings["api_key"] = self.api_key_entry.get().strip()
-        else:
-            ai_settings["api_key"] = ""
-        self.state.save()
+        api_key = self.api_key_entry.get().strip() if self.remember_key_var.get() else ""
+        provider_keys = ai_settings.setdefault("provider_keys", {})
+        # Only save on change so each request does not rewrite the data file
+        if provider_keys.get(preset, "") != api_key:
+            provider_keys[preset] = api_key
+            self.state.save()
 
     def _get_api_base_url(self):
-        provider_key = self.provider_var.get()
-        base_urls = {
-            "Google Gemini": "https://generativelanguage.googleapis.com/v1beta",
-            "OpenAI-Compatible": "https://api.openai.com/v1/chat/completions",
-            "Groq": "https://api.groq.com/openai/v1/chat/completions",
-        }
-        return base_urls.get(provider_key, base_urls["OpenAI-Compatible"])
+        return PRESET_BASE_URLS.get(self.provider_var.get(), PRESET_BASE_URLS["OpenAI-Compatible"])
+
+    def _build_config(self):
+        return AIConfig(
+            provider=PROVIDER_MAP.get(self.provider_var.get(), "openai"),
+            api_base_url=self._get_api_base_url(),
+            api_key=self.api_key_entry.get().strip(),
+            model=self.model_var.get().strip(),
+        )
+
+    def _fan_out_configs(self):
+        """The selected provider plus every other preset that has a saved API key."""
+        configs = [(self.provider_var.get(), self._build_config())]
+        provider_keys = self.state.budget_settings.get("ai_settings", {}).get("provider_keys", {})
+        for preset, provider in PROVIDER_MAP.items():
+            if preset == self.provider_var.get() or not provider_keys.get(preset):
+                continue
+            configs.append((preset, AIConfig(
+                provider=provider,
+                api_base_url=PRESET_BASE_URLS[preset],
+                api_key=provider_keys[preset],
+                model=PRESET_MODELS[preset][0],
+            )))
+        return configs
 
     def open_insights_window(self):
         win = create_child_window(
@@ -148,6 +214,16 @@ class AIInsightsTab:
         months_back_entry.insert(0, str(self.last_months_back))
         months_back_entry.grid(row=0, column=3, sticky="w", padx=(5, 0))
 
+        compare_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options, text="Ask all providers with saved keys", variable=compare_var).grid(
+            row=1, column=0, columnspan=2, sticky="w", pady=(8, 0)
+        )
+        fan_out_mode_var = tk.StringVar(value=FAN_OUT_FIRST)
+        ttk.Combobox(options, textvariable=fan_out_mode_var, state="readonly", width=20,
+                     values=[FAN_OUT_FIRST, FAN_OUT_SIDE_BY_SIDE]).grid(
+            row=1, column=2, columnspan=2, sticky="w", pady=(8, 0)
+        )
+
         text_frame = ttk.Frame(win, padding=10)
         text_frame.pack(fill="both", expand=True)
         text_frame.rowconfigure(0, weight=1)
@@ -158,12 +234,22 @@ class AIInsightsTab:
         scroll.grid(row=0, column=1, sticky="ns")
         report_text.configure(yscrollcommand=scroll.set)
 
-        def run_report():
+        status_var = tk.StringVar(value="")
+        ttk.Label(win, textvariable=status_var, foreground="gray").pack(anchor="w", padx=10, pady=(0, 5))
+        report_task = None
+
+        def set_running(running):
+            generate_button.config(state="disabled" if running else "normal")
+            regenerate_button.config(state="disabled" if running else "normal")
+            cancel_button.config(state="normal" if running else "disabled")
+
+        def run_report(regenerate=False):
+            """Show the report for the current settings; cached unless regenerate is set."""
+            nonlocal report_task
             month_str = month_entry.get().strip()
             months_back_raw = months_back_entry.get().strip()
             model = self.model_var.get().strip()
             api_key = self.api_key_entry.get().strip()
-            api_url = self._get_api_base_url()
 
             if not model or not api_key:
                 messagebox.showerror("Missing Settings", "Please enter a model and API key.", parent=win)
@@ -181,39 +267,166 @@ class AIInsightsTab:
             self.last_months_back = months_back
 
             messages = build_insights_prompt(self.state, self.last_month, self.last_months_back)
-            provider_key = self.provider_var.get()
-            provider_map = {
-                "Google Gemini": "google",
-                "OpenAI-Compatible": "openai",
-                "Groq": "groq",
-            }
-            config = AIConfig(
-                provider=provider_map.get(provider_key, "openai"),
-                api_base_url=api_url,
-                api_key=api_key,
-                model=model,
-            )
+            summary = encoded_summary(self.state, self.last_month, self.last_months_back)
+            config = self._build_config()
             self._persist_api_key()
 
-            try:
-                insights = request_ai_insights(config, messages)
-            except RuntimeError as exc:
-                messagebox.showerror("AI Request Failed", str(exc), parent=win)
+            if compare_var.get():
+                report_task = self._start_fan_out(
+                    win, messages, fan_out_mode_var.get() == FAN_OUT_FIRST,
+                    report_text, status_var, set_running,
+                )
+                return
+
+            key = response_cache_key(config, messages)
+            cached = None if regenerate else self.response_cache.get(key)
+            if cached is not None:
+                report_text.delete("1.0", tk.END)
+                report_text.insert("1.0", cached["content"])
+                generated = datetime.fromtimestamp(cached["created_at"]).strftime("%Y-%m-%d %H:%M")
+                status_var.set(f"Loaded from cache (generated {generated}). Use Regenerate for a fresh response.")
                 return
 
+            chunks = []
+            stream = None
+
+            def produce(cancel_event):
+                nonlocal stream
+                stream = stream_ai_insights(config, messages, cancel_event)
+                return stream
+
+            def on_chunk(text):
+                chunks.append(text)
+                report_text.insert(tk.END, text)
+                report_text.see(tk.END)
+                status_var.set("Receiving response...")
+
+            def on_done(cancelled):
+                set_running(False)
+                # This request's own timing, not whichever pooled request finished last
+                timing = stream.timing if stream is not None else None
+                if cancelled:
+                    status_var.set("Cancelled.")
+                    return
+                status_var.set(f"{timing.describe()}; {summary.describe()}" if timing else summary.describe())
+                self.response_cache.put(key, "".join(chunks).strip(),
+                                        provider=config.provider, model=config.model)
+
+            def on_error(exc):
+                set_running(False)
+                status_var.set("")
+                messagebox.showerror("AI Request Failed", str(exc), parent=win)
+
             report_text.delete("1.0", tk.END)
-            report_text.insert("1.0", insights)
+            status_var.set(f"Waiting for response... ({summary.describe()})")
+            set_running(True)
+            report_task = StreamingTask(
+                win,
+                produce,
+                on_chunk,
+                on_done,
+                on_error,
+            ).start()
+
+        def cancel_report():
+            if report_task is not None:
+                report_task.cancel()
+
+        def on_destroy(event):
+            if event.widget is win and report_task is not None:
+                report_task.cancel(notify=False)
+
+        generate_button = ttk.Button(options, text="Generate Report", command=run_report)
+        generate_button.grid(row=0, column=4, sticky="e", padx=(15, 0))
+        regenerate_button = ttk.Button(options, text="Regenerate", command=lambda: run_report(regenerate=True))
+        regenerate_button.grid(row=0, column=5, sticky="e", padx=(5, 0))
+        cancel_button = ttk.Button(options, text="Cancel", command=cancel_report, state="disabled")
+        cancel_button.grid(row=0, column=6, sticky="e", padx=(5, 0))
+        win.bind("<Destroy>", on_destroy, add="+")
+
+    def _start_fan_out(self, win, messages, first_wins, report_text, status_var, set_running):
+        """
+        Send the report prompt to several providers at once. First-wins mode shows the
+        first successful answer in report_text; side-by-side mode opens one column per
+        provider. Per-provider latency is shown either way.
+        """
+        configs = self._fan_out_configs()
+        names = {id(config): preset for preset, config in configs}
+        results = []
+        columns = {}
+
+        def describe_results():
+            return " | ".join(
+                f"{names[id(r.config)]}: {r.latency_ms / 1000:.1f} s" if r.ok
+                else f"{names[id(r.config)]}: failed" for r in results
+            )
 
-        ttk.Button(options, text="Generate Report", command=run_report).grid(
-            row=0, column=4, sticky="e", padx=(15, 0)
-        )
+        if not first_wins:
+            compare_win = create_child_window(win, title="AI Provider Comparison",
+                                              geometry="1200x600", minsize=(800, 400))
+            panes = ttk.PanedWindow(compare_win, orient="horizontal")
+            panes.pack(fill="both", expand=True, padx=10, pady=10)
+            for preset, config in configs:
+                column = ttk.LabelFrame(panes, text=f"{preset} ({config.model})", padding=5)
+                latency_var = tk.StringVar(value="Waiting for response...")
+                ttk.Label(column, textvariable=latency_var, foreground="gray").pack(anchor="w")
+                text = tk.Text(column, wrap="word", font=("Arial", 10), width=40)
+                text.pack(fill="both", expand=True)
+                panes.add(column, weight=1)
+                columns[id(config)] = (text, latency_var)
+
+        def on_result(result):
+            results.append(result)
+            seconds = result.latency_ms / 1000
+            if not first_wins:
+                text, latency_var = columns[id(result.config)]
+                if text.winfo_exists():
+                    text.insert("1.0", result.content if result.ok else result.error)
+                    latency_var.set(f"{seconds:.1f} s" if result.ok else f"Failed after {seconds:.1f} s")
+            elif result.ok:
+                report_text.delete("1.0", tk.END)
+                report_text.insert("1.0", result.content)
+                self.response_cache.put(response_cache_key(result.config, messages), result.content,
+                                        provider=result.config.provider, model=result.config.model)
+            status_var.set(describe_results())
+
+        def on_done(cancelled):
+            set_running(False)
+            if cancelled:
+                status_var.set("Cancelled.")
+                return
+            if not first_wins:
+                return
+            winner = next((r for r in results if r.ok), None)
+            if winner is None:
+                status_var.set("No provider returned a response. " + describe_results())
+                errors = "\n\n".join(f"{names[id(r.config)]}: {r.error}" for r in results)
+                report_text.insert("1.0", errors)
+            else:
+                status_var.set(f"{names[id(winner.config)]} answered first ({describe_results()}); "
+                               "the other requests were cancelled.")
+
+        def on_error(exc):
+            set_running(False)
+            status_var.set("")
+            messagebox.showerror("AI Request Failed", str(exc), parent=win)
+
+        report_text.delete("1.0", tk.END)
+        status_var.set(f"Asking {len(configs)} provider(s)...")
+        set_running(True)
+        return StreamingTask(
+            win,
+            lambda cancel_event: fan_out_ai_insights([c for _, c in configs], messages, first_wins, cancel_event),
+            on_result,
+            on_done,
+            on_error,
+        ).start()
 
     def send_chat(self):
         user_message = self.chat_entry.get().strip()
-        if not user_message:
+        if not user_message or (self._chat_task is not None and self._chat_task.running):
             return
 
-        api_url = self._get_api_base_url()
         model = self.model_var.get().strip()
         api_key = self.api_key_entry.get().strip()
 
@@ -224,40 +437,68 @@ class AIInsightsTab:
         month_str = self.last_month
         months_back = self.last_months_back
 
-        provider_key = self.provider_var.get()
-        provider_map = {
-            "Google Gemini": "google",
-            "OpenAI-Compatible": "openai",
-            "Groq": "groq",
-        }
-        config = AIConfig(
-            provider=provider_map.get(provider_key, "openai"),
-            api_base_url=api_url,
-            api_key=api_key,
-            model=model,
-        )
+        config = self._build_config()
         self._persist_api_key()
 
+        self.chat_history, self.chat_digest = compact_chat_history(self.chat_history, self.chat_digest)
         messages = build_chat_messages(
             self.state,
             month_str,
             months_back,
             self.chat_history,
             user_message,
+            self.chat_digest,
         )
 
         self.chat_history.append({"role": "user", "content": user_message})
         self._append_chat("You", user_message)
         self.chat_entry.delete(0, tk.END)
 
-        try:
-            response = request_ai_insights(config, messages)
-        except RuntimeError as exc:
+        self.chat_text.insert(tk.END, "AI: ")
+        chunks = []
+
+        def on_chunk(text):
+            chunks.append(text)
+            self.chat_text.insert(tk.END, text)
+            self.chat_text.see(tk.END)
+
+        def on_done(cancelled):
+            self._set_chat_running(False)
+            if cancelled:
+                self.chat_text.insert(tk.END, " [cancelled]\n\n")
+                self._drop_unanswered_message()
+                return
+            self.chat_text.insert(tk.END, "\n\n")
+            self.chat_text.see(tk.END)
+            self.chat_history.append({"role": "assistant", "content": "".join(chunks).strip()})
+
+        def on_error(exc):
+            self._set_chat_running(False)
+            self.chat_text.insert(tk.END, "[request failed]\n\n")
+            self._drop_unanswered_message()
             messagebox.showerror("AI Request Failed", str(exc))
-            return
 
-        self.chat_history.append({"role": "assistant", "content": response})
-        self._append_chat("AI", response)
+        self._set_chat_running(True)
+        self._chat_task = StreamingTask(
+            self.chat_text,
+            lambda cancel_event: stream_ai_insights(config, messages, cancel_event),
+            on_chunk,
+            on_done,
+            on_error,
+        ).start()
+
+    def cancel_chat(self):
+        if self._chat_task is not None:
+            self._chat_task.cancel()
+
+    def _set_chat_running(self, running):
+        self.send_button.config(state="disabled" if running else "normal")
+        self.cancel_chat_button.config(state="normal" if running else "disabled")
+
+    def _drop_unanswered_message(self):
+        # Keep the history alternating user/assistant when a turn got no answer
+        if self.chat_history and self.chat_history[-1]["role"] == "user":
+            self.chat_history.pop()
 
     def _append_chat(self, sender, message):
         self.chat_text.insert(tk.END, f"{sender}: {message}\n\n")
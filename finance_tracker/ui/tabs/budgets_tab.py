@@ -17,6 +17,7 @@ class BudgetsTab:
 
         main = ttk.Frame(notebook, padding="10")
         notebook.add(main, text="Budgets Limits")
+        self.frame = main
         main.rowconfigure(1, weight=1)
         main.columnconfigure(0, weight=1)
 
@@ -25,7 +26,7 @@ class BudgetsTab:
         ttk.Label(toolbar, text="Budget Month (YYYY-MM):").pack(side='left', padx=(0, 5))
         self.month_var = tk.StringVar(value=datetime.now().strftime("%Y-%m"))
         ttk.Entry(toolbar, textvariable=self.month_var, width=10).pack(side='left')
-        ttk.Button(toolbar, text="Refresh Amounts", command=self._update_monetary_labels).pack(side='left', padx=10)
+        ttk.Button(toolbar, text="Refresh Amounts", command=self.update_monetary_labels).pack(side='left', padx=10)
 
         group = ttk.LabelFrame(main, text="Category Budget Limits", padding="10")
         group.grid(row=1, column=0, sticky='nsew')
@@ -178,7 +179,7 @@ class BudgetsTab:
                 self.budget_sliders[c] = {'var': tk.DoubleVar(value=0), 'slider': None, 'label': None, 'amount_label': None}
 
         self._bind_mouse_wheel(self.sliders_frame)
-        self._update_monetary_labels()
+        self.update_monetary_labels()
         self._update_total_percentage_label()
 
     def _on_slider_change(self, changed_category, new_value):
@@ -190,7 +191,7 @@ class BudgetsTab:
         self.budget_sliders[changed_category]['label'].config(text=f"{new_value:.1f}%")
         self._adjust_other_sliders(changed_category, new_value, old_value)
         self._slider_lock = False
-        self._update_monetary_labels()
+        self.update_monetary_labels()
         self._update_total_percentage_label()
 
     def _adjust_other_sliders(self, changed_category, new_value, old_value):
@@ -222,9 +223,10 @@ class BudgetsTab:
                 norm = (cur / total) * 100.0
                 info['var'].set(norm)
                 info['label'].config(text=f"{norm:.1f}%")
-        self._update_monetary_labels()
+        self.update_monetary_labels()
 
-    def _update_monetary_labels(self):
+    def update_monetary_labels(self):
+        """Recompute the € amount beside each expense slider from the month's net available."""
         if self.cat_type_var.get() == 'Expense':
             month = self.month_var.get()
             nav = compute_net_available_for_spending(self.state, month)
@@ -297,7 +299,7 @@ class BudgetsTab:
             if cat in self.budget_sliders:
                 self.budget_sliders[cat]['var'].set(pct)
                 self.budget_sliders[cat]['label'].config(text=f"{pct:.1f}%")
-        self._update_monetary_labels()
+        self.update_monetary_labels()
         self._update_total_percentage_label()
         if overspent:
             messagebox.showwarning("Overspent", msg)
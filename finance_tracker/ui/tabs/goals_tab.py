@@ -17,9 +17,12 @@ from ...services.goals_service import (
     get_total_allocated,
     get_unallocated_savings,
     validate_allocation,
-    auto_distribute_savings
+    auto_distribute_savings,
+    ensure_goal_id
 )
+from ...services.goal_ledger import record_allocation
 from ..windowing import close_window, create_child_window
+from ...change_bus import TOPIC_GOALS
 
 class GoalsTab:
     def __init__(self, notebook, state):
@@ -27,6 +30,7 @@ class GoalsTab:
         
         main = ttk.Frame(notebook, padding="10")
         notebook.add(main, text="Savings Goals")
+        self.frame = main
         main.rowconfigure(2, weight=1)
         main.columnconfigure(0, weight=1)
         
@@ -129,6 +133,16 @@ class GoalsTab:
         ttk.Label(form, text="Target Date (YYYY-MM-DD):").grid(row=row, column=0, sticky='w', pady=5)
         self.goal_target_date_entry = ttk.Entry(form, width=25)
         self.goal_target_date_entry.grid(row=row, column=1, pady=5, sticky='ew')
+
+        row += 1
+        ttk.Label(form, text="Min Allocation (€, optional):").grid(row=row, column=0, sticky='w', pady=5)
+        self.goal_min_entry = ttk.Entry(form, width=25)
+        self.goal_min_entry.grid(row=row, column=1, pady=5, sticky='ew')
+
+        row += 1
+        ttk.Label(form, text="Max Allocation (€, optional):").grid(row=row, column=0, sticky='w', pady=5)
+        self.goal_max_entry = ttk.Entry(form, width=25)
+        self.goal_max_entry.grid(row=row, column=1, pady=5, sticky='ew')
         
         row += 1
         ttk.Separator(form, orient='horizontal').grid(row=row, column=0, columnspan=2, sticky='ew', pady=10)
@@ -141,7 +155,12 @@ class GoalsTab:
         ttk.Button(buttons_frame, text="Clear Form", command=self.clear_form).pack(side='left', padx=5)
         
         # Selected goal tracking
-        self.selected_goal_index = None
+        self.selected_goal_id = None
+        
+        # Goal cards by goal id, and their current display order
+        self._goal_cards = {}
+        self._card_order = []
+        self._empty_label = None
         
         # Initialize
         self.refresh_goals()
@@ -171,11 +190,10 @@ class GoalsTab:
             self._bind_mouse_wheel(child)
 
     def refresh_goals(self):
-        """Refresh the goals display"""
-        # Clear existing widgets
-        for widget in self.goals_container.winfo_children():
-            widget.destroy()
-        
+        """
+        Refresh the goals display. Cards are keyed by goal id and updated in place;
+        only cards of added or removed goals are created or destroyed.
+        """
         # Ensure goals list exists
         if 'savings_goals' not in self.state.budget_settings:
             self.state.budget_settings['savings_goals'] = []
@@ -188,23 +206,44 @@ class GoalsTab:
                 goal['allocated_amount'] = goal.get('current_amount', 0)
                 if 'current_amount' in goal:
                     del goal['current_amount']
-        
-        if not goals:
-            ttk.Label(self.goals_container, text="No goals yet. Create your first goal!", 
-                     font=('Arial', 10, 'italic')).pack(pady=20)
-        else:
-            # Sort goals: active first (by priority), then completed
-            active_goals = [g for g in goals if g.get('allocated_amount', 0) < g['target_amount']]
-            completed_goals = [g for g in goals if g.get('allocated_amount', 0) >= g['target_amount']]
-            
-            priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
-            active_goals.sort(key=lambda g: priority_order.get(g.get('priority', 'Medium'), 1))
-            
-            sorted_goals = active_goals + completed_goals
-            
-            for goal in sorted_goals:
-                original_index = goals.index(goal)
-                self._create_goal_widget(original_index, goal)
+            ensure_goal_id(goal)
+        
+        # Sort goals: active first (by priority), then completed
+        active_goals = [g for g in goals if g.get('allocated_amount', 0) < g['target_amount']]
+        completed_goals = [g for g in goals if g.get('allocated_amount', 0) >= g['target_amount']]
+        
+        priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
+        active_goals.sort(key=lambda g: priority_order.get(g.get('priority', 'Medium'), 1))
+        
+        sorted_goals = active_goals + completed_goals
+        order = [goal['id'] for goal in sorted_goals]
+        
+        # Destroy cards of removed goals
+        for goal_id in set(self._goal_cards) - set(order):
+            self._goal_cards.pop(goal_id).frame.destroy()
+        
+        if goals:
+            if self._empty_label is not None:
+                self._empty_label.destroy()
+                self._empty_label = None
+        elif self._empty_label is None:
+            self._empty_label = ttk.Label(self.goals_container, text="No goals yet. Create your first goal!", 
+                                          font=('Arial', 10, 'italic'))
+            self._empty_label.pack(pady=20)
+        
+        for goal in sorted_goals:
+            card = self._goal_cards.get(goal['id'])
+            if card is None:
+                card = self._goal_cards[goal['id']] = _GoalCard(self, goal['id'])
+            card.update(goal)
+        
+        # Re-pack only when the order changed
+        if order != self._card_order:
+            for goal_id in order:
+                self._goal_cards[goal_id].frame.pack_forget()
+            for goal_id in order:
+                self._goal_cards[goal_id].frame.pack(fill='x', padx=5, pady=5)
+            self._card_order = order
         
         # Update summaries
         self._update_savings_overview()
@@ -214,6 +253,19 @@ class GoalsTab:
         self.goals_canvas.update_idletasks()
         self._on_goals_frame_configure()
     
+    def _goal_index(self, goal_id):
+        """Current position of the goal with goal_id in the goals list, or None."""
+        if goal_id is None:
+            return None
+        goals = self.state.budget_settings.get('savings_goals', [])
+        return next((i for i, g in enumerate(goals) if g.get('id') == goal_id), None)
+    
+    def _on_card_action(self, action, goal_id):
+        """Run a card button's action on the goal's current index"""
+        index = self._goal_index(goal_id)
+        if index is not None:
+            action(index)
+    
     def _update_savings_overview(self):
         """Update the savings overview display"""
         total_savings = get_total_savings_available(self.state)
@@ -231,102 +283,6 @@ class GoalsTab:
         else:
             self.savings_overview_label.config(foreground='red')
     
-    def _create_goal_widget(self, index, goal):
-        """Create a widget for a single goal"""
-        progress = calculate_goal_progress(goal, goal.get('allocated_amount', 0))
-        
-        # Main goal frame
-        goal_frame = ttk.Frame(self.goals_container, relief='solid', borderwidth=1)
-        goal_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Bind mouse wheel for scrolling
-        self._bind_mouse_wheel(goal_frame)
-        
-        # Highlight if completed
-        if progress['is_complete']:
-            goal_frame.configure(style='Complete.TFrame')
-        
-        # Header
-        header = ttk.Frame(goal_frame)
-        header.pack(fill='x', padx=10, pady=(10, 5))
-        
-        # Goal name and category
-        name_frame = ttk.Frame(header)
-        name_frame.pack(side='left', fill='x', expand=True)
-        
-        name_label = ttk.Label(name_frame, text=goal['name'], font=('Arial', 11, 'bold'))
-        name_label.pack(side='left')
-        
-        if goal.get('priority'):
-            priority_colors = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
-            priority_label = ttk.Label(header, text=goal['priority'], 
-                                      foreground=priority_colors.get(goal['priority'], 'black'),
-                                      font=('Arial', 9, 'bold'))
-            priority_label.pack(side='right', padx=5)
-        
-        # Description
-        if goal.get('description'):
-            desc_label = ttk.Label(goal_frame, text=goal['description'], 
-                                  font=('Arial', 9), foreground='gray')
-            desc_label.pack(anchor='w', padx=10, pady=(0, 5))
-        
-        # Amounts
-        amounts_frame = ttk.Frame(goal_frame)
-        amounts_frame.pack(fill='x', padx=10, pady=5)
-        
-        allocated = goal.get('allocated_amount', 0)
-        ttk.Label(amounts_frame, text=f"€{allocated:,.2f} / €{goal['target_amount']:,.2f}",
-                 font=('Arial', 10, 'bold')).pack(side='left')
-        ttk.Label(amounts_frame, text=f"  (€{progress['remaining']:,.2f} remaining)",
-                 font=('Arial', 9), foreground='gray').pack(side='left')
-        
-        # Progress bar
-        progress_frame = ttk.Frame(goal_frame)
-        progress_frame.pack(fill='x', padx=10, pady=5)
-        
-        progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate', 
-                                      value=progress['progress_pct'])
-        progress_bar.pack(side='left', fill='x', expand=True)
-        
-        progress_label = ttk.Label(progress_frame, text=f"{progress['progress_pct']:.1f}%", 
-                                  font=('Arial', 9, 'bold'))
-        progress_label.pack(side='left', padx=5)
-        
-        # Completion estimate
-        if progress['is_complete']:
-            complete_label = ttk.Label(goal_frame, text="✓ Goal Achieved!", 
-                                      font=('Arial', 10, 'bold'), foreground='green')
-            complete_label.pack(anchor='w', padx=10, pady=(0, 5))
-            
-            if goal.get('completion_date'):
-                comp_date_label = ttk.Label(goal_frame, 
-                                           text=f"Completed: {goal['completion_date']}",
-                                           font=('Arial', 8), foreground='gray')
-                comp_date_label.pack(anchor='w', padx=10, pady=(0, 5))
-        else:
-            # Target date only (no required amount in view)
-            if goal.get('target_date'):
-                target_date_frame = ttk.Frame(goal_frame)
-                target_date_frame.pack(fill='x', padx=10, pady=(0, 5))
-                
-                ttk.Label(target_date_frame, text=f"Target Date: {goal['target_date']}", 
-                          font=('Arial', 9, 'italic')).pack(side='left')
-
-        # Buttons
-        button_frame = ttk.Frame(goal_frame)
-        button_frame.pack(fill='x', padx=10, pady=(5, 10))
-        
-        ttk.Button(button_frame, text="Edit", 
-                  command=lambda i=index: self.select_goal(i)).pack(side='left', padx=2)
-        ttk.Button(button_frame, text="Allocate Savings", 
-                  command=lambda i=index: self.allocate_to_goal(i)).pack(side='left', padx=2)
-        ttk.Button(button_frame, text="Delete", 
-                  command=lambda i=index: self.delete_goal(i)).pack(side='left', padx=2)
-        
-        if progress['is_complete']:
-            ttk.Button(button_frame, text="Archive", 
-                      command=lambda i=index: self.archive_goal(i)).pack(side='left', padx=2)
-    
     def _update_summary(self):
         """Update the summary label"""
         summary = calculate_all_goals_summary(self.state)
@@ -339,6 +295,24 @@ class GoalsTab:
         
         self.summary_label.config(text=text)
     
+    def _read_allocation_bounds(self, target):
+        """Parse the optional min/max allocation fields; raises ValueError on bad input."""
+        bounds = []
+        for entry in (self.goal_min_entry, self.goal_max_entry):
+            text = entry.get().strip()
+            try:
+                bounds.append(float(text) if text else None)
+            except ValueError:
+                raise ValueError("Invalid allocation limit. Please enter a number.")
+        minimum, maximum = bounds
+        if (minimum is not None and minimum < 0) or (maximum is not None and maximum < 0):
+            raise ValueError("Allocation limits cannot be negative.")
+        if minimum is not None and maximum is not None and minimum > maximum:
+            raise ValueError("Min allocation cannot be larger than max allocation.")
+        if minimum is not None and minimum > target:
+            raise ValueError("Min allocation cannot be larger than the target amount.")
+        return minimum, maximum
+
     def add_goal(self):
         """Add a new goal"""
         try:
@@ -359,6 +333,12 @@ class GoalsTab:
                 except ValueError:
                     messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD.")
                     return
+
+            try:
+                min_allocation, max_allocation = self._read_allocation_bounds(target)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
             
             goal = {
                 'name': name,
@@ -368,8 +348,11 @@ class GoalsTab:
                 'priority': self.goal_priority_var.get(),
                 'target_date': target_date_str if target_date_str else None,
                 'created_date': date.today().strftime('%Y-%m-%d'),
-                'completion_date': None
+                'completion_date': None,
+                'min_allocation': min_allocation,
+                'max_allocation': max_allocation
             }
+            ensure_goal_id(goal)
             
             if 'savings_goals' not in self.state.budget_settings:
                 self.state.budget_settings['savings_goals'] = []
@@ -378,7 +361,7 @@ class GoalsTab:
             self.state.save()
             
             self.clear_form()
-            self.refresh_goals()
+            self.state.publish(TOPIC_GOALS)
             messagebox.showinfo("Success", f"Goal '{name}' added successfully!\nNow allocate savings to this goal.")
             
         except ValueError:
@@ -391,7 +374,7 @@ class GoalsTab:
             return
         
         goal = goals[index]
-        self.selected_goal_index = index
+        self.selected_goal_id = ensure_goal_id(goal)
         
         self.goal_name_entry.delete(0, tk.END)
         self.goal_name_entry.insert(0, goal['name'])
@@ -406,10 +389,16 @@ class GoalsTab:
 
         self.goal_target_date_entry.delete(0, tk.END)
         self.goal_target_date_entry.insert(0, goal.get('target_date', ''))
+
+        for entry, key in ((self.goal_min_entry, 'min_allocation'), (self.goal_max_entry, 'max_allocation')):
+            entry.delete(0, tk.END)
+            if goal.get(key) is not None:
+                entry.insert(0, str(goal[key]))
     
     def update_goal(self):
         """Update the selected goal"""
-        if self.selected_goal_index is None:
+        index = self._goal_index(self.selected_goal_id)
+        if index is None:
             messagebox.showwarning("Warning", "Please select a goal to update.")
             return
         
@@ -433,8 +422,14 @@ class GoalsTab:
                     messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD.")
                     return
 
+            try:
+                min_allocation, max_allocation = self._read_allocation_bounds(target)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+
             goals = self.state.budget_settings['savings_goals']
-            goal = goals[self.selected_goal_index]
+            goal = goals[index]
             
             # Check if goal was just completed
             was_complete = goal.get('allocated_amount', 0) >= goal['target_amount']
@@ -445,6 +440,8 @@ class GoalsTab:
             goal['target_amount'] = target
             goal['priority'] = self.goal_priority_var.get()
             goal['target_date'] = target_date_str if target_date_str else None
+            goal['min_allocation'] = min_allocation
+            goal['max_allocation'] = max_allocation
             
             if is_complete and not was_complete:
                 goal['completion_date'] = date.today().strftime('%Y-%m-%d')
@@ -453,7 +450,7 @@ class GoalsTab:
             
             self.state.save()
             self.clear_form()
-            self.refresh_goals()
+            self.state.publish(TOPIC_GOALS)
             messagebox.showinfo("Success", "Goal updated successfully!")
             
         except ValueError:
@@ -479,7 +476,7 @@ class GoalsTab:
         del goals[index]
         self.state.save()
         self.clear_form()
-        self.refresh_goals()
+        self.state.publish(TOPIC_GOALS)
     
     def archive_goal(self, index):
         """Archive a completed goal"""
@@ -499,7 +496,7 @@ class GoalsTab:
         # Could implement an archived goals list here
         del goals[index]
         self.state.save()
-        self.refresh_goals()
+        self.state.publish(TOPIC_GOALS)
         messagebox.showinfo("Archived", f"Goal '{goal['name']}' has been archived.")
     
     def allocate_to_goal(self, index):
@@ -581,7 +578,7 @@ class GoalsTab:
                     return
                 
                 old_allocation = goal.get('allocated_amount', 0)
-                goal['allocated_amount'] = new_allocation
+                record_allocation(goal, new_allocation)
                 
                 # Check if goal just completed
                 was_complete = old_allocation >= goal['target_amount']
@@ -597,7 +594,7 @@ class GoalsTab:
                 
                 self.state.save()
                 close_window(dialog)
-                self.refresh_goals()
+                self.state.publish(TOPIC_GOALS)
                 
             except ValueError:
                 status_label.config(text="Invalid amount.")
@@ -620,15 +617,16 @@ class GoalsTab:
         
         if not messagebox.askyesno("Auto-Distribute", 
                                    f"Automatically distribute €{unallocated:.2f} across your goals?\n\n"
-                                   "This will prioritize high-priority goals and try to complete goals in order."):
+                                   "Goals that are due sooner or have a higher priority are funded first, "
+                                   "within each goal's min/max allocation."):
             return
         
         success, message = auto_distribute_savings(self.state)
         
         if success:
             self.state.save()
-            self.refresh_goals()
-            messagebox.showinfo("Success", message)
+            self.state.publish(TOPIC_GOALS)
+            self._show_text_window("Auto-Distribute Result", message, geometry="800x450")
         else:
             messagebox.showwarning("Cannot Distribute", message)
     
@@ -638,17 +636,24 @@ class GoalsTab:
         self.goal_desc_entry.delete(0, tk.END)
         self.goal_target_entry.delete(0, tk.END)
         self.goal_target_date_entry.delete(0, tk.END)
+        self.goal_min_entry.delete(0, tk.END)
+        self.goal_max_entry.delete(0, tk.END)
         self.goal_priority_var.set("Medium")
-        self.selected_goal_index = None
+        self.selected_goal_id = None
     
     def show_report(self):
         """Show goals report in a new window"""
         report_text = generate_goals_report(self.state)
-        
+        report_win, button_frame = self._show_text_window("Savings Goals Report", report_text)
+        ttk.Button(button_frame, text="Export", 
+                  command=lambda: self.export_report(report_text, parent=report_win)).pack(side='right')
+
+    def _show_text_window(self, title, text, geometry="900x700"):
+        """Show read-only text in a child window; returns (window, button_frame)."""
         report_win = create_child_window(
             self.goals_container,
-            title="Savings Goals Report",
-            geometry="900x700",
+            title=title,
+            geometry=geometry,
         )
         
         main_frame = ttk.Frame(report_win, padding=10)
@@ -661,15 +666,14 @@ class GoalsTab:
         scrollbar.pack(side='right', fill='y')
         text_widget.pack(side='left', fill='both', expand=True)
         
-        text_widget.insert('1.0', report_text)
+        text_widget.insert('1.0', text)
         text_widget.config(state='disabled')
         
         button_frame = ttk.Frame(report_win, padding=10)
         button_frame.pack(fill='x')
-        ttk.Button(button_frame, text="Export", 
-                  command=lambda: self.export_report(report_text, parent=report_win)).pack(side='right')
         ttk.Button(button_frame, text="Close", 
                   command=lambda: close_window(report_win)).pack(side='right', padx=5)
+        return report_win, button_frame
     
     def export_report(self, report_text=None, parent=None):
         """Export goals report to file"""
@@ -693,4 +697,117 @@ class GoalsTab:
                 f.write(report_text)
             messagebox.showinfo("Success", f"Report successfully exported to:\n{path}", parent=parent)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to export report.\nError: {e}", parent=parent)
\ No newline at end of file
+            messagebox.showerror("Error", f"Failed to export report.\nError: {e}", parent=parent)
+
+
+class _GoalCard:
+    """
+    The widgets of one goal card. All optional rows are created once and shown or
+    hidden with grid/grid_remove, so update() only reconfigures existing widgets.
+    """
+    
+    PRIORITY_COLORS = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
+    
+    def __init__(self, tab, goal_id):
+        self.signature = None
+        self.frame = ttk.Frame(tab.goals_container, relief='solid', borderwidth=1)
+        self.frame.columnconfigure(0, weight=1)
+        
+        # Header
+        header = ttk.Frame(self.frame)
+        header.grid(row=0, column=0, sticky='ew', padx=10, pady=(10, 5))
+        self.name_label = ttk.Label(header, font=('Arial', 11, 'bold'))
+        self.name_label.pack(side='left')
+        self.priority_label = ttk.Label(header, font=('Arial', 9, 'bold'))
+        self.priority_label.pack(side='right', padx=5)
+        
+        # Description
+        self.desc_label = ttk.Label(self.frame, font=('Arial', 9), foreground='gray')
+        self.desc_label.grid(row=1, column=0, sticky='w', padx=10, pady=(0, 5))
+        
+        # Amounts
+        amounts_frame = ttk.Frame(self.frame)
+        amounts_frame.grid(row=2, column=0, sticky='ew', padx=10, pady=5)
+        self.amounts_label = ttk.Label(amounts_frame, font=('Arial', 10, 'bold'))
+        self.amounts_label.pack(side='left')
+        self.remaining_label = ttk.Label(amounts_frame, font=('Arial', 9), foreground='gray')
+        self.remaining_label.pack(side='left')
+        
+        # Progress bar
+        progress_frame = ttk.Frame(self.frame)
+        progress_frame.grid(row=3, column=0, sticky='ew', padx=10, pady=5)
+        self.progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate')
+        self.progress_bar.pack(side='left', fill='x', expand=True)
+        self.progress_label = ttk.Label(progress_frame, font=('Arial', 9, 'bold'))
+        self.progress_label.pack(side='left', padx=5)
+        
+        # Completion status, then completion or target date
+        self.complete_label = ttk.Label(self.frame, text="✓ Goal Achieved!", 
+                                        font=('Arial', 10, 'bold'), foreground='green')
+        self.complete_label.grid(row=4, column=0, sticky='w', padx=10, pady=(0, 5))
+        self.date_label = ttk.Label(self.frame)
+        self.date_label.grid(row=5, column=0, sticky='w', padx=10, pady=(0, 5))
+        
+        # Buttons
+        button_frame = ttk.Frame(self.frame)
+        button_frame.grid(row=6, column=0, sticky='ew', padx=10, pady=(5, 10))
+        for text, action in (("Edit", tab.select_goal), ("Allocate Savings", tab.allocate_to_goal),
+                             ("Delete", tab.delete_goal)):
+            ttk.Button(button_frame, text=text, 
+                      command=lambda a=action: tab._on_card_action(a, goal_id)).pack(side='left', padx=2)
+        self.archive_button = ttk.Button(button_frame, text="Archive", 
+                                         command=lambda: tab._on_card_action(tab.archive_goal, goal_id))
+        
+        # Bind mouse wheel for scrolling
+        tab._bind_mouse_wheel(self.frame)
+    
+    def update(self, goal):
+        """Show the goal's current values; does nothing if they have not changed."""
+        signature = tuple(goal.get(key) for key in (
+            'name', 'priority', 'description', 'allocated_amount', 'target_amount',
+            'completion_date', 'target_date'))
+        if signature == self.signature:
+            return
+        self.signature = signature
+        progress = calculate_goal_progress(goal, goal.get('allocated_amount', 0))
+        is_complete = progress['is_complete']
+        
+        # Highlight if completed
+        self.frame.configure(style='Complete.TFrame' if is_complete else 'TFrame')
+        
+        self.name_label.configure(text=goal['name'])
+        if goal.get('priority'):
+            self.priority_label.configure(text=goal['priority'], 
+                                          foreground=self.PRIORITY_COLORS.get(goal['priority'], 'black'))
+            self.priority_label.pack(side='right', padx=5)
+        else:
+            self.priority_label.pack_forget()
+        
+        if goal.get('description'):
+            self.desc_label.configure(text=goal['description'])
+            self.desc_label.grid()
+        else:
+            self.desc_label.grid_remove()
+        
+        allocated = goal.get('allocated_amount', 0)
+        self.amounts_label.configure(text=f"€{allocated:,.2f} / €{goal['target_amount']:,.2f}")
+        self.remaining_label.configure(text=f"  (€{progress['remaining']:,.2f} remaining)")
+        self.progress_bar.configure(value=progress['progress_pct'])
+        self.progress_label.configure(text=f"{progress['progress_pct']:.1f}%")
+        
+        if is_complete:
+            self.complete_label.grid()
+            date_text = f"Completed: {goal['completion_date']}" if goal.get('completion_date') else ""
+            self.date_label.configure(font=('Arial', 8), foreground='gray')
+            self.archive_button.pack(side='left', padx=2)
+        else:
+            # Target date only (no required amount in view)
+            self.complete_label.grid_remove()
+            date_text = f"Target Date: {goal['target_date']}" if goal.get('target_date') else ""
+            self.date_label.configure(font=('Arial', 9, 'italic'), foreground='')
+            self.archive_button.pack_forget()
+        if date_text:
+            self.date_label.configure(text=date_text)
+            self.date_label.grid()
+        else:
+            self.date_label.grid_remove()
@@ -9,6 +9,7 @@ from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, date
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from ...services.net_worth_history import reconstruct_net_worth
 from ...services.asset_tracking_service import (
     record_asset_snapshot, 
     get_asset_snapshots, 
@@ -20,6 +21,7 @@ from ...services.asset_tracking_service import (
 )
 from ..charts import create_net_worth_figure, create_allocation_figure, create_breakdown_figure
 from ..windowing import close_window, create_child_window
+from ...change_bus import TOPIC_SNAPSHOTS
 
 class NetWorthTab:
     def __init__(self, notebook, state):
@@ -29,6 +31,7 @@ class NetWorthTab:
 
         main = ttk.Frame(notebook, padding="10")
         notebook.add(main, text="Net Worth")
+        self.frame = main
         main.rowconfigure(2, weight=1)
         main.columnconfigure(0, weight=1)
         
@@ -244,7 +247,7 @@ class NetWorthTab:
             self.snapshot_date_entry.delete(0, tk.END)
             self.snapshot_date_entry.insert(0, date.today().strftime('%Y-%m-%d'))
             
-            self.refresh()
+            self.state.publish(TOPIC_SNAPSHOTS)
             
         except ValueError:
             messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
@@ -265,7 +268,7 @@ class NetWorthTab:
         
         delete_snapshot(self.state, snapshot_date)
         self.state.save()
-        self.refresh()
+        self.state.publish(TOPIC_SNAPSHOTS)
 
     def generate_chart(self):
         """Generate the selected chart type"""
@@ -304,7 +307,7 @@ class NetWorthTab:
             }
             snapshots = snapshots + [current_snapshot]
         
-        fig = create_net_worth_figure(snapshots)
+        fig = create_net_worth_figure(snapshots, reconstruct_net_worth(self.state))
         
         self.canvas = FigureCanvasTkAgg(fig, master=self.chart_container)
         self.canvas.draw()
@@ -8,7 +8,12 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import filedialog, messagebox, ttk
 
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from ...services.cash_flow_service import project_cash_flow
 from ...services.projection_service import projection_text
+from ..charts import create_cash_flow_figure
+from ..windowing import create_child_window
 
 
 class ProjectionTab:
@@ -44,6 +49,20 @@ class ProjectionTab:
             variable=self.projection_mode,
             command=self._update_mode_controls,
         ).pack(side="left", padx=2)
+        ttk.Radiobutton(
+            controls,
+            text="Daily cash flow",
+            value="cash_flow",
+            variable=self.projection_mode,
+            command=self._update_mode_controls,
+        ).pack(side="left", padx=2)
+        ttk.Radiobutton(
+            controls,
+            text="Monte Carlo simulation",
+            value="monte_carlo",
+            variable=self.projection_mode,
+            command=self._update_mode_controls,
+        ).pack(side="left", padx=2)
 
         self.analysis_months_label = ttk.Label(controls, text="Months to analyze:")
         self.analysis_months_label.pack(side="left", padx=(15, 5))
@@ -53,6 +72,8 @@ class ProjectionTab:
 
         ttk.Button(controls, text="Generate Projection", command=self.generate).pack(side="left", padx=20)
         ttk.Button(controls, text="Export Projection", command=self.export).pack(side="left", padx=5)
+        self.chart_button = ttk.Button(controls, text="Show Chart", command=self.show_chart)
+        self.chart_button.pack(side="left", padx=5)
 
         self.text = tk.Text(main, height=20, width=90, font=("Courier New", 9))
         self.text.grid(row=1, column=0, sticky="nsew", pady=10)
@@ -60,27 +81,37 @@ class ProjectionTab:
         self._update_mode_controls()
 
     def _update_mode_controls(self):
-        state = "normal" if self.projection_mode.get() == "net_worth_change" else "disabled"
+        uses_history = self.projection_mode.get() in ("net_worth_change", "cash_flow", "monte_carlo")
+        state = "normal" if uses_history else "disabled"
         self.analysis_months_entry.configure(state=state)
+        self.chart_button.configure(state="normal" if self.projection_mode.get() == "cash_flow" else "disabled")
 
-    def generate(self):
+    def _read_months(self):
+        """Return (months, analysis_months), or None after showing an error."""
         try:
             months = int(self.months_entry.get())
             if months <= 0:
                 messagebox.showerror("Error", "Number of months must be positive.")
-                return
+                return None
         except ValueError:
             messagebox.showerror("Error", "Invalid number of months.")
-            return
+            return None
 
         try:
             analysis_months = int(self.analysis_months_entry.get())
             if analysis_months <= 0:
                 messagebox.showerror("Error", "Months to analyze must be positive.")
-                return
+                return None
         except ValueError:
             messagebox.showerror("Error", "Invalid number of months to analyze.")
+            return None
+        return months, analysis_months
+
+    def generate(self):
+        values = self._read_months()
+        if values is None:
             return
+        months, analysis_months = values
 
         report = projection_text(
             self.state,
@@ -91,6 +122,18 @@ class ProjectionTab:
         self.text.delete("1.0", tk.END)
         self.text.insert("1.0", report)
 
+    def show_chart(self):
+        values = self._read_months()
+        if values is None:
+            return
+        months, analysis_months = values
+
+        projection = project_cash_flow(self.state, months, analysis_months)
+        win = create_child_window(self.text, title="Projected Daily Balance", geometry="900x560")
+        canvas = FigureCanvasTkAgg(create_cash_flow_figure(projection), master=win)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
     def export(self):
         content = self.text.get("1.0", tk.END).strip()
         if not content:
@@ -60,9 +60,8 @@ def _find_candidates(
 
 
 class ReconciliationTab:
-    def __init__(self, notebook: ttk.Notebook, state, on_data_changed):
+    def __init__(self, notebook: ttk.Notebook, state):
         self.state = state
-        self.on_data_changed = on_data_changed
 
         self._bank_txns: list[BankTransaction] = []
         self._unmatched_month: list[BankTransaction] = []
@@ -503,7 +502,6 @@ class ReconciliationTab:
                                    desc or t.payee)
         t.status = STATUS_MATCHED
         t.match_confidence = "reconciled"
-        self.on_data_changed()
         self._analyse()   # refresh everything
 
     def _add_all_candidates(self):
@@ -519,16 +517,17 @@ class ReconciliationTab:
             parent=self.frame,
         ):
             return
+        new_rows = []
         for t, _ in candidates:
             cat  = t.suggested_category
             cats = self.state.categories.get(t.tx_type, ["Other"])
             if cat not in cats:
                 cat = cats[-1]
             desc = t.payee if t.payee else t.purpose
-            self.state.add_transaction(t.tx_type, t.date, abs(t.amount),
-                                       cat, desc[:60])
+            new_rows.append((t.tx_type, t.date, abs(t.amount), cat, desc[:60]))
             t.status = STATUS_MATCHED
-        self.on_data_changed()
+        # One save for the whole batch
+        self.state.add_transactions(new_rows)
         self._analyse()
         messagebox.showinfo("Done",
                             f"Added {len(candidates)} transaction(s).",
@@ -541,13 +540,10 @@ class ReconciliationTab:
                                    "Select a Reconciliation entry to delete.",
                                    parent=self.frame)
             return
-        entry_id = sel[0]
-        entry = next(
-            (e for e in self._recon_entries
-             if str(e.get("id", id(e))) == str(entry_id)),
-            None)
-        if not entry:
+        found = self.state.get_transaction(sel[0])
+        if not found or found[0] != "Expense":
             return
+        entry = found[1]
         if not messagebox.askyesno(
             "Delete placeholder",
             f"Delete the Reconciliation entry of €{entry['amount']:.2f} "
@@ -558,7 +554,6 @@ class ReconciliationTab:
         ):
             return
         self.state.delete_transaction_by_id("Expense", entry.get("id", ""))
-        self.on_data_changed()
         self._analyse()
 
     # ──────────────────────────────────────────────────────────────────────
@@ -8,12 +8,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from ... import perf
+from ...change_bus import TOPIC_BALANCES, TOPIC_FIXED_COSTS, TOPIC_INCOME_SOURCES
+from ...ids import new_ulid
 from ...services.budget_calculator import (
     generate_daily_budget_report,
     get_active_fixed_costs,
     get_active_monthly_income_sources,
 )
 from ..charts import create_budget_depletion_figure
+from ..performance_window import show_performance
 from ..windowing import close_window, create_child_window
 
 class SettingsTab:
@@ -26,12 +30,15 @@ class SettingsTab:
         self.show_inactive_income_sources = tk.BooleanVar(value=False)
         self.show_inactive_fixed_costs = tk.BooleanVar(value=False)
         self.include_negative_carryover = tk.BooleanVar(value=False)
+        self.performance_monitoring = tk.BooleanVar(value=perf.is_enabled())
         self.daily_budget_window = None
         self.budget_month_entry = None
         self.report_text = None
+        self._shown_balances = {}
 
         main = ttk.Frame(notebook, padding="10")
         notebook.add(main, text="Budget Report")
+        self.frame = main
         main.rowconfigure(0, weight=1)
         main.columnconfigure(0, weight=1)
 
@@ -87,6 +94,12 @@ class SettingsTab:
         self.daily_budget_btn.pack(side='left', padx=(0, 5))
         ttk.Button(button_row, text="Save Settings", command=self.save_settings).pack(side='left')
 
+        # Session-only: timings are not stored in the (synced) data file
+        ttk.Checkbutton(settings, text="Performance monitoring", variable=self.performance_monitoring,
+                        command=self._toggle_performance_monitoring).grid(row=9, column=0, sticky='w', pady=(10, 0))
+        ttk.Button(settings, text="Performance...",
+                   command=lambda: show_performance(self.frame)).grid(row=9, column=1, sticky='e', pady=(10, 0))
+
         # === Budget Depletion Graph ===
         manage = ttk.Frame(top)
         manage.grid(row=0, column=1, sticky='nsew')
@@ -105,7 +118,25 @@ class SettingsTab:
         self.refresh_balance_entries()
         # self.refresh_income_tree() # Moved to manager window
         self._update_costs_display()
-        self._refresh_budget_graph()
+        self.refresh_budget_graph()
+
+    def _toggle_performance_monitoring(self):
+        if self.performance_monitoring.get():
+            perf.enable()
+        else:
+            perf.disable()
+
+    def refresh_fixed_costs(self):
+        """Refresh every widget derived from fixed costs."""
+        self.refresh_fixed_costs_tree()
+        self._update_costs_display()
+        self.refresh_budget_graph()
+
+    def refresh_income_sources(self):
+        """Refresh every widget derived from base monthly income sources."""
+        self.refresh_income_tree()
+        self._update_income_display()
+        self.refresh_budget_graph()
 
     def _update_income_display(self):
         """Update the readonly income display with CURRENT month's active income."""
@@ -128,7 +159,7 @@ class SettingsTab:
         self.costs_entry_display.insert(0, f"{total_costs:.2f}")
         self.costs_entry_display.config(state='readonly')
 
-    def _refresh_budget_graph(self):
+    def refresh_budget_graph(self):
         """Render the budget depletion graph in the main UI."""
         # Use current month or the one selected in report if they match? 
         # Usually dashboard should show CURRENT month.
@@ -520,7 +551,7 @@ class SettingsTab:
             return
 
         # Create loan record
-        loan_id = f"{datetime.now().timestamp()}"
+        loan_id = new_ulid()
         description = self.loan_desc_entry.get().strip()
         loan = {
             'id': loan_id,
@@ -538,11 +569,11 @@ class SettingsTab:
         # Update money lent balance
         self.state.budget_settings['money_lent_balance'] = self.state.budget_settings.get('money_lent_balance', 0) + amount
         self.state.save()
+        self.state.publish(TOPIC_BALANCES)
 
         # Refresh UI
         self._refresh_loans_tree()
         self._update_loan_balance_label()
-        self._update_money_lent_button()
 
         # Clear form and reset edit mode
         self._clear_loan_form()
@@ -598,11 +629,11 @@ class SettingsTab:
                 amount_diff = new_amount - old_amount
                 self.state.budget_settings['money_lent_balance'] = self.state.budget_settings.get('money_lent_balance', 0) + amount_diff
                 self.state.save()
+                self.state.publish(TOPIC_BALANCES)
 
                 # Refresh UI
                 self._refresh_loans_tree()
                 self._update_loan_balance_label()
-                self._update_money_lent_button()
 
                 # Clear form and reset edit mode
                 self._clear_loan_form()
@@ -631,11 +662,11 @@ class SettingsTab:
                 # Update money lent balance
                 self.state.budget_settings['money_lent_balance'] = self.state.budget_settings.get('money_lent_balance', 0) - amount
                 self.state.save()
+                self.state.publish(TOPIC_BALANCES)
 
                 # Refresh UI
                 self._refresh_loans_tree()
                 self._update_loan_balance_label()
-                self._update_money_lent_button()
 
                 messagebox.showinfo("Success", f"Loan of €{amount:.2f} from {borrower} marked as returned.", parent=loan_win)
                 return
@@ -650,9 +681,14 @@ class SettingsTab:
     def refresh_balance_entries(self):
         s = self.state.budget_settings
         def set_entry(entry, key):
+            # Keep unsaved edits: loan and other balance changes also land here
+            shown = self._shown_balances.get(key)
+            if shown is not None and entry.get() != shown:
+                return
+            text = str(s.get(key, 0))
             entry.delete(0, tk.END)
-            entry.delete(0, tk.END)
-            entry.insert(0, str(s.get(key, 0)))
+            entry.insert(0, text)
+            self._shown_balances[key] = text
         
         self._update_income_display() # New display update logic
         self._update_costs_display()
@@ -682,6 +718,9 @@ class SettingsTab:
             s['investment_balance'] = float(self.investment_entry.get() or 0)
             s['daily_savings_goal'] = float(self.daily_savings_entry.get() or 0)
             self.state.save()
+            # Everything typed is stored now, so the refresh may rewrite every entry
+            self._shown_balances.clear()
+            self.state.publish(TOPIC_BALANCES)
             messagebox.showinfo("Success", "Settings saved!")
         except ValueError:
             messagebox.showerror("Error", "Invalid amount in one of the fields.")
@@ -810,9 +849,7 @@ class SettingsTab:
                 'end_date': end_date
             })
             self.state.save()
-            self.refresh_fixed_costs_tree()
-            self._update_costs_display()
-            self._refresh_budget_graph()
+            self.state.publish(TOPIC_FIXED_COSTS)
             
             self.fc_desc_entry.delete(0, tk.END)
             self.fc_amount_entry.delete(0, tk.END)
@@ -868,9 +905,7 @@ class SettingsTab:
                     }
                     break
             self.state.save()
-            self.refresh_fixed_costs_tree()
-            self._update_costs_display()
-            self._refresh_budget_graph()
+            self.state.publish(TOPIC_FIXED_COSTS)
         except ValueError:
             messagebox.showerror("Error", "Invalid amount for fixed cost.", parent=parent)
 
@@ -913,6 +948,14 @@ class SettingsTab:
                 break
 
     def refresh_income_tree(self):
+        # Only refresh if the manager window is open (tree exists)
+        if not hasattr(self, 'income_tree'):
+            return
+        try:
+            if not self.income_tree.winfo_exists():
+                return
+        except tk.TclError:
+            return
         for i in self.income_tree.get_children():
             self.income_tree.delete(i)
 
@@ -1046,9 +1089,7 @@ class SettingsTab:
 
         self.state.budget_settings['monthly_income'].append(data)
         self.state.save()
-        self.refresh_income_tree()
-        self._update_income_display()
-        self._refresh_budget_graph()
+        self.state.publish(TOPIC_INCOME_SOURCES)
         
         self.inc_desc_entry.delete(0, tk.END)
         self.inc_amount_entry.delete(0, tk.END)
@@ -1079,9 +1120,7 @@ class SettingsTab:
                 break
         
         self.state.save()
-        self.refresh_income_tree()
-        self._update_income_display()
-        self._refresh_budget_graph()
+        self.state.publish(TOPIC_INCOME_SOURCES)
 
     def delete_income(self):
         selected = self.income_tree.selection()
@@ -1112,16 +1151,12 @@ class SettingsTab:
                     elif response:
                         inc['end_date'] = datetime.now().strftime("%Y-%m-%d")
                         self.state.save()
-                        self.refresh_income_tree()
-                        self._update_income_display()
-                        self._refresh_budget_graph()
+                        self.state.publish(TOPIC_INCOME_SOURCES)
                         return
                 
                 del incomes[i]
                 self.state.save()
-                self.refresh_income_tree()
-                self._update_income_display()
-                self._refresh_budget_graph()
+                self.state.publish(TOPIC_INCOME_SOURCES)
                 return
 
     def delete_fixed_cost(self):
@@ -1154,7 +1189,7 @@ class SettingsTab:
                         end_date = datetime.now().strftime("%Y-%m-%d")
                         cost['end_date'] = end_date
                         self.state.save()
-                        self.refresh_fixed_costs_tree()
+                        self.state.publish(TOPIC_FIXED_COSTS)
                         messagebox.showinfo("Success", f"Cost archived with end date: {end_date}", parent=parent)
                         return
                     # else: fall through to delete
@@ -1162,9 +1197,7 @@ class SettingsTab:
                 # Permanently delete
                 del self.state.budget_settings['fixed_costs'][i]
                 self.state.save()
-                self.refresh_fixed_costs_tree()
-                self._update_costs_display()
-                self._refresh_budget_graph()
+                self.state.publish(TOPIC_FIXED_COSTS)
                 return
         
         messagebox.showerror("Error", "Could not find the selected fixed cost item.", parent=parent)
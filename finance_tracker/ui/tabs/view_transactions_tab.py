@@ -6,18 +6,47 @@ Tab for viewing, filtering, modifying, and deleting transactions.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import Counter
 from datetime import datetime
+from ...state import CHANGE_REMOVED
 from ...services.budget_calculator import get_active_fixed_costs, get_active_monthly_income
+from ...services.search_index import TransactionSearchIndex
+from ..sort_index import SortIndex
 from ..windowing import close_window, create_child_window
 
+# Filter comboboxes whose option sets are maintained from per-record counts
+_OPTION_FIELDS = ('month', 'date', 'category', 'description')
+# Above this many queued changes a full refresh is cheaper than replaying them
+_MAX_INCREMENTAL_CHANGES = 200
+# Number of ranked suggestions offered while typing in the description filter
+_DESCRIPTION_SUGGESTIONS = 15
+# Sort key per tree column; amounts are converted once per row when a column index is built
+_SORT_KEYS = {
+    'ID': lambda row: row.get('id', ''),
+    'Date': lambda row: row.get('date', ''),
+    'Behavior Date': lambda row: row.get('behavior_date', ''),
+    'Type': lambda row: row.get('type', ''),
+    'Amount': lambda row: float(row.get('amount', 0)),
+    'Category': lambda row: row.get('category', ''),
+    'Description': lambda row: row.get('description', ''),
+}
+# Rows are shown by date until a column header is clicked
+_DEFAULT_SORT = [('Date', False)]
+
+
 class ViewTransactionsTab:
-    def __init__(self, notebook, state, on_data_changed):
+    def __init__(self, notebook, state):
         self.state = state
-        self.on_data_changed = on_data_changed
         self._current_transactions = []
+        self._records_by_iid = {}  # Tree iid -> (trans_type, stored record)
+        self._rows_by_iid = {}  # Tree iid -> displayed row (copy of record with 'type')
+        self._option_counts = {name: Counter() for name in _OPTION_FIELDS}
+        self._option_keys = {}  # id(record) -> option values counted for it
         self._refresh_job = None
         self._sort_state = {}  # Track sort state for each column
-        self._current_sort = None  # Track current sort column and direction
+        self._sort_keys = []  # (column, descending) pairs, primary column first
+        self._sort_index = SortIndex(_SORT_KEYS)
+        self._search_index = TransactionSearchIndex(lambda: self.state.expenses + self.state.incomes)
 
         frame = ttk.Frame(notebook, padding="20")
         notebook.add(frame, text="View Transactions")
@@ -47,7 +76,8 @@ class ViewTransactionsTab:
         self.type_filter.pack(side='left', padx=5)
 
         ttk.Label(filter_row1, text="Description:").pack(side='left', padx=(15, 5))
-        self.description_filter = ttk.Combobox(filter_row1, width=28, state='readonly')
+        # Editable: typing searches descriptions and offers ranked suggestions
+        self.description_filter = ttk.Combobox(filter_row1, width=28)
         self.description_filter.pack(side='left', padx=5)
         
         #ttk.Button(filter_row1, text="Search", command=self.refresh).pack(side='left', padx=(15, 5))
@@ -58,6 +88,7 @@ class ViewTransactionsTab:
         self.date_filter.bind('<<ComboboxSelected>>', self._schedule_refresh)
         self.type_filter.bind('<<ComboboxSelected>>', self._schedule_refresh)
         self.description_filter.bind('<<ComboboxSelected>>', self._schedule_refresh)
+        self.description_filter.bind('<KeyRelease>', self._on_description_typed)
         
         # Initialize filter options
         self.update_filter_options()
@@ -79,6 +110,8 @@ class ViewTransactionsTab:
             self.transaction_tree.column(col, width=width, anchor='w')
 
         self.transaction_tree.column('ID', width=0, stretch=tk.NO)
+        # Shift+click on a header adds it as a secondary sort column
+        self.transaction_tree.bind('<Shift-Button-1>', self._on_heading_shift_click)
         self.transaction_tree.tag_configure('expense', foreground='red')
         self.transaction_tree.tag_configure('income', foreground='green')
         self.transaction_tree.pack(side='left', fill='both', expand=True)
@@ -100,8 +133,11 @@ class ViewTransactionsTab:
         self.frame.bind("<Destroy>", self._on_destroy, add="+")
         self.refresh()
 
-    def sort_by_column(self, column):
-        """Sort transactions by the specified column"""
+    def sort_by_column(self, column, add=False):
+        """
+        Sort transactions by the specified column. With add=True the column becomes an
+        additional sort key after the current ones instead of replacing them.
+        """
         if not self._current_transactions:
             return
             
@@ -124,49 +160,130 @@ class ViewTransactionsTab:
         
         # Update sort state
         self._sort_state[column] = new_direction
-        self._current_sort = (column, new_direction)
-        
-        # Sort the transactions
-        reverse = (new_direction == 'descending')
-        
-        if column == 'Amount':
-            # Sort by amount (convert to float for proper numeric sorting)
-            self._current_transactions.sort(key=lambda x: float(x.get('amount', 0)), reverse=reverse)
-        elif column == 'Date':
-            # Sort by date (string comparison works for YYYY-MM-DD format)
-            self._current_transactions.sort(key=lambda x: x.get('date', ''), reverse=reverse)
-        elif column == 'Type':
-            # Sort by transaction type
-            self._current_transactions.sort(key=lambda x: x.get('type', ''), reverse=reverse)
-        elif column == 'Category':
-            # Sort by category
-            self._current_transactions.sort(key=lambda x: x.get('category', ''), reverse=reverse)
-        elif column == 'Description':
-            # Sort by description
-            self._current_transactions.sort(key=lambda x: x.get('description', ''), reverse=reverse)
-        elif column == 'ID':
-            # Sort by ID
-            self._current_transactions.sort(key=lambda x: x.get('id', ''), reverse=reverse)
-        elif column == 'Behavior Date':
-            # Sort by behavior date
-            self._current_transactions.sort(key=lambda x: x.get('behavior_date', ''), reverse=reverse)
-        
-        # Rebuild the tree view with sorted data
-        self._rebuild_tree()
+        descending = (new_direction == 'descending')
+        if add:
+            keys = [(c, d) for c, d in self._sort_keys if c != column]
+            position = next((i for i, (c, _) in enumerate(self._sort_keys) if c == column), len(keys))
+            keys.insert(position, (column, descending))
+            self._sort_keys = keys
+        else:
+            self._sort_keys = [(column, descending)]
+
+        # Reorder the existing tree items in one call instead of re-inserting them
+        self._current_transactions = self._sort_index.order(self._effective_sort())
+        self.transaction_tree.set_children('', *(row['_iid'] for row in self._current_transactions))
+
+    def _on_heading_shift_click(self, event):
+        if self.transaction_tree.identify_region(event.x, event.y) != 'heading':
+            return None
+        column_ref = self.transaction_tree.identify_column(event.x)
+        try:
+            column = self.transaction_tree['columns'][int(column_ref.lstrip('#')) - 1]
+        except (ValueError, IndexError):
+            return None
+        self.sort_by_column(column, add=True)
+        return 'break'
+
+    def _effective_sort(self):
+        return self._sort_keys or _DEFAULT_SORT
 
     def _rebuild_tree(self):
         """Rebuild the tree view with current sorted transactions"""
-        # Clear existing items
-        for item in self.transaction_tree.get_children():
-            self.transaction_tree.delete(item)
-        
-        # Add sorted transactions
+        self.transaction_tree.delete(*self.transaction_tree.get_children())
         for trans in self._current_transactions:
-            tag = 'expense' if trans['type'] == 'Expense' else 'income'
-            trans_id = trans.get('id', '')
-            self.transaction_tree.insert('', 'end', values=(
-                trans_id, trans['date'], trans.get('behavior_date', ''), trans['type'], f"€{trans['amount']:.2f}",
-                trans['category'], trans['description']), tags=(tag,))
+            self._insert_tree_row(trans, 'end')
+
+    @staticmethod
+    def _row_iid(record):
+        # Rows are keyed by the identity of the stored dict so legacy rows without an id
+        # (or with duplicate ids) still map to exactly one tree item.
+        return str(id(record))
+
+    @staticmethod
+    def _row_values(trans):
+        return (trans.get('id', ''), trans['date'], trans.get('behavior_date', ''), trans['type'],
+                f"€{trans['amount']:.2f}", trans['category'], trans['description'])
+
+    @staticmethod
+    def _row_tags(trans):
+        return ('expense' if trans['type'] == 'Expense' else 'income',)
+
+    def _insert_tree_row(self, trans, index):
+        self.transaction_tree.insert('', index, iid=trans['_iid'], values=self._row_values(trans),
+                                     tags=self._row_tags(trans))
+
+    def _make_row(self, trans_type, record):
+        iid = self._row_iid(record)
+        row = {**record, 'type': trans_type, '_iid': iid}
+        self._records_by_iid[iid] = (trans_type, record)
+        self._rows_by_iid[iid] = row
+        return row
+
+    def _insert_position(self, row):
+        """Index at which row belongs in the displayed order (after rows with equal keys)."""
+        sort_keys = self._effective_sort()
+        precedes = self._sort_index.precedes
+        for index, other in enumerate(self._current_transactions):
+            if precedes(sort_keys, row, other):
+                return index
+        return len(self._current_transactions)
+
+    def apply_transaction_changes(self, changes):
+        """Apply queued AppState transaction changes, falling back to a full refresh for large batches."""
+        if not self._frame_exists():
+            return
+        if len(changes) > _MAX_INCREMENTAL_CHANGES:
+            self.refresh(reindex=True)
+            return
+        # Keep the search index current first, since a change may fall back to a full refresh
+        for change in changes:
+            if change.action == CHANGE_REMOVED:
+                self._search_index.remove(change.record)
+            else:
+                self._search_index.add(change.record)
+        for change in changes:
+            if not self._apply_transaction_change(change):
+                break
+        self.update_summary()
+
+    def _apply_transaction_change(self, change):
+        """
+        Apply a single transaction mutation without rebuilding the whole view.
+        Changes are idempotent, so replaying one the view already reflects is harmless.
+        Returns False if it had to fall back to a full refresh.
+        """
+        filters = self._read_filters()
+        record = change.record
+        removed = change.action == CHANGE_REMOVED
+
+        changed_options = self._count_record_options(record, None if removed else change.trans_type, filters)
+        if changed_options:
+            self._apply_filter_values(changed_options)
+            if not self._filter_selection_valid():
+                # A selected filter value disappeared; fall back to the regular full refresh.
+                self.refresh()
+                return False
+
+        iid = self._row_iid(record)
+        old_row = self._rows_by_iid.pop(iid, None)
+        if old_row is not None:
+            self._current_transactions.remove(old_row)
+            self._sort_index.remove(old_row)
+            self._records_by_iid.pop(iid, None)
+
+        if not removed and self._matches_filters(change.trans_type, record, filters):
+            row = self._make_row(change.trans_type, record)
+            index = self._insert_position(row)
+            self._current_transactions.insert(index, row)
+            self._sort_index.add(row)
+            if old_row is not None:
+                self.transaction_tree.item(iid, values=self._row_values(row), tags=self._row_tags(row))
+                self.transaction_tree.move(iid, '', index)
+            else:
+                self._insert_tree_row(row, index)
+        elif old_row is not None:
+            self.transaction_tree.delete(iid)
+        return True
 
     def _schedule_refresh(self, _event=None):
         if not self._frame_exists():
@@ -201,81 +318,146 @@ class ViewTransactionsTab:
         if event.widget is self.frame:
             self.cancel_pending_refresh()
 
-    def update_filter_options(self):
-        """Update the available options in filter dropdowns based on current transactions"""
-        # Get all unique months from transactions
-        months = set()
-        dates = set()
-        categories = set()
-        descriptions = set()
-        
-        # Always include current month as an option
-        current_month = datetime.now().strftime("%Y-%m")
-        months.add(current_month)
-
-        filter_month = self.month_filter.get().strip()
-        filter_category = self.category_filter.get().strip().lower()
-        filter_date = self.date_filter.get().strip()
-        filter_type = self.type_filter.get().strip()
-        
-        for e in self.state.expenses:
-            if filter_type and filter_type != "Expense":
-                continue
-            if e.get('date'):
-                date_str = e['date']
-                if len(date_str) >= 7:
-                    months.add(date_str[:7])  # YYYY-MM
-                dates.add(date_str)
-                if e.get('category'):
-                    categories.add(e['category'])
-
-                if filter_date:
-                    if date_str != filter_date:
-                        continue
-                elif filter_month and filter_month != 'All' and not date_str.startswith(filter_month):
-                    continue
-                if filter_category and filter_category not in e.get('category', '').lower():
-                    continue
-                if e.get('description'):
-                    descriptions.add(e['description'])
-        
-        for i in self.state.incomes:
-            if filter_type and filter_type != "Income":
+    def _on_description_typed(self, event):
+        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Return', 'Tab', 'Escape'):
+            return
+        self._apply_filter_values(('description',))
+        self._schedule_refresh()
+
+    def _read_filters(self, use_index=False):
+        """
+        Current filter values. With use_index=True the category/description filters are
+        also resolved through the search index into sets of matching record keys, which
+        bulk passes use instead of lowercasing every record.
+        """
+        filters = {
+            'month': self.month_filter.get().strip(),
+            'category': self.category_filter.get().strip().lower(),
+            'date': self.date_filter.get().strip(),
+            'type': self.type_filter.get().strip(),
+            'description': self.description_filter.get().strip().lower(),
+        }
+        if use_index:
+            for name in ('category', 'description'):
+                if filters[name]:
+                    filters[name + '_keys'] = self._search_index.search(name, filters[name])
+        return filters
+
+    @staticmethod
+    def _text_matches(record, filters, name):
+        keys = filters.get(name + '_keys')
+        if keys is not None:
+            return id(record) in keys
+        return filters[name] in record.get(name, '').lower()
+
+    @staticmethod
+    def _matches_filters(trans_type, record, filters, include_description=True):
+        """Return True if a stored record passes the active filters (date takes precedence over month)."""
+        if filters['type'] and filters['type'] != trans_type:
+            return False
+        date_str = record.get('date', '')
+        if filters['date']:
+            if date_str != filters['date']:
+                return False
+        elif filters['month'] and filters['month'] != 'All' and not date_str.startswith(filters['month']):
+            return False
+        # Category and description filters are case-insensitive partial matches
+        if filters['category'] and not ViewTransactionsTab._text_matches(record, filters, 'category'):
+            return False
+        if (include_description and filters['description']
+                and not ViewTransactionsTab._text_matches(record, filters, 'description')):
+            return False
+        return True
+
+    def _option_values(self, trans_type, record, filters):
+        """Values a record contributes to the filter dropdowns, aligned with _OPTION_FIELDS."""
+        if filters['type'] and filters['type'] != trans_type:
+            return None
+        date_str = record.get('date')
+        if not date_str:
+            return None
+        month = date_str[:7] if len(date_str) >= 7 else None
+        category = record.get('category') or None
+        description = None
+        if record.get('description') and self._matches_filters(trans_type, record, filters,
+                                                               include_description=False):
+            description = record['description']
+        return (month, date_str, category, description)
+
+    def _count_record_options(self, record, trans_type, filters):
+        """
+        Move a record's contribution to the option counts from its previously counted values
+        to its current ones (trans_type None means the record was removed).
+        Returns the names of option lists whose set of values changed.
+        """
+        key = id(record)
+        old_values = self._option_keys.pop(key, None)
+        new_values = self._option_values(trans_type, record, filters) if trans_type else None
+        if new_values is not None:
+            self._option_keys[key] = new_values
+
+        changed = set()
+        for values, delta in ((old_values, -1), (new_values, 1)):
+            if values is None:
                 continue
-            if i.get('date'):
-                date_str = i['date']
-                if len(date_str) >= 7:
-                    months.add(date_str[:7])  # YYYY-MM
-                dates.add(date_str)
-                if i.get('category'):
-                    categories.add(i['category'])
-
-                if filter_date:
-                    if date_str != filter_date:
-                        continue
-                elif filter_month and filter_month != 'All' and not date_str.startswith(filter_month):
-                    continue
-                if filter_category and filter_category not in i.get('category', '').lower():
+            for name, value in zip(_OPTION_FIELDS, values):
+                if value is None:
                     continue
-                if i.get('description'):
-                    descriptions.add(i['description'])
-        
-        # Sort and add empty/all option at the beginning
-        month_list = ['All'] + sorted(months, reverse=True)
-        date_list = [''] + sorted(dates, reverse=True)
-        category_list = [''] + sorted(categories)
-        description_list = [''] + sorted(descriptions)
-        type_list = [''] + ['Expense', 'Income']
-        
-        # Update combobox values
-        self.month_filter['values'] = month_list
-        self.date_filter['values'] = date_list
-        self.category_filter['values'] = category_list
-        self.type_filter['values'] = type_list
-        self.description_filter['values'] = description_list
-        
+                counts = self._option_counts[name]
+                counts[value] += delta
+                if counts[value] <= 0:
+                    del counts[value]
+                    changed.add(name)
+                elif delta > 0 and counts[value] == 1:
+                    changed.add(name)
+        return changed
+
+    def _apply_filter_values(self, names=_OPTION_FIELDS):
+        """Push the counted option sets into the filter comboboxes."""
+        counts = self._option_counts
+        if 'month' in names:
+            # Always include current month as an option
+            months = set(counts['month'])
+            months.add(datetime.now().strftime("%Y-%m"))
+            self.month_filter['values'] = ['All'] + sorted(months, reverse=True)
+        if 'date' in names:
+            self.date_filter['values'] = [''] + sorted(counts['date'], reverse=True)
+        if 'category' in names:
+            self.category_filter['values'] = [''] + sorted(counts['category'])
+        if 'description' in names:
+            typed = self.description_filter.get().strip()
+            if typed:
+                # Rank suggestions among the descriptions available under the other filters
+                self.description_filter['values'] = self._search_index.suggest(
+                    'description', typed, limit=_DESCRIPTION_SUGGESTIONS, weights=counts['description'])
+            else:
+                self.description_filter['values'] = [''] + sorted(counts['description'])
+
+    def _filter_selection_valid(self):
+        # The description filter is free text, so only the readonly comboboxes are checked
+        for combo in (self.month_filter, self.date_filter, self.category_filter):
+            selection = combo.get()
+            if selection and selection not in combo['values']:
+                return False
+        return True
+
+    def update_filter_options(self):
+        """Rebuild the available options in filter dropdowns based on current transactions"""
+        filters = self._read_filters(use_index=True)
+        for counts in self._option_counts.values():
+            counts.clear()
+        self._option_keys.clear()
+        for trans_type, records in (("Expense", self.state.expenses), ("Income", self.state.incomes)):
+            for record in records:
+                self._count_record_options(record, trans_type, filters)
+
+        self._apply_filter_values()
+        self.type_filter['values'] = ['', 'Expense', 'Income']
+
         # Set default month to current month if available.
         # Keep user's selection only if it's non-empty and still valid.
+        month_list = self.month_filter['values']
+        current_month = datetime.now().strftime("%Y-%m")
         current_selection = self.month_filter.get()
         if current_selection and current_selection in month_list:
             self.month_filter.set(current_selection)
@@ -284,14 +466,8 @@ class ViewTransactionsTab:
         elif month_list:
             self.month_filter.set(month_list[0])
 
-        current_desc = self.description_filter.get()
-        if current_desc and current_desc in description_list:
-            self.description_filter.set(current_desc)
-        else:
-            self.description_filter.set('')
-
         current_type = self.type_filter.get()
-        if current_type and current_type in type_list:
+        if current_type and current_type in self.type_filter['values']:
             self.type_filter.set(current_type)
         else:
             self.type_filter.set('')
@@ -309,84 +485,30 @@ class ViewTransactionsTab:
         self.description_filter.set('')
         self.refresh()
 
-    def refresh(self):
+    def refresh(self, reindex=False):
+        if reindex:
+            self._search_index.invalidate()
         # Update filter options before refreshing to ensure they're current
         self.update_filter_options()
-        
-        for item in self.transaction_tree.get_children():
-            self.transaction_tree.delete(item)
-        
-        filter_month = self.month_filter.get().strip()
-        filter_category = self.category_filter.get().strip().lower()
-        filter_date = self.date_filter.get().strip()
-        filter_type = self.type_filter.get().strip()
-        filter_description = self.description_filter.get().strip().lower()
-        
+        filters = self._read_filters(use_index=True)
+
+        self._records_by_iid.clear()
+        self._rows_by_iid.clear()
         all_transactions = []
-        
-        # Collect expenses
-        if not filter_type or filter_type == "Expense":
-            for e in self.state.expenses:
-                # Filter by date if specified (date filter takes precedence over month)
-                if filter_date:
-                    if e['date'] != filter_date:
-                        continue
-                elif filter_month and filter_month != 'All' and not e['date'].startswith(filter_month):
-                    continue
-                # Filter by category if specified (case-insensitive, partial match)
-                if filter_category and filter_category not in e.get('category', '').lower():
-                    continue
-                # Filter by description if specified (case-insensitive, partial match)
-                if filter_description and filter_description not in e.get('description', '').lower():
-                    continue
-                all_transactions.append({**e, 'type': 'Expense'})
-        
-        # Collect incomes
-        if not filter_type or filter_type == "Income":
-            for i in self.state.incomes:
-                # Filter by date if specified (date filter takes precedence over month)
-                if filter_date:
-                    if i['date'] != filter_date:
-                        continue
-                elif filter_month and filter_month != 'All' and not i['date'].startswith(filter_month):
-                    continue
-                # Filter by category if specified (case-insensitive, partial match)
-                if filter_category and filter_category not in i.get('category', '').lower():
-                    continue
-                # Filter by description if specified (case-insensitive, partial match)
-                if filter_description and filter_description not in i.get('description', '').lower():
-                    continue
-                all_transactions.append({**i, 'type': 'Income'})
-        
-        all_transactions.sort(key=lambda x: x['date'])
-        self._current_transactions = all_transactions
+        for trans_type, records in (("Expense", self.state.expenses), ("Income", self.state.incomes)):
+            if filters['type'] and filters['type'] != trans_type:
+                continue
+            for record in records:
+                if self._matches_filters(trans_type, record, filters):
+                    all_transactions.append(self._make_row(trans_type, record))
 
+        # Base order is by date, so column sorts break ties chronologically
+        all_transactions.sort(key=lambda x: x['date'])
+        self._sort_index.reset(all_transactions)
         # Re-apply current sort if one exists
-        if self._current_sort:
-            column, direction = self._current_sort
-            reverse = (direction == 'descending')
-            
-            if column == 'Amount':
-                self._current_transactions.sort(key=lambda x: float(x.get('amount', 0)), reverse=reverse)
-            elif column == 'Date':
-                self._current_transactions.sort(key=lambda x: x.get('date', ''), reverse=reverse)
-            elif column == 'Type':
-                self._current_transactions.sort(key=lambda x: x.get('type', ''), reverse=reverse)
-            elif column == 'Category':
-                self._current_transactions.sort(key=lambda x: x.get('category', ''), reverse=reverse)
-            elif column == 'Description':
-                self._current_transactions.sort(key=lambda x: x.get('description', ''), reverse=reverse)
-            elif column == 'ID':
-                self._current_transactions.sort(key=lambda x: x.get('id', ''), reverse=reverse)
-            elif column == 'Behavior Date':
-                self._current_transactions.sort(key=lambda x: x.get('behavior_date', ''), reverse=reverse)
+        self._current_transactions = self._sort_index.order(self._sort_keys)
 
-        for trans in self._current_transactions:
-            tag = 'expense' if trans['type'] == 'Expense' else 'income'
-            trans_id = trans.get('id', '')
-            self.transaction_tree.insert('', 'end', values=(
-                trans_id, trans['date'], trans.get('behavior_date', ''), trans['type'], f"€{trans['amount']:.2f}",
-                trans['category'], trans['description']), tags=(tag,))
+        self._rebuild_tree()
         self.update_summary()
 
     def update_summary(self):
@@ -427,55 +549,16 @@ class ViewTransactionsTab:
         if not messagebox.askyesno("Confirm", "Are you sure you want to delete the selected transaction?"):
             return
 
-        v = self.transaction_tree.item(selected[0])['values']
-        trans_id = v[0]
-        trans_type = v[3]
-        if trans_id:
-            ok = self.state.delete_transaction_by_id(trans_type, trans_id)
-            if not ok:
-                messagebox.showerror("Error", "Could not delete the transaction.")
-        else:
-            # Legacy no-id fallback
-            date_str = v[1]
-            trans_type = v[3]
-            amount_str = v[4]
-            category = v[5]
-            desc = v[6]
-            target = self.state.expenses if trans_type == "Expense" else self.state.incomes
-            try:
-                target.remove({
-                    'date': date_str,
-                    'amount': float(amount_str.replace('€', '')),
-                    'category': category,
-                    'description': desc
-                })
-                self.state.save()
-            except ValueError:
-                messagebox.showerror("Error", "Could not delete the transaction (fallback failed).")
-                return
-        self.on_data_changed()
+        trans_type, record = self._records_by_iid.get(selected[0], (None, None))
+        if record is None or not self.state.delete_transaction(trans_type, record):
+            messagebox.showerror("Error", "Could not delete the transaction.")
 
     def open_modify_window(self):
         selected = self.transaction_tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a transaction to modify.")
             return
-        values = self.transaction_tree.item(selected[0])['values']
-        trans_id = values[0]
-
-        original = None
-        original_list_name = None
-        for t in self.state.expenses:
-            if t.get('id') == trans_id:
-                original = t
-                original_list_name = "Expense"
-                break
-        if not original:
-            for t in self.state.incomes:
-                if t.get('id') == trans_id:
-                    original = t
-                    original_list_name = "Income"
-                    break
+        original_list_name, original = self._records_by_iid.get(selected[0], (None, None))
         if not original:
             messagebox.showerror("Error", "Could not find the selected transaction in the data.")
             return
@@ -549,25 +632,13 @@ class ViewTransactionsTab:
                 if new_behavior_date:
                     datetime.strptime(new_behavior_date, "%Y-%m-%d")
 
-                # Update existing
-                original['date'] = new_date
-                original['amount'] = new_amount
-                original['category'] = new_cat
-                original['description'] = new_desc
-                if new_behavior_date:
-                    original['behavior_date'] = new_behavior_date
-                else:
-                    # Remove the key entirely when cleared to preserve existing sorting/report behavior.
-                    if 'behavior_date' in original:
-                        del original['behavior_date']
-
-                if new_type != original_list_name:
-                    source = self.state.expenses if original_list_name == "Expense" else self.state.incomes
-                    source.remove(original)
-                    (self.state.expenses if new_type == "Expense" else self.state.incomes).append(original)
-
-                self.state.save()
-                self.on_data_changed()
+                # Update existing. A cleared behavior_date removes the key entirely
+                # to preserve existing sorting/report behavior.
+                self.state.update_transaction(
+                    original_list_name, original, new_type,
+                    date=new_date, amount=new_amount, category=new_cat, description=new_desc,
+                    behavior_date=new_behavior_date or None,
+                )
                 close_window(win)
             except ValueError:
                 messagebox.showerror("Error", "Invalid amount or date format (YYYY-MM-DD).", parent=win)
@@ -0,0 +1,212 @@
+"""
+finance_tracker/ui/watchdog.py
+
+Main-loop latency watchdog. A Tk after() tick is scheduled every interval and
+the delay beyond that interval is the event-loop lag. A helper thread watches
+the tick heartbeat; while the loop is stalled it samples the Tk thread's stack,
+so the handler that blocked the UI can be named once the loop recovers. Lags
+are kept in a histogram and stalls are logged with their stack sample.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .. import perf
+
+logger = logging.getLogger(__name__)
+
+TICK_MS = 50
+# Upper bounds (ms) of the lag histogram buckets; the last bucket is open-ended
+LAG_BUCKETS_MS = (50, 100, 250, 500, 1000, 2000, 5000)
+MAX_STALLS = 20
+MAX_SAMPLES_PER_STALL = 5
+# Frames from these files are skipped when naming the blocking handler
+_DISPATCH_FILES = (os.path.join("tkinter", "__init__.py"), os.path.join("finance_tracker", "perf.py"))
+
+
+@dataclass
+class Stall:
+    when: datetime
+    lag_ms: float
+    callback: str
+    samples: list[list[traceback.FrameSummary]] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [f"{self.when:%H:%M:%S}  UI blocked {self.lag_ms:.0f} ms in {self.callback}"]
+        if self.samples:
+            lines.append("".join(traceback.format_list(handler_frames(self.samples[0]))).rstrip())
+            if len(self.samples) > 1:
+                lines.append(f"  ({len(self.samples)} stack samples taken)")
+        return "\n".join(lines)
+
+
+def handler_frames(stack: list[traceback.FrameSummary]) -> list[traceback.FrameSummary]:
+    """The part of a stack sample below tkinter's callback dispatch (all of it if there is none)."""
+    start = 0
+    for index, frame in enumerate(stack):
+        if frame.filename.endswith(_DISPATCH_FILES[0]) and frame.name in ("__call__", "callit"):
+            start = index + 1
+    return [frame for frame in stack[start:] if not frame.filename.endswith(_DISPATCH_FILES)]
+
+
+def blocking_callback(stack: list[traceback.FrameSummary]) -> str:
+    """Name the Tk handler in a stack sample: the first frame after tkinter's dispatch."""
+    frames = handler_frames(stack)
+    for frame in frames:
+        if frame.name != "<lambda>":
+            return f"{frame.name} ({os.path.basename(frame.filename)}:{frame.lineno})"
+    return frames[-1].name if frames else "unknown"
+
+
+class MainLoopWatchdog:
+    """
+    Measure Tk event-loop lag with after() ticks every tick_ms. Lags of
+    threshold_ms or more count as stalls (default: the perf slow-callback threshold).
+    """
+
+    def __init__(self, root, tick_ms: int = TICK_MS, threshold_ms: float | None = None):
+        self.root = root
+        self.tick_ms = tick_ms
+        self.threshold_ms = threshold_ms if threshold_ms is not None else perf.slow_callback_ms
+        self.histogram = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.ticks = 0
+        self.max_lag_ms = 0.0
+        self.stalls: deque[Stall] = deque(maxlen=MAX_STALLS)
+        self._lock = threading.Lock()
+        self._samples: list[list[traceback.FrameSummary]] = []
+        self._beat = 0.0
+        self._tk_thread_id = threading.get_ident()
+        self._after_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self.running:
+            return self
+        self._tk_thread_id = threading.get_ident()
+        # A fresh event per run, so a helper thread from a previous run cannot linger
+        self._stop = threading.Event()
+        self._beat = time.perf_counter()
+        self._after_id = self.root.after(self.tick_ms, self._tick)
+        self._thread = threading.Thread(target=self._watch, args=(self._stop,), name="ui-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread = None
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histogram = [0] * (len(LAG_BUCKETS_MS) + 1)
+            self.ticks = 0
+            self.max_lag_ms = 0.0
+            self.stalls.clear()
+
+    # -- Tk thread -----------------------------------------------------------
+    def _tick(self):
+        now = time.perf_counter()
+        lag_ms = max((now - self._beat) * 1000 - self.tick_ms, 0.0)
+        with self._lock:
+            samples, self._samples = self._samples, []
+            self._beat = now
+            self.ticks += 1
+            self.histogram[bisect_right(LAG_BUCKETS_MS, lag_ms)] += 1
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            stall = None
+            if lag_ms >= self.threshold_ms:
+                callback = blocking_callback(samples[0]) if samples else "unknown (no stack sample)"
+                stall = Stall(datetime.now(), lag_ms, callback, samples)
+                self.stalls.append(stall)
+        if stall is not None:
+            logger.warning("%s", stall.format())
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.tick_ms, self._tick)
+
+    # -- helper thread -------------------------------------------------------
+    def _watch(self, stop: threading.Event):
+        poll = max(self.tick_ms, 10) / 1000 / 2
+        while not stop.wait(poll):
+            with self._lock:
+                beat = self._beat
+                overdue_ms = (time.perf_counter() - beat) * 1000 - self.tick_ms
+                # One sample per threshold elapsed, so long stalls show how the stack moved
+                due = int(overdue_ms // self.threshold_ms) if self.threshold_ms > 0 else 0
+                if due <= len(self._samples) or len(self._samples) >= MAX_SAMPLES_PER_STALL:
+                    continue
+            frame = sys._current_frames().get(self._tk_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                if self._beat == beat:  # the loop did not recover while sampling
+                    self._samples.append(stack)
+
+    # -- reporting -------------------------------------------------------------
+    def format_report(self) -> str:
+        with self._lock:
+            histogram = list(self.histogram)
+            stalls = list(self.stalls)
+            ticks, max_lag = self.ticks, self.max_lag_ms
+        lines = [f"Main-loop watchdog ({'running' if self.running else 'stopped'}; tick {self.tick_ms} ms, "
+                 f"stall threshold {self.threshold_ms:.0f} ms): {ticks} ticks, max lag {max_lag:.0f} ms",
+                 "Lag histogram:"]
+        bounds = (0,) + LAG_BUCKETS_MS
+        for index, count in enumerate(histogram):
+            label = (f"{bounds[index]}-{bounds[index + 1]} ms" if index + 1 < len(bounds)
+                     else f">= {bounds[index]} ms")
+            lines.append(f"  {label:>14}  {count:>6}")
+        lines += ["", "Recent stalls, newest first:"]
+        if stalls:
+            for stall in reversed(stalls):
+                lines.append(stall.format())
+        else:
+            lines.append("None.")
+        return "\n".join(lines)
+
+
+_current: MainLoopWatchdog | None = None
+
+
+def current() -> MainLoopWatchdog | None:
+    """The watchdog installed by attach(), if any."""
+    return _current
+
+
+def attach(root) -> MainLoopWatchdog:
+    """Create the app's watchdog; it runs whenever performance instrumentation is enabled."""
+    global _current
+    watchdog = MainLoopWatchdog(root)
+
+    def follow(enabled):
+        if enabled:
+            watchdog.start()
+        else:
+            watchdog.stop()
+
+    perf.add_listener(follow)
+    follow(perf.is_enabled())
+    _current = watchdog
+    return watchdog
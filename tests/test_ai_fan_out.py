@@ -0,0 +1,55 @@
+"""
+tests/test_ai_fan_out.py
+
+Error isolation in the multi-provider AI fan-out.
+"""
+
+import http.client
+import json
+
+import pytest
+
+from finance_tracker.services import ai_insights_service
+from finance_tracker.services.ai_insights_service import AIConfig, fan_out_ai_insights
+
+MESSAGES = [{"role": "user", "content": "How am I doing?"}]
+
+
+def _config(provider):
+    return AIConfig(provider, f"https://{provider}.example/v1", "key", "model")
+
+
+@pytest.mark.parametrize("error", [
+    json.JSONDecodeError("Expecting value", "data: {", 6),
+    UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"),
+    http.client.IncompleteRead(b""),
+    ConnectionResetError("reset by peer"),
+    RuntimeError("API request failed (500): boom"),
+])
+def test_failing_provider_does_not_stop_the_others(monkeypatch, error):
+    def fake_stream(config, messages, cancel_event=None):
+        if config.provider == "broken":
+            raise error
+        yield "Spend "
+        yield "less. "
+
+    monkeypatch.setattr(ai_insights_service, "stream_ai_insights", fake_stream)
+    results = {r.config.provider: r for r in
+               fan_out_ai_insights([_config("broken"), _config("good")], MESSAGES, first_wins=False)}
+
+    assert results["good"].ok and results["good"].content == "Spend less."
+    assert not results["broken"].ok
+    assert str(error) in results["broken"].error
+
+
+def test_first_wins_skips_failures_until_a_success(monkeypatch):
+    def fake_stream(config, messages, cancel_event=None):
+        if config.provider == "broken":
+            raise ValueError("bad payload")
+        yield "ok"
+
+    monkeypatch.setattr(ai_insights_service, "stream_ai_insights", fake_stream)
+    results = list(fan_out_ai_insights([_config("broken"), _config("good")], MESSAGES, first_wins=True))
+
+    assert results[-1].ok and results[-1].config.provider == "good"
+    assert all(not r.ok for r in results[:-1])
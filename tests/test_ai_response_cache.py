@@ -0,0 +1,90 @@
+"""
+tests/test_ai_response_cache.py
+
+Keying, expiry and size-bounded eviction of the on-disk AI response cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from finance_tracker.services.ai_insights_service import AIConfig, response_cache_key
+from finance_tracker.services.ai_response_cache import AIResponseCache, cache_key
+
+MESSAGES = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Wie geht's? €"}]
+CONFIG = AIConfig("openai", "https://api.example/v1/chat", "secret", "model-a", 0.3)
+
+
+def _key(**changes):
+    fields = dict(provider=CONFIG.provider, api_base_url=CONFIG.api_base_url, api_key=CONFIG.api_key,
+                  model=CONFIG.model, temperature=CONFIG.temperature)
+    fields.update(changes)
+    return response_cache_key(AIConfig(**fields), MESSAGES)
+
+
+def test_key_is_stable_and_ignores_the_api_key():
+    assert _key() == _key() == response_cache_key(CONFIG, [dict(m) for m in MESSAGES])
+    assert _key(api_key="another") == _key()
+    assert len(_key()) == 64
+
+
+@pytest.mark.parametrize("change", [
+    {"provider": "groq"},
+    {"api_base_url": "http://localhost:8080/v1/chat"},
+    {"model": "model-b"},
+    {"temperature": 0.7},
+])
+def test_key_changes_with_everything_that_affects_the_response(change):
+    assert _key(**change) != _key()
+
+
+def test_key_changes_with_the_messages():
+    base = cache_key("openai", "m", MESSAGES, 0.3)
+    assert cache_key("openai", "m", MESSAGES[:1], 0.3) != base
+    assert cache_key("openai", "m", [MESSAGES[1], MESSAGES[0]], 0.3) != base
+    edited = [MESSAGES[0], {"role": "user", "content": "Wie geht's?"}]
+    assert cache_key("openai", "m", edited, 0.3) != base
+    # Key order inside a message does not matter
+    reordered = [{"content": m["content"], "role": m["role"]} for m in MESSAGES]
+    assert cache_key("openai", "m", reordered, 0.3) == base
+
+
+def test_put_get_and_invalidate(tmp_path):
+    cache = AIResponseCache(tmp_path / "cache")
+    assert cache.get(_key()) is None
+    cache.put(_key(), "Spend less on € coffee.", provider="openai", model="model-a")
+    entry = cache.get(_key())
+    assert entry["content"] == "Spend less on € coffee."
+    assert entry["model"] == "model-a"
+    assert cache.get(_key(model="model-b")) is None
+    cache.invalidate(_key())
+    assert cache.get(_key()) is None
+
+
+def test_expired_entries_are_dropped(tmp_path, monkeypatch):
+    cache = AIResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("k", "old")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("k") is None
+    assert not (tmp_path / "k.json").exists()
+
+
+def test_least_recently_used_entries_are_evicted_past_max_bytes(tmp_path):
+    cache = AIResponseCache(tmp_path, max_bytes=10_000)
+    for name in "abc":
+        cache.put(name, name * 1000)
+    sizes = {name: (tmp_path / f"{name}.json").stat().st_size for name in "abc"}
+    # Mark a as used most recently and b as the oldest
+    for age, name in ((300, "b"), (200, "c"), (100, "a")):
+        stamp = time.time() - age
+        os.utime(tmp_path / f"{name}.json", (stamp, stamp))
+
+    # Room for a and the small new entry, but not for c as well
+    cache.max_bytes = sizes["a"] + sizes["c"] // 2
+    cache.put("d", "d" * 10)
+    remaining = sorted(path.stem for path in tmp_path.glob("*.json"))
+    assert remaining == ["a", "d"]
+    cache.clear()
+    assert list(tmp_path.glob("*.json")) == []
@@ -0,0 +1,80 @@
+"""
+tests/test_ai_streaming.py
+
+Streamed AI responses from a local OpenAI-compatible server, with per-request timing.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from finance_tracker.services.ai_insights_service import AIConfig, stream_ai_insights
+
+MESSAGES = [{"role": "user", "content": "How am I doing?"}]
+SLOW_SECONDS = 0.3
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.startswith("/slow"):
+            time.sleep(SLOW_SECONDS)
+        words = self.path.strip("/").split("/")
+        body = b"".join(
+            b"data: " + json.dumps({"choices": [{"delta": {"content": word + " "}}]}).encode() + b"\n\n"
+            for word in words
+        ) + b"data: [DONE]\n\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _config(url):
+    return AIConfig("openai", url, "key", "model")
+
+
+def test_stream_yields_deltas_and_its_timing(base_url):
+    stream = stream_ai_insights(_config(f"{base_url}/spend/less"), MESSAGES)
+    assert stream.timing is None  # nothing is sent before iteration
+    assert "".join(stream) == "spend less "
+    assert stream.timing.status == 200
+    assert stream.timing.total_ms >= stream.timing.ttfb_ms > 0
+
+
+def test_concurrent_streams_keep_their_own_timing(base_url):
+    slow = stream_ai_insights(_config(f"{base_url}/slow/reply"), MESSAGES)
+    fast = stream_ai_insights(_config(f"{base_url}/fast"), MESSAGES)
+    contents = {}
+    threads = [threading.Thread(target=lambda name=name, s=s: contents.__setitem__(name, "".join(s)))
+               for name, s in (("slow", slow), ("fast", fast))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert contents == {"slow": "slow reply ", "fast": "fast "}
+    # The slow request finishes last; the fast one must still report its own time
+    assert slow.timing is not fast.timing
+    assert slow.timing.total_ms >= SLOW_SECONDS * 1000
+    assert fast.timing.total_ms < SLOW_SECONDS * 1000
@@ -0,0 +1,128 @@
+"""
+tests/test_ai_summary.py
+
+Chat-history compaction into a digest and the token-budgeted summary encoding.
+"""
+
+import pytest
+
+from finance_tracker.services.ai_insights_service import (
+    build_chat_messages,
+    compact_chat_history,
+    encoded_summary,
+)
+from finance_tracker.services.summary_encoder import encode_summary, estimate_tokens, merge_long_tail
+from finance_tracker.state import AppState
+
+
+def _turns(count, words=60):
+    history = []
+    for i in range(count):
+        history.append({"role": "user", "content": f"question {i} " + "word " * words})
+        history.append({"role": "assistant", "content": f"answer {i} " + "word " * words})
+    return history
+
+
+def _tokens(history):
+    return sum(estimate_tokens(m["content"]) for m in history)
+
+
+def test_short_history_is_left_alone():
+    history = _turns(2)
+    recent, digest = compact_chat_history(history, "earlier", token_budget=10_000)
+    assert recent is history and digest == "earlier"
+
+
+def test_oldest_turns_fold_into_the_digest_until_the_rest_fits():
+    history = _turns(10)
+    recent, digest = compact_chat_history(history, token_budget=300, digest_budget=10_000)
+    assert _tokens(recent) <= 300
+    assert recent == history[-len(recent):]
+    assert recent[0]["role"] == "user"  # never starts with an orphaned answer
+    folded = history[:len(history) - len(recent)]
+    assert digest.splitlines()[0].startswith("- User: question 0 word")
+    assert len(digest.splitlines()) == len(folded)
+    assert all(len(line) <= len("- User: ") + 200 + len(" ...") for line in digest.splitlines())
+
+
+def test_latest_exchange_is_kept_even_over_budget():
+    history = _turns(3, words=500)
+    recent, _ = compact_chat_history(history, token_budget=10)
+    assert recent == history[-2:]
+
+
+def test_digest_drops_its_oldest_lines_beyond_its_budget():
+    recent, digest = compact_chat_history(_turns(10), "- User: very old", token_budget=300, digest_budget=60)
+    assert estimate_tokens(digest) <= 60
+    assert "very old" not in digest
+    # Compaction continues from an earlier digest
+    more = recent + _turns(3)
+    _, next_digest = compact_chat_history(more, digest, token_budget=300, digest_budget=10_000)
+    assert next_digest.startswith(digest)
+
+
+def test_chat_messages_carry_the_digest(tmp_path):
+    state = AppState(tmp_path / "finance.json")
+    messages = build_chat_messages(state, "2024-03", 3, _turns(1), "And now?", "- User: earlier")
+    assert [m["role"] for m in messages] == ["system", "user", "system", "user", "assistant", "user"]
+    assert messages[2]["content"].endswith("- User: earlier")
+    assert messages[-1]["content"] == "And now?"
+
+
+def _monthly(months, categories=30, fixed=8):
+    monthly = {}
+    for i, month in enumerate(months):
+        monthly[month] = {
+            "expenses": {f"Category {c:02d}": 1000.0 / (c + 1) + i for c in range(categories)},
+            "income": {"Salary": 3000.0, "Gift": 50.0},
+            "fixed": {f"Fixed {f}": 100.0 + f for f in range(fixed)},
+            "base_income": 2500.0,
+            "expense_count": categories,
+            "income_count": 2,
+        }
+    return monthly
+
+
+MONTHS = [f"2024-{m:02d}" for m in range(1, 13)]
+
+
+def test_long_tail_is_merged():
+    totals = {"Rent": 1000.0, "Food": 500.0, "Fun": 30.0, "Misc": 20.0, "Gifts": 5.0}
+    kept, merged = merge_long_tail(totals)
+    assert kept == ["Rent", "Food"] and merged == ["Fun", "Misc", "Gifts"]
+    # A single leftover is kept rather than shown as "Other (1)"
+    assert merge_long_tail({"Rent": 1000.0, "Food": 1.0}) == (["Rent", "Food"], [])
+    assert merge_long_tail(totals, max_rows=1) == (["Rent"], ["Food", "Fun", "Misc", "Gifts"])
+
+
+@pytest.mark.parametrize("budget", [2000, 800, 400, 150])
+def test_summary_fits_its_token_budget(budget):
+    summary = encode_summary(MONTHS, _monthly(MONTHS), original_tokens=9999, token_budget=budget)
+    assert summary.tokens == estimate_tokens(summary.text) <= budget
+    assert summary.text.startswith("Finance summary for 2024-01..2024-12 (12 months)")
+    assert summary.original_tokens == 9999
+    assert summary.truncated == summary.text.endswith("(truncated to fit the size limit)")
+
+
+def test_detail_is_reduced_before_truncating():
+    monthly = _monthly(MONTHS)
+    full = encode_summary(MONTHS, monthly, token_budget=100_000)
+    assert not full.truncated and "Other (" in full.text  # long tail merged even with room to spare
+    assert "Expense category|total|2024-01|" in full.text
+
+    tight = encode_summary(MONTHS, monthly, token_budget=full.tokens - 1)
+    assert not tight.truncated and tight.tokens < full.tokens
+    smallest = encode_summary(MONTHS, monthly, token_budget=150)
+    assert smallest.truncated
+
+
+def test_encoded_summary_is_cached_per_data_version(tmp_path):
+    state = AppState(tmp_path / "finance.json")
+    state.add_transaction("Expense", "2024-03-02", 12.5, "Food", "Lunch")
+    first = encoded_summary(state, "2024-03", 3)
+    assert encoded_summary(state, "2024-03", 3) is first
+    assert first.text.endswith("Expense category|total|2024-01|2024-02|2024-03\nFood|12|0|0|12")
+    assert first.original_tokens > first.tokens
+    state.add_transaction("Expense", "2024-03-03", 7.5, "Food", "Coffee")
+    second = encoded_summary(state, "2024-03", 3)
+    assert second is not first and second.text.endswith("Food|20|0|0|20")
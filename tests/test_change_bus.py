@@ -0,0 +1,136 @@
+"""
+tests/test_change_bus.py
+
+ChangeBus topics, the changes AppState publishes, and how TabRefreshScheduler
+routes them to the visible tab or defers them until a tab is selected.
+"""
+
+import pytest
+
+from finance_tracker.change_bus import TOPIC_BALANCES, TOPIC_GOALS, TOPIC_TRANSACTIONS, ChangeBus
+from finance_tracker.state import CHANGE_ADDED, CHANGE_REMOVED, CHANGE_UPDATED, AppState
+from finance_tracker.ui.tab_refresh import TabRefreshScheduler
+
+
+class _Notebook:
+    """The parts of ttk.Notebook the scheduler uses; idle callbacks run on run_idle()."""
+
+    def __init__(self, selected):
+        self.selected = selected
+        self.idle = []
+        self.on_tab_changed = None
+
+    def bind(self, sequence, callback, add=None):
+        self.on_tab_changed = callback
+
+    def select(self):
+        return self.selected
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return f"after#{len(self.idle)}"
+
+    def run_idle(self):
+        callbacks, self.idle = self.idle, []
+        for callback in callbacks:
+            callback()
+
+    def switch_to(self, frame):
+        self.selected = frame
+        self.on_tab_changed()
+
+
+def test_bus_delivers_per_topic_in_subscription_order():
+    bus = ChangeBus()
+    calls = []
+    first = lambda change: calls.append(("first", change))
+    bus.subscribe(TOPIC_GOALS, first)
+    bus.subscribe(TOPIC_GOALS, first)  # subscribing twice is a no-op
+    bus.subscribe(TOPIC_GOALS, lambda change: calls.append(("second", change)))
+    bus.subscribe(TOPIC_BALANCES, lambda change: calls.append(("balances", change)))
+
+    bus.publish(TOPIC_GOALS, "g")
+    assert calls == [("first", "g"), ("second", "g")]
+
+    bus.unsubscribe(TOPIC_GOALS, first)
+    bus.unsubscribe(TOPIC_GOALS, first)
+    calls.clear()
+    bus.publish(TOPIC_GOALS)
+    assert calls == [("second", None)]
+
+
+def test_unknown_topics_are_rejected():
+    bus = ChangeBus()
+    with pytest.raises(ValueError):
+        bus.subscribe("nope", print)
+    with pytest.raises(ValueError):
+        bus.publish("nope")
+
+
+def test_state_publishes_one_change_per_mutation_after_saving(tmp_path):
+    state = AppState(tmp_path / "finance.json")
+    seen = []
+
+    def on_change(change):
+        # Subscribers may reload: the change must already be on disk
+        assert AppState(state.data_file).get_transaction(change.trans_id) == (
+            None if change.action == CHANGE_REMOVED else (change.trans_type, change.record))
+        seen.append((change.action, change.trans_type, change.previous_type, change.trans_id))
+
+    state.bus.subscribe(TOPIC_TRANSACTIONS, on_change)
+    record = state.add_transaction("Expense", "2024-01-01", 10.0, "Food", "Lunch")
+    state.update_transaction("Expense", record, "Expense", amount=12.0)
+    state.update_transaction("Expense", record, "Income", category="Gift")
+    state.delete_transaction_by_id("Income", record["id"])
+    batch = state.add_transactions([("Expense", "2024-01-02", 1.0, "Food", "a"),
+                                    ("Income", "2024-01-03", 2.0, "Gift", "b")])
+
+    assert seen == [
+        (CHANGE_ADDED, "Expense", None, record["id"]),
+        (CHANGE_UPDATED, "Expense", None, record["id"]),
+        (CHANGE_UPDATED, "Income", "Expense", record["id"]),
+        (CHANGE_REMOVED, "Income", None, record["id"]),
+        (CHANGE_ADDED, "Expense", None, batch[0].trans_id),
+        (CHANGE_ADDED, "Income", None, batch[1].trans_id),
+    ]
+    assert state.add_transactions([]) == []
+    assert len(seen) == 6
+
+
+def test_visible_tab_refreshes_once_per_idle_cycle():
+    notebook = _Notebook("view")
+    bus = ChangeBus()
+    scheduler = TabRefreshScheduler(notebook, bus)
+    batches = []
+    scheduler.subscribe("view", [TOPIC_TRANSACTIONS], batches.append, pass_changes=True)
+
+    for change in ("a", "b", "c"):
+        bus.publish(TOPIC_TRANSACTIONS, change)
+    assert batches == [] and len(notebook.idle) == 1
+    notebook.run_idle()
+    assert batches == [["a", "b", "c"]]
+    notebook.run_idle()
+    assert batches == [["a", "b", "c"]]
+
+
+def test_hidden_tab_refreshes_when_selected():
+    notebook = _Notebook("view")
+    bus = ChangeBus()
+    scheduler = TabRefreshScheduler(notebook, bus)
+    refreshed = []
+    scheduler.subscribe("goals", [TOPIC_GOALS, TOPIC_BALANCES], lambda: refreshed.append("goals"))
+    batches = []
+    scheduler.subscribe("view", [TOPIC_TRANSACTIONS], batches.append, pass_changes=True)
+
+    bus.publish(TOPIC_GOALS)
+    bus.publish(TOPIC_BALANCES)
+    assert notebook.idle == []  # nothing visible changed
+
+    notebook.switch_to("goals")
+    bus.publish(TOPIC_TRANSACTIONS, "x")  # the view is hidden now
+    notebook.run_idle()
+    assert refreshed == ["goals"] and batches == []
+
+    notebook.switch_to("view")
+    notebook.run_idle()
+    assert refreshed == ["goals"] and batches == [["x"]]
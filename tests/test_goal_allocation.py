@@ -0,0 +1,116 @@
+"""
+tests/test_goal_allocation.py
+
+Deadline- and priority-driven savings allocation (fractional knapsack) across goals.
+"""
+
+import itertools
+from datetime import date, timedelta
+
+import pytest
+
+from finance_tracker.services.goals_service import (
+    PRIORITY_WEIGHTS,
+    UNDATED_GOAL_MONTHS,
+    auto_distribute_savings,
+    plan_savings_allocation,
+)
+from finance_tracker.state import AppState
+
+TODAY = date(2024, 1, 1)
+
+
+def _goal(name, target=1000.0, priority="Medium", target_date=None, **extra):
+    return {"name": name, "target_amount": target, "allocated_amount": 0.0, "priority": priority,
+            "target_date": target_date, **extra}
+
+
+def _amounts(plan):
+    return [p["amount"] for p in plan]
+
+
+def _objective(goals, amounts):
+    """Priority-weighted savings still needed per month, as plan_savings_allocation minimizes it."""
+    total = 0.0
+    for goal, amount in zip(goals, amounts):
+        months = plan_savings_allocation([goal], 0, TODAY)[0]["months"] or UNDATED_GOAL_MONTHS
+        total += PRIORITY_WEIGHTS[goal["priority"]] * (goal["target_amount"] - amount) / months
+    return total
+
+
+def test_goals_are_filled_by_months_per_priority_weight():
+    goals = [
+        _goal("Trip", priority="Low", target_date="2024-03-01"),    # 2 months / 1
+        _goal("Car", priority="High", target_date="2024-07-01"),    # 6 months / 3
+        _goal("House", priority="Medium"),                          # undated: 60 / 2
+        _goal("Laptop", priority="High", target_date="2024-02-01"),  # 1 month / 3
+    ]
+    plan = plan_savings_allocation(goals, 2500.0, TODAY)
+    # Laptop first, then Trip and Car tie on 2 months per weight and keep their order
+    assert _amounts(plan) == [1000.0, 500.0, 0.0, 1000.0]
+    assert [p["bound"] for p in plan] == ["target", None, "min", "target"]
+    assert plan[1]["monthly_needed"] == pytest.approx(500.0 / 6)
+    assert "no target date" in plan[2]["explanation"]
+
+
+def test_minimums_come_before_urgency_and_maximums_cap():
+    goals = [
+        _goal("Urgent", target_date="2024-02-01", max_allocation=400.0),
+        _goal("Later", target_date="2025-01-01", min_allocation=300.0),
+        _goal("Soon", target_date="2024-04-01"),
+    ]
+    plan = plan_savings_allocation(goals, 1000.0, TODAY)
+    assert _amounts(plan) == [400.0, 300.0, 300.0]
+    assert [p["bound"] for p in plan] == ["max", "min", None]
+
+
+def test_unreachable_minimums_are_covered_in_urgency_order():
+    goals = [_goal("Later", target_date="2025-01-01", min_allocation=500.0),
+             _goal("Soon", target_date="2024-02-01", min_allocation=500.0)]
+    plan = plan_savings_allocation(goals, 600.0, TODAY)
+    assert _amounts(plan) == [100.0, 500.0]
+    assert "only partly covered" in plan[0]["explanation"]
+
+
+def test_overdue_goals_count_as_due_next_month():
+    goals = [_goal("Overdue", target_date="2023-06-01"), _goal("Next month", target_date="2024-02-01")]
+    plan = plan_savings_allocation(goals, 500.0, TODAY)
+    assert plan[0]["months"] == 1.0 and _amounts(plan) == [500.0, 0.0]
+    assert "overdue since 2023-06-01" in plan[0]["explanation"]
+
+
+def test_savings_beyond_every_target_stay_unallocated():
+    goals = [_goal("A", target=100.0), _goal("B", target=50.0, max_allocation=20.0)]
+    assert _amounts(plan_savings_allocation(goals, 1000.0, TODAY)) == [100.0, 20.0]
+    assert _amounts(plan_savings_allocation(goals, -5.0, TODAY)) == [0.0, 0.0]
+
+
+def test_plan_is_optimal_against_a_grid_search():
+    goals = [
+        _goal("A", target=600.0, priority="Low", target_date="2024-04-01"),
+        _goal("B", target=500.0, priority="High", target_date="2024-10-01"),
+        _goal("C", target=400.0, priority="Medium", target_date="2024-06-01", min_allocation=100.0),
+    ]
+    budget = 900.0
+    planned = _objective(goals, _amounts(plan_savings_allocation(goals, budget, TODAY)))
+    best = min(
+        _objective(goals, amounts)
+        for amounts in itertools.product(range(0, 601, 50), range(0, 501, 50), range(100, 401, 50))
+        if sum(amounts) <= budget
+    )
+    assert planned == pytest.approx(best)
+
+
+def test_auto_distribute_records_each_allocation(tmp_path):
+    state = AppState(tmp_path / "finance.json")
+    state.budget_settings["savings_balance"] = 700.0
+    next_year = (date.today() + timedelta(days=365)).isoformat()
+    state.budget_settings["savings_goals"] = [_goal("Car", target=500.0, target_date=next_year),
+                                              _goal("Trip", target=500.0)]
+    ok, message = auto_distribute_savings(state)
+
+    assert ok and message.startswith("Distributed €700.00 across 2 goal(s).")
+    car, trip = state.budget_settings["savings_goals"]
+    assert (car["allocated_amount"], trip["allocated_amount"]) == (500.0, 200.0)
+    assert car["allocation_ledger"]["amounts"] == [500.0]
+    assert car["allocation_ledger"]["days"] == [date.today().toordinal()]
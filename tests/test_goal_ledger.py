@@ -0,0 +1,100 @@
+"""
+tests/test_goal_ledger.py
+
+Goal allocation ledgers, recent-weighted velocities and completion forecasts.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from finance_tracker.services.goal_ledger import (
+    DAYS_PER_MONTH,
+    LEDGER_KEY,
+    allocation_activity,
+    allocation_velocities,
+    ensure_ledger,
+    goal_ledger,
+    record_allocation,
+)
+from finance_tracker.services.goals_service import estimate_completion_date
+
+TODAY = date(2024, 12, 31)
+
+
+def _goal(**fields):
+    return {"name": "Goal", "target_amount": 10_000.0, "allocated_amount": 0.0, **fields}
+
+
+def _steady(amount_per_day, days, end=TODAY):
+    goal = _goal()
+    for offset in range(days):
+        record_allocation(goal, goal["allocated_amount"] + amount_per_day, end - timedelta(days=days - 1 - offset))
+    return goal
+
+
+def test_record_allocation_merges_same_day_changes():
+    goal = _goal()
+    assert record_allocation(goal, 100.0, TODAY) == 100.0
+    assert record_allocation(goal, 150.0, TODAY) == 50.0
+    assert record_allocation(goal, 150.0, TODAY) == 0.0
+    assert goal[LEDGER_KEY] == {"days": [TODAY.toordinal()], "amounts": [150.0]}
+    record_allocation(goal, 120.0, TODAY + timedelta(days=1))
+    assert goal[LEDGER_KEY]["amounts"] == [150.0, -30.0]
+    # A change undone on the same day leaves no entry
+    record_allocation(goal, 150.0, TODAY + timedelta(days=1))
+    assert goal[LEDGER_KEY] == {"days": [TODAY.toordinal()], "amounts": [150.0]}
+    assert goal["allocated_amount"] == 150.0
+
+
+def test_goals_without_a_ledger_start_from_their_creation_date():
+    goal = _goal(allocated_amount=600.0, created_date="2024-06-01")
+    assert goal_ledger(goal) == {"days": [date(2024, 6, 1).toordinal()], "amounts": [600.0]}
+    assert LEDGER_KEY not in goal  # reading does not write
+    assert ensure_ledger(goal) is goal[LEDGER_KEY]
+    assert goal_ledger(_goal()) == {"days": [], "amounts": []}
+
+
+def test_steady_rate_comes_out_unchanged():
+    [velocity] = allocation_velocities([_steady(10.0, 365)], TODAY)
+    assert velocity == pytest.approx(10.0 * DAYS_PER_MONTH, rel=0.01)
+
+
+def test_older_activity_counts_less():
+    recent, old = _goal(), _goal()
+    record_allocation(recent, 1000.0, TODAY - timedelta(days=10))
+    record_allocation(old, 1000.0, TODAY - timedelta(days=300))
+    record_allocation(old, 1000.0, TODAY - timedelta(days=10))
+    record_allocation(recent, 2000.0, TODAY - timedelta(days=5))
+    v_recent, v_old = allocation_velocities([recent, old], TODAY)
+    assert v_recent > v_old > 0
+
+
+def test_fresh_lump_sum_is_spread_over_the_minimum_window():
+    goal = _goal()
+    record_allocation(goal, 300.0, TODAY)
+    [velocity] = allocation_velocities([goal], TODAY)
+    assert 300.0 <= velocity < 400.0  # about 300 a month, not 300 a day
+    assert allocation_velocities([_goal()], TODAY) == [0.0]
+
+
+def test_activity_windows():
+    goals = [_steady(1.0, 400), _goal()]
+    record_allocation(goals[1], -50.0, TODAY - timedelta(days=45))
+    assert allocation_activity(goals, TODAY) == {30: pytest.approx(30.0), 90: pytest.approx(40.0),
+                                                 365: pytest.approx(315.0)}
+
+
+def test_completion_forecast_uses_the_velocity():
+    goal = _steady(10.0, 365)
+    completion, text = estimate_completion_date(goal, today=TODAY)
+    remaining_months = (10_000.0 - 3650.0) / allocation_velocities([goal], TODAY)[0]
+    expected = TODAY + timedelta(days=remaining_months * DAYS_PER_MONTH)
+    assert abs((completion - expected).days) <= 2
+    assert text == f"Estimated: {completion:%B %Y}"
+
+    assert estimate_completion_date(_goal(), today=TODAY) == (None, "Allocate funds to estimate completion.")
+    assert estimate_completion_date(goal, velocity=0.001, today=TODAY) == (
+        None, "Not within 100 years at the recent pace.")
+    done = _goal(target_amount=10.0, allocated_amount=10.0)
+    assert estimate_completion_date(done, today=TODAY) == (None, "Goal already achieved!")
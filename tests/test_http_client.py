@@ -0,0 +1,98 @@
+"""
+tests/test_http_client.py
+
+ConnectionPool keep-alive reuse and retries against a local HTTP server.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from finance_tracker.services.http_client import ConnectionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        status = server.statuses.pop(0) if server.statuses else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.statuses = []
+    httpd.connections = set()
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(httpd):
+    return f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+
+def _idle_count(pool):
+    return sum(len(connections) for connections in pool._idle.values())
+
+
+def test_connection_is_reused_and_kept_idle(server):
+    pool = ConnectionPool(backoff=0)
+    for _ in range(3):
+        with pool.request("GET", _url(server)) as response:
+            assert response.read() == b"ok"
+    assert len(server.connections) == 1
+    assert response.timing.reused_connection
+    assert _idle_count(pool) == 1
+    pool.close_all()
+
+
+def test_retry_reuses_the_connection(server):
+    server.statuses = [503, 503]
+    pool = ConnectionPool(backoff=0)
+    with pool.request("GET", _url(server)) as response:
+        assert response.status == 200
+        response.read()
+    assert response.timing.attempts == 3
+    assert response.timing.reused_connection
+    assert len(server.connections) == 1
+    pool.close_all()
+
+
+def test_retry_respects_max_idle_per_host(server):
+    server.statuses = [503]
+    pool = ConnectionPool(max_idle_per_host=0, backoff=0)
+    with pool.request("GET", _url(server)) as response:
+        assert response.status == 200
+        response.read()
+    # The retried connection was not parked beyond the limit, so the retry opened a new one
+    assert response.timing.attempts == 2
+    assert not response.timing.reused_connection
+    assert len(server.connections) == 2
+    assert _idle_count(pool) == 0
+
+
+def test_last_response_is_returned_after_max_retries(server):
+    server.statuses = [503, 503, 503, 503]
+    pool = ConnectionPool(max_retries=2, backoff=0)
+    with pool.request("GET", _url(server)) as response:
+        assert response.status == 503
+        response.read()
+    assert response.timing.attempts == 3
+    assert pool.last_timing() is response.timing
+    pool.close_all()
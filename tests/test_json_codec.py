@@ -0,0 +1,83 @@
+"""
+tests/test_json_codec.py
+
+Data file codecs: round trips, byte order marks, non-finite floats and selection.
+"""
+
+import math
+
+import pytest
+
+from finance_tracker import json_codec
+from finance_tracker.json_codec import CODEC_ENV_VAR, available_codecs, get_codec, read_json_file, write_json_file
+from finance_tracker.state import AppState
+
+DATA = {
+    "expenses": [{"id": "01J", "amount": 12.5, "category": "Café", "description": "Grüße 日本"}],
+    "incomes": [],
+    "budget_settings": {"monthly_income": 2500, "nested": {"ratio": 0.1, "flags": [True, False, None]}},
+    "big": 1e16,
+}
+
+
+@pytest.mark.parametrize("name", available_codecs())
+@pytest.mark.parametrize("pretty", [False, True])
+def test_round_trip(name, pretty):
+    codec = get_codec(name)
+    encoded = codec.dumps(DATA, pretty)
+    assert isinstance(encoded, bytes)
+    assert "Grüße 日本".encode() in encoded  # written as UTF-8, not escaped
+    assert (b"\n    " in encoded) == pretty
+    assert codec.loads(encoded) == DATA
+    for other in available_codecs():
+        assert get_codec(other).loads(encoded) == DATA
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_byte_order_mark_is_ignored(name, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_bytes(b"\xef\xbb\xbf" + get_codec("json").dumps(DATA))
+    assert read_json_file(path, get_codec(name)) == DATA
+
+
+@pytest.mark.parametrize("name", available_codecs())
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_floats_are_rejected(name, value):
+    codec = get_codec(name)
+    for obj in (value, [1, value], {"a": {"b": [0.5, {"c": value}]}}):
+        for pretty in (False, True):
+            with pytest.raises(ValueError):
+                codec.dumps(obj, pretty)
+
+
+def test_codec_selection(monkeypatch):
+    monkeypatch.setenv(CODEC_ENV_VAR, " JSON ")
+    assert get_codec().name == "json"
+    assert get_codec("orjson").name == ("orjson" if "orjson" in available_codecs() else "json")
+    monkeypatch.setattr(json_codec, "orjson", None)
+    monkeypatch.setenv(CODEC_ENV_VAR, "orjson")
+    assert get_codec().name == "json"  # falls back when not installed
+    with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+        get_codec("yaml")
+
+
+def test_write_json_file_follows_the_pretty_setting(monkeypatch, tmp_path):
+    path = tmp_path / "data.json"
+    monkeypatch.setenv(json_codec.PRETTY_ENV_VAR, "yes")
+    write_json_file(path, DATA)
+    assert path.read_bytes().startswith(b'{\n    "expenses"')
+    write_json_file(path, DATA, pretty=False)
+    assert b"\n" not in path.read_bytes()
+    assert read_json_file(path) == DATA
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_state_save_refuses_nan(name, tmp_path):
+    path = tmp_path / "data.json"
+    state = AppState(path, codec=name)
+    state.save()
+    saved = path.read_bytes()
+    state.budget_settings["monthly_income"] = math.nan
+    with pytest.raises(ValueError):
+        state.save()
+    assert path.read_bytes() == saved
@@ -0,0 +1,78 @@
+"""
+tests/test_net_worth_history.py
+
+Daily net-worth reconstruction between snapshots and drift flagging.
+"""
+
+from datetime import date
+
+import pytest
+
+from finance_tracker.services.net_worth_history import reconstruct_net_worth
+
+
+class _State:
+    # Weak-referenceable stand-in for AppState (snapshot series are cached per state)
+    def __init__(self, snapshots, expenses=(), incomes=(), **settings):
+        self.expenses = list(expenses)
+        self.incomes = list(incomes)
+        self.budget_settings = {"asset_snapshots": snapshots, **settings}
+
+
+def _snapshot(day, net_worth):
+    return {"date": day, "net_worth": net_worth}
+
+
+def _row(day, amount):
+    return {"date": day, "amount": amount, "category": "Other"}
+
+
+@pytest.fixture
+def state():
+    return _State(
+        [_snapshot("2024-01-20", 500.0), _snapshot("2024-01-01", 1000.0), _snapshot("2024-01-10", 1050.0)],
+        expenses=[_row("2024-01-01", 999.0), _row("2024-01-05", 100.0), _row("2023-12-31", 5.0)],
+        incomes=[_row("2024-01-08", 150.0), _row("not a date", 1.0)],
+        monthly_income=[{"description": "Salary", "amount": 2000.0, "start_date": "2023-12-15", "end_date": None}],
+        fixed_costs=[{"desc": "Rent", "amount": 300.0, "start_date": "2023-11-22", "end_date": None}],
+    )
+
+
+def test_estimate_follows_flows_from_the_latest_snapshot(state):
+    result = reconstruct_net_worth(state, end_date=date(2024, 1, 25))
+    by_day = dict(zip(result.days, result.estimate))
+
+    assert result.days[0] == date(2024, 1, 1) and result.days[-1] == date(2024, 1, 25)
+    assert len(result.days) == len(result.estimate) == len(result.flows) == 25
+    # The snapshot already includes its own day's flows (the 999 expense)
+    assert by_day[date(2024, 1, 1)] == 1000.0
+    assert by_day[date(2024, 1, 5)] == 900.0
+    assert by_day[date(2024, 1, 8)] == 1050.0
+    assert by_day[date(2024, 1, 15)] == 3050.0  # salary on its start day
+    assert by_day[date(2024, 1, 20)] == 500.0  # re-anchored on the snapshot
+    assert by_day[date(2024, 1, 22)] == 200.0  # rent
+    assert result.flows[result.days.index(date(2024, 1, 22))] == -300.0
+
+
+def test_drift_is_measured_against_the_next_snapshot(state):
+    result = reconstruct_net_worth(state, end_date=date(2024, 1, 25))
+    first, second = result.drifts
+    assert (first["from_date"], first["to_date"]) == ("2024-01-01", "2024-01-10")
+    assert first["expected"] == 1050.0 and first["drift"] == 0.0 and not first["flagged"]
+    assert second["expected"] == 3050.0 and second["drift"] == -2550.0 and second["flagged"]
+    assert result.flagged == [second]
+
+
+def test_small_or_relatively_small_drift_is_not_flagged():
+    small = _State([_snapshot("2024-01-01", 100.0), _snapshot("2024-01-02", 140.0)])
+    assert not reconstruct_net_worth(small, end_date=date(2024, 1, 2)).flagged
+    relative = _State([_snapshot("2024-01-01", 10_000.0), _snapshot("2024-01-02", 10_150.0)])
+    assert not reconstruct_net_worth(relative, end_date=date(2024, 1, 2)).flagged
+    assert reconstruct_net_worth(relative, end_date=date(2024, 1, 2), relative_threshold=0.01).flagged
+
+
+def test_range_reaches_the_last_snapshot_and_needs_one():
+    state = _State([_snapshot("2024-01-01", 10.0), _snapshot("2024-03-01", 20.0)])
+    result = reconstruct_net_worth(state, end_date=date(2024, 2, 1))
+    assert result.days[-1] == date(2024, 3, 1) and result.estimate[-1] == 20.0
+    assert reconstruct_net_worth(_State([]), end_date=date(2024, 2, 1)) is None
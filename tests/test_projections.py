@@ -0,0 +1,149 @@
+"""
+tests/test_projections.py
+
+Monte Carlo balance projection and the day-by-day cash-flow projection on small,
+hand-checkable histories.
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from finance_tracker.services.cash_flow_service import project_cash_flow
+from finance_tracker.services.projection_service import PERCENTILES, simulate_projection
+from finance_tracker.services.recurring_schedule import postings
+
+TODAY = date(2024, 7, 15)  # a Monday
+
+
+def _state(expenses=(), incomes=(), **settings):
+    budget_settings = {"bank_account_balance": 1000.0, "monthly_income": [], "fixed_costs": []}
+    budget_settings.update(settings)
+    return SimpleNamespace(expenses=list(expenses), incomes=list(incomes), budget_settings=budget_settings,
+                           categories={})
+
+
+def _monthly_rows(first_month, last_month, day, amount, category):
+    rows = []
+    year, month = first_month
+    while (year, month) <= last_month:
+        value = amount(month) if callable(amount) else amount
+        rows.append({"date": f"{year}-{month:02d}-{day:02d}", "amount": value, "category": category})
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return rows
+
+
+SALARY = [{"description": "Salary", "amount": 2000.0, "start_date": "2020-01-01", "end_date": None}]
+RENT = [{"desc": "Rent", "amount": 500.0, "start_date": "2020-01-01", "end_date": None}]
+
+
+def test_steady_history_gives_a_deterministic_projection():
+    state = _state(
+        expenses=_monthly_rows((2024, 1), (2024, 6), 10, 300.0, "Food"),
+        incomes=_monthly_rows((2024, 1), (2024, 6), 20, 100.0, "Gift"),
+        monthly_income=SALARY, fixed_costs=RENT,
+    )
+    projection = simulate_projection(state, 4, history_months=12, paths=200, seed=1, today=TODAY)
+
+    assert projection.months == ["2024-08", "2024-09", "2024-10", "2024-11"]
+    # Only complete months from the first transaction on are sampled
+    assert projection.history_months == [f"2024-{m:02d}" for m in range(1, 7)]
+    assert not projection.seasonal
+    np.testing.assert_allclose(projection.scheduled_net, [1500.0] * 4)
+    expected = 1000.0 + 1300.0 * np.arange(1, 5)
+    for band in projection.bands:
+        np.testing.assert_allclose(band, expected)
+
+
+def test_bands_are_ordered_and_reproducible_by_seed():
+    state = _state(expenses=_monthly_rows((2023, 7), (2024, 6), 10, lambda m: 100.0 * m, "Food"))
+    first = simulate_projection(state, 6, paths=2000, seed=7, today=TODAY)
+    again = simulate_projection(state, 6, paths=2000, seed=7, today=TODAY)
+    other = simulate_projection(state, 6, paths=2000, seed=8, today=TODAY)
+
+    p10, p50, p90 = (first.bands[PERCENTILES.index(p)] for p in (10, 50, 90))
+    assert np.all(p10 < p50) and np.all(p50 < p90)
+    np.testing.assert_array_equal(first.bands, again.bands)
+    assert not np.array_equal(first.bands, other.bands)
+
+
+def test_calendar_months_seen_twice_get_a_seasonal_offset():
+    # Two years of history: 300 a month, 900 every December
+    state = _state(expenses=_monthly_rows((2022, 7), (2024, 6), 10,
+                                          lambda m: 900.0 if m == 12 else 300.0, "Food"))
+    projection = simulate_projection(state, 12, history_months=24, paths=100, seed=0, today=TODAY)
+
+    assert projection.seasonal
+    steps = np.diff(np.concatenate([[1000.0], projection.bands[PERCENTILES.index(50)]]))
+    by_month = dict(zip(projection.months, steps))
+    assert by_month["2024-12"] == pytest.approx(-900.0)
+    assert by_month["2024-11"] == pytest.approx(-300.0)
+
+
+def test_goal_probabilities():
+    goals = [
+        {"name": "Easy", "target_amount": 1500.0, "allocated_amount": 0.0, "target_date": "2024-09-30"},
+        {"name": "Impossible", "target_amount": 1e7, "allocated_amount": 0.0, "target_date": None},
+        {"name": "Overdue", "target_amount": 100.0, "allocated_amount": 0.0, "target_date": "2024-01-31"},
+        {"name": "Done", "target_amount": 100.0, "allocated_amount": 100.0},
+    ]
+    state = _state(expenses=_monthly_rows((2024, 1), (2024, 6), 10, 100.0, "Food"),
+                   monthly_income=SALARY, savings_goals=goals, savings_balance=100.0)
+    projection = simulate_projection(state, 6, paths=100, seed=0, today=TODAY)
+
+    results = {g["name"]: g for g in projection.goal_probabilities}
+    assert set(results) == {"Easy", "Impossible", "Overdue"}
+    assert results["Easy"]["probability"] == 1.0 and results["Easy"]["month"] == "2024-09"
+    assert results["Impossible"]["probability"] == 0.0 and results["Impossible"]["month"] is None
+    assert results["Overdue"]["probability"] is None
+
+
+def test_no_history_means_no_projection():
+    assert simulate_projection(_state(), 6, today=TODAY) is None
+
+
+def test_postings_land_on_the_start_day_clamped_to_the_month_and_range():
+    entries = [{"amount": 10.0, "start_date": "2024-01-31", "end_date": "2024-04-15"}]
+    assert list(postings(entries, date(2024, 1, 1), date(2024, 12, 31))) == [
+        (date(2024, 1, 31), 10.0), (date(2024, 2, 29), 10.0), (date(2024, 3, 31), 10.0), (date(2024, 4, 15), 10.0)]
+    assert list(postings(entries, date(2024, 2, 1), date(2024, 2, 28))) == []
+    open_ended = [{"amount": 5, "start_date": None, "end_date": None}]
+    assert list(postings(open_ended, date(2024, 3, 1), date(2024, 3, 31))) == [(date(2024, 3, 1), 5.0)]
+
+
+def _mondays(first, last):
+    day = first + timedelta(days=(-first.weekday()) % 7)
+    while day <= last:
+        yield day
+        day += timedelta(days=7)
+
+
+def test_cash_flow_posts_schedules_and_weekday_rates():
+    expenses = [{"date": day.isoformat(), "amount": 70.0, "category": "Food"}
+                for day in _mondays(date(2024, 1, 1), date(2024, 6, 30))]
+    state = _state(
+        expenses=expenses,
+        monthly_income=[{"description": "Salary", "amount": 2000.0, "start_date": "2024-01-31", "end_date": None}],
+        fixed_costs=[{"desc": "Rent", "amount": 500.0, "start_date": "2023-05-03", "end_date": "2024-08-10"}],
+    )
+    projection = project_cash_flow(state, 1, history_months=6, today=TODAY)
+
+    assert projection.days[0] == np.datetime64("2024-07-16") and projection.days[-1] == np.datetime64("2024-08-31")
+    assert projection.history_months == [f"2024-{m:02d}" for m in range(1, 7)]
+    posted = {str(day): amount for day, amount in zip(projection.days, projection.income) if amount}
+    assert posted == {"2024-07-31": 2000.0, "2024-08-31": 2000.0}
+    assert {str(d) for d, a in zip(projection.days, projection.fixed_costs) if a} == {"2024-08-03"}
+    # Food was only ever spent on Mondays, 70 each
+    spent = {str(day): amount for day, amount in zip(projection.days, projection.spending) if amount}
+    assert spent == {day.isoformat(): pytest.approx(70.0)
+                     for day in _mondays(date(2024, 7, 16), date(2024, 8, 31))}
+    assert projection.category_spending == {"Food": pytest.approx(420.0)}
+
+    labels, totals = projection.monthly()
+    assert labels == ["2024-07", "2024-08"]
+    np.testing.assert_allclose(totals["income"], [2000.0, 2000.0])
+    np.testing.assert_allclose(totals["spending"], [140.0, 280.0])
+    np.testing.assert_allclose(totals["balance"], [2860.0, 4080.0])
+    assert projection.lowest_balance() == (date(2024, 7, 29), pytest.approx(860.0))
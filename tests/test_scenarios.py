@@ -0,0 +1,95 @@
+"""
+tests/test_scenarios.py
+
+What-if scenarios compared against the unchanged plan, through the service and the CLI.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from finance_tracker.cli import main
+from finance_tracker.services.scenario_service import (
+    BASELINE_NAME,
+    CategoryChange,
+    FixedCostChange,
+    Scenario,
+    compare_scenarios,
+)
+from finance_tracker.state import AppState
+
+TODAY = date.today()
+RENT = 800.0
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    expenses, incomes = [], []
+    for back in range(1, 13):
+        month = (TODAY.replace(day=1) - relativedelta(months=back)).strftime("%Y-%m")
+        expenses.append({"id": f"f{back}", "date": f"{month}-05", "amount": 300.0 + back * 10,
+                         "category": "Food", "description": "Groceries"})
+        expenses.append({"id": f"e{back}", "date": f"{month}-12", "amount": 50.0 + back % 3 * 40,
+                         "category": "Entertainment", "description": "Cinema"})
+        incomes.append({"id": f"i{back}", "date": f"{month}-20", "amount": 100.0,
+                        "category": "Side Gig", "description": "Tutoring"})
+    path = tmp_path / "finance.json"
+    path.write_text(json.dumps({
+        "expenses": expenses,
+        "incomes": incomes,
+        "budget_settings": {
+            "bank_account_balance": 1000.0,
+            "fixed_costs": [{"desc": "Rent", "amount": RENT, "start_date": "2020-01-01", "end_date": None}],
+            "monthly_income": [{"description": "Salary", "amount": 2500.0, "start_date": "2020-01-01",
+                                "end_date": None}],
+        },
+    }))
+    return path
+
+
+def test_scenario_differs_from_baseline_only_by_its_overrides(data_file):
+    state = AppState(data_file)
+    scenario = Scenario("No rent", (FixedCostChange("rent", amount=0.0),))
+    comparison = compare_scenarios(state, [scenario], num_months=6, paths=500, max_workers=1)
+
+    baseline, result = comparison.results
+    assert (baseline.name, result.name) == (BASELINE_NAME, "No rent")
+    assert not baseline.error and not result.error
+    assert baseline.months == result.months and len(result.months) == 6
+    # Same seed and draws: dropping the rent shifts every percentile by the rent saved so far
+    for base_band, band in zip(baseline.bands, result.bands):
+        for month_index, (base, value) in enumerate(zip(base_band, band)):
+            assert value - base == pytest.approx(RENT * (month_index + 1))
+    # The snapshot was changed, not the state
+    assert state.budget_settings["fixed_costs"][0]["amount"] == RENT
+
+    table = comparison.table()
+    assert BASELINE_NAME in table and "No rent" in table
+    assert f"{RENT * 6:+,.0f}" in table
+
+
+def test_category_scenario_lowers_spending(data_file):
+    state = AppState(data_file)
+    comparison = compare_scenarios(state, [Scenario("Less food", (CategoryChange("Food", -50),))],
+                                   num_months=3, paths=500, max_workers=1)
+    baseline, result = comparison.results
+    assert all(value > base for base, value in zip(baseline.median, result.median))
+
+
+def test_cli_prints_the_comparison(data_file, capsys):
+    assert main(["--data", str(data_file), "scenarios", "--name", "Cheaper rent", "--fixed-cost", "Rent=-25%",
+                 "--months", "3", "--paths", "500", "--json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    baseline, scenario = data["scenarios"]
+    assert (baseline["name"], scenario["name"]) == (BASELINE_NAME, "Cheaper rent")
+    assert len(data["months"]) == 3
+    assert scenario["p50"][-1] - baseline["p50"][-1] == pytest.approx(RENT * 0.25 * 3)
+
+
+def test_cli_requires_a_change(data_file, capsys):
+    assert main(["--data", str(data_file), "scenarios"]) == 1
+    assert "at least one" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["--data", str(data_file), "scenarios", "--category", "Food=100"])
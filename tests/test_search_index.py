@@ -0,0 +1,121 @@
+"""
+tests/test_search_index.py
+
+Trigram substring, word-prefix and autocomplete queries of TransactionSearchIndex.
+"""
+
+from finance_tracker.services.search_index import TransactionSearchIndex
+
+
+def _record(description, category="Food"):
+    return {"date": "2024-01-01", "amount": 1.0, "category": category, "description": description}
+
+
+def _make_index(records):
+    index = TransactionSearchIndex(lambda: list(records))
+    return index, {index.key(record): record for record in records}
+
+
+def _descriptions(keys, by_key):
+    return sorted(by_key[key]["description"] for key in keys)
+
+
+RECORDS = [
+    _record("Rewe Markt"),
+    _record("REWE to go"),
+    _record("Aldi Süd"),
+    _record("Amazon Marketplace", "Shopping"),
+    _record("Monthly rent", "Utilities"),
+    _record(""),
+]
+
+
+def test_substring_search_uses_trigrams_and_is_case_insensitive():
+    index, by_key = _make_index(RECORDS)
+    assert _descriptions(index.search("description", "REWE"), by_key) == ["REWE to go", "Rewe Markt"]
+    assert _descriptions(index.search("description", "arket"), by_key) == ["Amazon Marketplace"]
+    assert _descriptions(index.search("description", "ark"), by_key) == ["Amazon Marketplace", "Rewe Markt"]
+    assert _descriptions(index.search("description", "süd"), by_key) == ["Aldi Süd"]
+    # Every trigram of "markte" occurs in "marketplace" or "markt", but not the substring
+    assert index.search("description", "markte") == set()
+    assert index.search("description", "zzz") == set()
+
+
+def test_short_and_empty_queries():
+    index, by_key = _make_index(RECORDS)
+    assert _descriptions(index.search("description", "go"), by_key) == ["REWE to go"]
+    assert len(index.search("description", "  ")) == len(RECORDS)
+    assert _descriptions(index.search("category", "util"), by_key) == ["Monthly rent"]
+
+
+def test_prefix_search_matches_word_starts_only():
+    index, by_key = _make_index(RECORDS)
+    assert _descriptions(index.search_prefix("description", "mar"), by_key) == [
+        "Amazon Marketplace", "Rewe Markt"]
+    assert _descriptions(index.search_prefix("description", "re"), by_key) == [
+        "Monthly rent", "REWE to go", "Rewe Markt"]
+    assert index.search_prefix("description", "arket") == set()
+
+
+def test_add_and_remove_after_the_index_is_built():
+    records = list(RECORDS)
+    index, by_key = _make_index(records)
+    assert _descriptions(index.search("description", "rewe"), by_key) == ["REWE to go", "Rewe Markt"]
+
+    added = _record("Rewe Center")
+    records.append(added)
+    by_key[index.key(added)] = added
+    index.add(added)
+    assert _descriptions(index.search("description", "rewe"), by_key) == [
+        "REWE to go", "Rewe Center", "Rewe Markt"]
+    assert _descriptions(index.search_prefix("description", "cen"), by_key) == ["Rewe Center"]
+
+    # An edited record is re-indexed under its new text
+    edited = records[0]
+    edited["description"] = "Lidl"
+    index.add(edited)
+    assert _descriptions(index.search("description", "rewe"), by_key) == ["REWE to go", "Rewe Center"]
+    assert _descriptions(index.search("description", "lidl"), by_key) == ["Lidl"]
+    assert index.search_prefix("description", "markt") == set()
+
+    index.remove(added)
+    assert _descriptions(index.search("description", "rewe"), by_key) == ["REWE to go"]
+    assert index.search_prefix("description", "cen") == set()
+    assert index.suggest("description", "rewe c") == []
+
+
+def test_records_sharing_a_value_stay_indexed_until_the_last_is_removed():
+    first, second = _record("Rent"), _record("Rent")
+    index, _ = _make_index([first, second])
+    index.search("description", "")
+    index.remove(first)
+    assert index.search("description", "rent") == {index.key(second)}
+    index.remove(second)
+    assert index.search("description", "rent") == set()
+    assert index.suggest("description", "") == []
+
+
+def test_changes_before_the_first_query_come_from_the_source():
+    records = [_record("Rewe Markt")]
+    index, _ = _make_index(records)
+    late = _record("Rewe Center")
+    records.append(late)
+    index.add(late)  # ignored: the index is built from the source on first use
+    assert index.search("description", "rewe") == {index.key(r) for r in records}
+    index.invalidate()
+    records.pop()
+    assert index.search("description", "rewe") == {index.key(records[0])}
+
+
+def test_suggest_ranks_prefix_then_word_then_substring_matches():
+    records = [
+        _record("Markt Halle"),
+        _record("Rewe Markt"), _record("Rewe Markt"),
+        _record("Supermarkt"), _record("Supermarkt"), _record("Supermarkt"),
+    ]
+    index, _ = _make_index(records)
+    assert index.suggest("description", "markt") == ["Markt Halle", "Rewe Markt", "Supermarkt"]
+    assert index.suggest("description", "") == ["Supermarkt", "Rewe Markt", "Markt Halle"]
+    assert index.suggest("description", "markt", limit=1) == ["Markt Halle"]
+    assert index.suggest("description", "markt", weights={"Supermarkt": 1, "Rewe Markt": 5}) == [
+        "Rewe Markt", "Supermarkt"]
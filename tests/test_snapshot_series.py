@@ -0,0 +1,96 @@
+"""
+tests/test_snapshot_series.py
+
+Resampling and period-over-period changes of the asset snapshot series.
+"""
+
+import math
+import pytest
+
+from finance_tracker.services.asset_tracking_service import get_periodic_net_worth_changes
+from finance_tracker.services.snapshot_series import SnapshotSeries
+
+
+class _State:
+    def __init__(self, snapshots):
+        self.budget_settings = {"asset_snapshots": snapshots}
+
+
+def _series():
+    # Stored out of order on purpose; the series sorts them in place
+    return SnapshotSeries([
+        {"date": "2026-03-15", "net_worth": 1600.0},
+        {"date": "2026-01-15", "net_worth": 1000.0},
+        {"date": "2026-07-10", "net_worth": 1500.0},
+    ])
+
+
+def test_snapshots_are_sorted_and_upsert_replaces_same_date():
+    series = _series()
+    assert [s["date"] for s in series.snapshots] == ["2026-01-15", "2026-03-15", "2026-07-10"]
+    series.upsert({"date": "2026-03-15", "net_worth": 1700.0})
+    series.upsert({"date": "2026-02-01", "net_worth": 1200.0})
+    assert [s["net_worth"] for s in series.snapshots] == [1000.0, 1200.0, 1700.0, 1500.0]
+    assert series.at_or_before("2026-03-14")["date"] == "2026-02-01"
+
+
+def test_monthly_resample_last_value_holds_the_latest_snapshot():
+    labels, values = _series().resample("monthly", "last")
+    assert labels == ["2026-01", "2026-02", "2026-03", "2026-04", "2026-05", "2026-06", "2026-07"]
+    assert values == [1000.0, 1000.0, 1600.0, 1600.0, 1600.0, 1600.0, 1500.0]
+
+
+def test_monthly_resample_interpolates_between_snapshots():
+    labels, values = _series().resample("monthly", "interpolate")
+    # 2026-01-31 lies 16 of the 59 days from 1000 (Jan 15) to 1600 (Mar 15)
+    assert values[0] == pytest.approx(1000 + 600 * 16 / 59)
+    # 2026-03-31 lies 16 of the 117 days from 1600 (Mar 15) to 1500 (Jul 10)
+    assert values[2] == pytest.approx(1600 - 100 * 16 / 117)
+    # Held flat after the last snapshot
+    assert values[-1] == pytest.approx(1500.0)
+
+
+def test_quarterly_resample_labels_and_values():
+    labels, values = _series().resample("quarterly", "last")
+    assert labels == ["2026-Q1", "2026-Q2", "2026-Q3"]
+    assert values == [1600.0, 1600.0, 1500.0]
+
+
+def test_resample_rejects_unknown_frequency_and_method():
+    with pytest.raises(ValueError):
+        _series().resample("weekly")
+    with pytest.raises(ValueError):
+        _series().resample("monthly", "nearest")
+
+
+def test_resample_of_empty_series():
+    labels, values = SnapshotSeries([]).resample("quarterly", "interpolate")
+    assert labels == [] and len(values) == 0
+
+
+def test_period_change_over_arbitrary_windows():
+    change, change_pct = _series().period_change(
+        ["2026-01-15", "2026-02-01", "2026-01-01"],
+        ["2026-03-15", "2026-12-31", "2026-03-15"],
+    )
+    assert change[0] == 600.0 and change_pct[0] == 60.0
+    assert change[1] == 500.0 and change_pct[1] == 50.0
+    # No snapshot on or before the start date
+    assert math.isnan(change[2]) and math.isnan(change_pct[2])
+
+
+def test_period_change_with_interpolation_and_zero_start():
+    series = SnapshotSeries([{"date": "2026-01-01", "net_worth": 0.0}, {"date": "2026-01-11", "net_worth": 100.0}])
+    change, change_pct = series.period_change(["2026-01-01", "2026-01-06"], ["2026-01-06", "2026-01-11"],
+                                              method="interpolate")
+    assert change == pytest.approx([50.0, 50.0])
+    assert change_pct == [0.0, 100.0]
+
+
+def test_periodic_net_worth_changes_chain_period_ends():
+    state = _State(_series().snapshots)
+    rows = get_periodic_net_worth_changes(state, "quarterly")
+    assert [row["period"] for row in rows] == ["2026-Q1", "2026-Q2", "2026-Q3"]
+    assert [row["end_date"] for row in rows] == ["2026-03-31", "2026-06-30", "2026-09-30"]
+    assert rows[0]["change"] is None
+    assert rows[2]["change"] == -100.0 and rows[2]["change_pct"] == pytest.approx(-6.25)
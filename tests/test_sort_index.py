@@ -0,0 +1,98 @@
+"""
+tests/test_sort_index.py
+
+SortIndex orders kept up to date by add/remove against orders rebuilt from scratch.
+"""
+
+import random
+
+import pytest
+
+from finance_tracker.ui.sort_index import SortIndex
+
+KEY_FUNCS = {
+    "Date": lambda row: row["date"],
+    "Amount": lambda row: float(row["amount"]),
+    "Category": lambda row: row["category"],
+}
+SORTS = [
+    [],
+    [("Date", False)],
+    [("Date", True)],
+    [("Amount", False)],
+    [("Amount", True)],
+    [("Category", True), ("Amount", False)],
+    [("Category", False), ("Date", True), ("Amount", True)],
+]
+
+
+def _row(rng, number):
+    # Few distinct values per column, so most rows tie with others
+    return {
+        "n": number,
+        "date": f"2024-01-{rng.randint(1, 5):02d}",
+        "amount": rng.choice([5, 10, 10.0, 20]),
+        "category": rng.choice(["Food", "Rent", "Other"]),
+    }
+
+
+def _numbers(rows):
+    return [row["n"] for row in rows]
+
+
+def test_order_breaks_ties_by_base_order():
+    rows = [
+        {"n": 0, "date": "2024-01-02", "amount": 5, "category": "Food"},
+        {"n": 1, "date": "2024-01-01", "amount": 5, "category": "Rent"},
+        {"n": 2, "date": "2024-01-02", "amount": 1, "category": "Food"},
+        {"n": 3, "date": "2024-01-01", "amount": 5, "category": "Food"},
+    ]
+    index = SortIndex(KEY_FUNCS)
+    index.reset(rows)
+    assert _numbers(index.order([("Amount", False)])) == [2, 0, 1, 3]
+    assert _numbers(index.order([("Amount", True)])) == [0, 1, 3, 2]
+    assert _numbers(index.order([("Date", True)])) == [0, 2, 1, 3]
+    assert _numbers(index.order([("Category", False), ("Amount", True)])) == [0, 3, 2, 1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_changes_match_a_rebuilt_index(seed):
+    rng = random.Random(seed)
+    rows = [_row(rng, number) for number in range(60)]
+    index = SortIndex(KEY_FUNCS)
+    index.reset(rows)
+    for sort_keys in SORTS:
+        index.order(sort_keys)  # populate the caches that add/remove must maintain
+
+    live = list(rows)
+    for number in range(60, 160):
+        if live and rng.random() < 0.45:
+            row = live.pop(rng.randrange(len(live)))
+            index.remove(row)
+        else:
+            row = _row(rng, number)
+            live.append(row)
+            index.add(row)
+        if number % 10 == 0:
+            rebuilt = SortIndex(KEY_FUNCS)
+            rebuilt.reset(live)
+            for sort_keys in SORTS:
+                assert _numbers(index.order(sort_keys)) == _numbers(rebuilt.order(sort_keys))
+
+    rebuilt = SortIndex(KEY_FUNCS)
+    rebuilt.reset(live)
+    for sort_keys in SORTS:
+        assert _numbers(index.order(sort_keys)) == _numbers(rebuilt.order(sort_keys))
+
+
+def test_remove_uses_the_key_the_row_was_indexed_with():
+    rows = [{"n": n, "date": "2024-01-01", "amount": n, "category": "Food"} for n in range(4)]
+    index = SortIndex(KEY_FUNCS)
+    index.reset(rows)
+    index.order([("Amount", False)])
+    rows[1]["amount"] = 99  # edited in place before the view removes and re-adds it
+    index.remove(rows[1])
+    index.add(rows[1])
+    assert _numbers(index.order([("Amount", False)])) == [0, 2, 3, 1]
+    index.remove({"n": 7})  # unknown rows are ignored
+    assert _numbers(index.order([])) == [0, 2, 3, 1]
@@ -0,0 +1,106 @@
+"""
+tests/test_state_ids.py
+
+Transaction ids: ULID ordering, migration of legacy rows and the id index.
+"""
+
+import json
+
+import pytest
+
+from finance_tracker import ids, state as state_module
+from finance_tracker.ids import new_ulid, ulid_timestamp
+from finance_tracker.state import AppState
+
+
+def _assert_index_consistent(state):
+    for trans_type, rows in (("Expense", state.expenses), ("Income", state.incomes)):
+        for position, record in enumerate(rows):
+            assert state._locate(record["id"]) == (trans_type, position)
+    assert len(state._id_index) == len(state.expenses) + len(state.incomes)
+
+
+def test_new_ulid_is_monotonic_within_one_millisecond(monkeypatch):
+    monkeypatch.setattr(ids.time, "time", lambda: 1_700_000_000.123)
+    # Ids made earlier in the session carry a later timestamp, which monotonicity would keep
+    monkeypatch.setattr(ids, "_last_ms", -1)
+    generated = [new_ulid() for _ in range(1000)]
+    assert generated == sorted(generated)
+    assert len(set(generated)) == len(generated)
+    assert {ulid_timestamp(value) for value in generated} == {1_700_000_000_123}
+
+
+def test_new_ulid_stays_monotonic_when_the_clock_goes_back(monkeypatch):
+    monkeypatch.setattr(ids.time, "time", lambda: 1_700_000_001.0)
+    first = new_ulid()
+    monkeypatch.setattr(ids.time, "time", lambda: 1_699_999_999.0)
+    assert new_ulid() > first
+
+
+def test_legacy_rows_get_unique_ids_dated_at_noon(tmp_path):
+    data_file = tmp_path / "finance.json"
+    data_file.write_text(json.dumps({
+        "expenses": [
+            {"date": "2024-03-05", "amount": 10, "category": "Food", "description": "a"},
+            {"id": "custom-1", "date": "2024-03-06", "amount": 20, "category": "Food", "description": "b"},
+            {"id": "custom-1", "date": "2024-03-07", "amount": 30, "category": "Food", "description": "c"},
+        ],
+        "incomes": [
+            {"date": "not a date", "amount": 5, "category": "Gift", "description": "d"},
+        ],
+    }))
+    state = AppState(data_file)
+
+    expense_ids = [row["id"] for row in state.expenses]
+    assert expense_ids[1] == "custom-1"
+    assert len(set(expense_ids + [state.incomes[0]["id"]])) == 4
+    assert ulid_timestamp(expense_ids[0]) == ulid_timestamp(expense_ids[2]) - 2 * 86_400_000
+    assert ulid_timestamp(state.incomes[0]["id"]) is not None
+    _assert_index_consistent(state)
+
+
+def test_index_follows_deletes_updates_and_type_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_module, "MAX_PENDING_REMOVALS", 4)
+    state = AppState(tmp_path / "finance.json")
+    state.add_transactions(
+        ("Expense", f"2024-01-{day:02d}", float(day), "Food", f"row {day}") for day in range(1, 21)
+    )
+    ids_in_order = [row["id"] for row in state.expenses]
+
+    # Deletes from the front, middle and back, enough to renumber the list twice
+    for trans_id in ids_in_order[0:3] + ids_in_order[8:12] + ids_in_order[-3:]:
+        assert state.delete_transaction_by_id("Expense", trans_id)
+        _assert_index_consistent(state)
+    remaining = ids_in_order[3:8] + ids_in_order[12:17]
+    assert [row["id"] for row in state.expenses] == remaining
+
+    added = state.add_transaction("Expense", "2024-02-01", 1.0, "Food", "new")
+    _assert_index_consistent(state)
+
+    moved = state.expenses[2]
+    state.update_transaction("Expense", moved, "Income", amount=99.0)
+    assert state.get_transaction(moved["id"]) == ("Income", moved)
+    assert state.expenses[-1] is added
+    _assert_index_consistent(state)
+
+    assert state.delete_transaction("Income", moved)
+    assert state.get_transaction(moved["id"]) is None
+    assert not state.delete_transaction_by_id("Expense", moved["id"])
+    _assert_index_consistent(state)
+
+
+def test_index_rebuilds_after_lists_change_behind_its_back(tmp_path):
+    state = AppState(tmp_path / "finance.json")
+    first = state.add_transaction("Expense", "2024-01-01", 1.0, "Food", "a")
+    second = state.add_transaction("Expense", "2024-01-02", 2.0, "Food", "b")
+    state.expenses.remove(first)
+    assert state.get_transaction(second["id"]) == ("Expense", second)
+    assert state.get_transaction(first["id"]) is None
+    _assert_index_consistent(state)
+
+
+@pytest.mark.parametrize("trans_id", [None, "", "missing"])
+def test_unknown_ids_are_not_found(tmp_path, trans_id):
+    state = AppState(tmp_path / "finance.json")
+    state.add_transaction("Income", "2024-01-01", 1.0, "Gift", "a")
+    assert state.get_transaction(trans_id) is None
@@ -0,0 +1,52 @@
+"""
+tests/test_transaction_import.py
+
+Validation of imported transaction amounts.
+"""
+
+import math
+
+import pytest
+
+from finance_tracker.services.transaction_import import (
+    TransactionImportError,
+    import_transactions,
+    validate_transaction,
+)
+from finance_tracker.state import AppState
+
+CATEGORIES = {"Expense": ["Food", "Other"], "Income": ["Salary"]}
+
+
+def _row(amount):
+    return {"date": "2026-05-03", "amount": amount, "category": "Food", "description": "Lunch"}
+
+
+@pytest.mark.parametrize("amount", ["nan", "NaN", "inf", "-inf", "1e309", math.nan, math.inf, 10 ** 400])
+def test_non_finite_amounts_are_rejected(amount):
+    with pytest.raises(ValueError, match="invalid amount"):
+        validate_transaction(_row(amount), CATEGORIES)
+
+
+@pytest.mark.parametrize("amount", [0, -5, "0", True, None, "abc"])
+def test_non_positive_or_missing_amounts_are_rejected(amount):
+    with pytest.raises(ValueError):
+        validate_transaction(_row(amount), CATEGORIES)
+
+
+@pytest.mark.parametrize("amount, expected", [(12.5, 12.5), (3, 3.0), ("12,50", 12.5), ("1.234,56", 1234.56)])
+def test_valid_amounts_are_converted_to_float(amount, expected):
+    assert validate_transaction(_row(amount), CATEGORIES)[2] == expected
+
+
+def test_import_with_nan_amount_adds_nothing(tmp_path):
+    data_file = tmp_path / "finance_data.json"
+    state = AppState(data_file)
+    rows = [(1, _row("12,50")), (2, _row("nan"))]
+
+    with pytest.raises(TransactionImportError) as excinfo:
+        import_transactions(state, rows)
+
+    assert excinfo.value.errors == [(2, "invalid amount 'nan'")]
+    assert state.expenses == []
+    assert not data_file.exists()